@@ -1 +1,6 @@
-# Register your models here.
+from django.contrib import admin
+
+from autosave_api.models import ApiToken
+
+# Registering all models
+admin.site.register(ApiToken)
@@ -0,0 +1,129 @@
+"""Token authentication for scripted clients of the autosave api.
+
+Basic authentication hashes the password of the user on every request, which costs far more
+than the request itself. A token is only hashed with a keyed digest and the users of recently
+used tokens are kept in memory, so most requests only look their user up by id to check it is
+still active.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.utils import timezone
+from rest_framework import authentication, exceptions
+
+from autosave_api.models import ApiToken
+from canvas.message_dict import invalid_api_token_text
+
+
+class TokenCache:
+    """Keeps the user ids of recently used tokens in memory for a limited time.
+
+    Entries expire after ``API_TOKEN_CACHE_SECONDS`` at the latest, which bounds how long a
+    token deleted by another process keeps working in this one.
+    """
+
+    def __init__(self):
+        """Create an empty cache."""
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[int, float]] = OrderedDict()
+
+    def get(self, digest: str) -> int | None:
+        """Get the user id of a token, if it is cached and not expired."""
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return None
+            user_id, expires = entry
+            if expires <= time.monotonic():
+                del self._entries[digest]
+                return None
+            self._entries.move_to_end(digest)
+            return user_id
+
+    def put(self, digest: str, user_id: int, lifetime: float):
+        """Cache the user id of a token for at most the given number of seconds."""
+        lifetime = min(lifetime, settings.API_TOKEN_CACHE_SECONDS)
+        if lifetime <= 0:
+            return
+        with self._lock:
+            self._entries[digest] = (user_id, time.monotonic() + lifetime)
+            self._entries.move_to_end(digest)
+            while len(self._entries) > settings.API_TOKEN_CACHE_SIZE:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, digest: str):
+        """Remove a token from the cache, e.g. after it was deleted."""
+        with self._lock:
+            self._entries.pop(digest, None)
+
+    def clear(self):
+        """Remove all tokens from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+token_cache = TokenCache()
+"""The token cache shared by all requests of this process."""
+
+
+class ApiTokenAuthentication(authentication.BaseAuthentication):
+    """Authenticates requests with an ``Authorization: Token <token>`` header.
+
+    This is the recommended way for scripts and other non-browser clients to use the
+    autosave api. Tokens are issued per user by the token endpoints of the api.
+    """
+
+    keyword = "Token"
+
+    def authenticate(self, request):
+        """Authenticate the request if it carries a token."""
+        header = authentication.get_authorization_header(request).split()
+        if not header or header[0].lower() != self.keyword.lower().encode():
+            return None
+        if len(header) != 2:
+            raise exceptions.AuthenticationFailed(invalid_api_token_text)
+        try:
+            key = header[1].decode()
+        except UnicodeError:
+            raise exceptions.AuthenticationFailed(invalid_api_token_text)
+
+        digest = ApiToken.digest_for(key)
+        user_id = token_cache.get(digest)
+        if user_id is None:
+            return self._load_user(digest), key
+
+        # Every request gets its own instance, and deactivated users are rejected right away
+        user = User.objects.filter(pk=user_id, is_active=True).first()
+        if user is None:
+            token_cache.invalidate(digest)
+            raise exceptions.AuthenticationFailed(invalid_api_token_text)
+        return user, key
+
+    def authenticate_header(self, request):
+        """Ask unauthenticated clients for a token."""
+        return self.keyword
+
+    @staticmethod
+    def _load_user(digest: str) -> User:
+        """Look the token up in the database and cache its user."""
+        token = (
+            ApiToken.objects.select_related("user")
+            .filter(digest=digest, user__is_active=True)
+            .first()
+        )
+        now = timezone.now()
+        if token is None or (token.expires_at is not None and token.expires_at <= now):
+            raise exceptions.AuthenticationFailed(invalid_api_token_text)
+
+        ApiToken.objects.filter(pk=token.pk).update(last_used=now)
+        lifetime = (
+            (token.expires_at - now).total_seconds()
+            if token.expires_at is not None
+            else settings.API_TOKEN_CACHE_SECONDS
+        )
+        token_cache.put(digest, token.user_id, lifetime)
+        return token.user
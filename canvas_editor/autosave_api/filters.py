@@ -0,0 +1,40 @@
+"""Contains the filters of the autosave api."""
+
+import math
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+from canvas.message_dict import invalid_bounding_box_text
+
+
+class BoundingBoxFilter(BaseFilterBackend):
+    """Filters objects by position with ``?bbox=<min_x>,<min_y>,<max_x>,<max_y>``.
+
+    The bounds are inclusive. The models filtered this way index their positions together
+    with the project, see ``Heliostat.Meta``.
+    """
+
+    bounding_box_query_param = "bbox"
+
+    def filter_queryset(self, request, queryset, view):
+        """Keep only the objects inside the requested bounding box."""
+        bounding_box = request.query_params.get(self.bounding_box_query_param)
+        if bounding_box is None:
+            return queryset
+        try:
+            min_x, min_y, max_x, max_y = (
+                float(bound) for bound in bounding_box.split(",")
+            )
+        except ValueError:
+            raise ValidationError(invalid_bounding_box_text)
+        bounds = (min_x, min_y, max_x, max_y)
+        if (
+            not all(math.isfinite(bound) for bound in bounds)
+            or min_x > max_x
+            or min_y > max_y
+        ):
+            raise ValidationError(invalid_bounding_box_text)
+        return queryset.filter(
+            position_x__range=(min_x, max_x), position_y__range=(min_y, max_y)
+        )
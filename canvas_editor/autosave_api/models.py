@@ -1 +1,79 @@
-# Create your models here.
+import hashlib
+import hmac
+import secrets
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import models
+
+
+class ApiToken(models.Model):
+    """Represents a token a user authenticates scripted clients of the autosave api with.
+
+    Only a keyed digest of the token is stored. Unlike a password hash, it is fast to
+    compute, which is fine because the token is random and long instead of chosen by a user.
+    """
+
+    # Number of leading characters of the token stored in plain text to recognize it
+    PREFIX_LENGTH = 8
+
+    user = models.ForeignKey(User, related_name="api_tokens", on_delete=models.CASCADE)
+    name = models.CharField(max_length=100, blank=True, default="")
+    prefix = models.CharField(max_length=PREFIX_LENGTH)
+    digest = models.CharField(max_length=64, unique=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # Updated when the token is looked up in the database, not on every request
+    last_used = models.DateTimeField(null=True, blank=True)
+    expires_at = models.DateTimeField(null=True, blank=True)
+
+    @staticmethod
+    def digest_for(key: str) -> str:
+        """Compute the digest a token is stored with.
+
+        Parameters
+        ----------
+        key : str
+            The token as sent by the client.
+
+        Returns
+        -------
+        str
+            The hex digest of the token keyed with the secret key of the site.
+        """
+        return hmac.new(
+            settings.SECRET_KEY.encode(), key.encode(), hashlib.sha256
+        ).hexdigest()
+
+    @classmethod
+    def issue(
+        cls, user: User, name: str = "", expires_at=None
+    ) -> tuple["ApiToken", str]:
+        """Create a new token for a user.
+
+        Parameters
+        ----------
+        user : User
+            The user the token authenticates as.
+        name : str
+            Describes what the token is used for.
+        expires_at : datetime | None
+            The time the token stops working, None for a token that does not expire.
+
+        Returns
+        -------
+        tuple[ApiToken, str]
+            The stored token and the token itself, which cannot be recovered later.
+        """
+        key = secrets.token_urlsafe(32)
+        token = cls.objects.create(
+            user=user,
+            name=name,
+            prefix=key[: cls.PREFIX_LENGTH],
+            digest=cls.digest_for(key),
+            expires_at=expires_at,
+        )
+        return token, key
+
+    def __str__(self) -> str:
+        """Get the prefix and name of the token."""
+        return f"{self.prefix}… {self.name}".strip()
@@ -0,0 +1,92 @@
+"""Contains the pagination of the autosave api.
+
+Lists are only paginated if the client asks for pages, so existing clients keep receiving
+the whole list.
+"""
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from canvas.message_dict import invalid_cursor_text, invalid_page_size_text
+
+
+def _non_negative_int(value: str, message: str) -> int:
+    """Parse a query parameter as non-negative integer."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise ValidationError(message)
+    if number < 0:
+        raise ValidationError(message)
+    return number
+
+
+class KeysetPagination(BasePagination):
+    """Paginates a list by id, requested with ``?page_size=<n>&cursor=<cursor>``.
+
+    A page continues after the last object of the previous page instead of skipping an
+    offset, so every page is a single range scan of the primary key, however deep into the
+    list it is. Objects created while paging through the list show up on the last page.
+
+    The page is a lazy queryset, so the view can serialize it however it likes. A full page
+    links to the next one, which may therefore be empty.
+    """
+
+    page_size_query_param = "page_size"
+    cursor_query_param = "cursor"
+    max_page_size = 10_000
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Get the requested page of the queryset or None if no page was requested."""
+        page_size = request.query_params.get(self.page_size_query_param)
+        if page_size is None:
+            return None
+        self.page_size = min(
+            _non_negative_int(page_size, invalid_page_size_text), self.max_page_size
+        )
+        if self.page_size == 0:
+            raise ValidationError(invalid_page_size_text)
+        cursor = _non_negative_int(
+            request.query_params.get(self.cursor_query_param, "0"), invalid_cursor_text
+        )
+        self.request = request
+        return queryset.filter(pk__gt=cursor).order_by("pk")[: self.page_size]
+
+    def get_next_link(self, last_id: int | None, count: int) -> str | None:
+        """Get the link to the page after the current one.
+
+        Parameters
+        ----------
+        last_id : int | None
+            The id of the last object of the current page.
+        count : int
+            The number of objects on the current page.
+
+        Returns
+        -------
+        str | None
+            The link or None if the current page is the last one.
+        """
+        if last_id is None or count < self.page_size:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, last_id
+        )
+
+    def get_paginated_response(self, data):
+        """Wrap the serialized page with the link to the next page."""
+        next_link = self.get_next_link(data[-1]["id"] if data else None, len(data))
+        return Response({"next": next_link, "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        """Describe the paginated response for the api schema."""
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
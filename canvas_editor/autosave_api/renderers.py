@@ -0,0 +1,94 @@
+"""Contains the renderers of the autosave api besides the default JSON renderers.
+
+The heliostat columns renderer writes the ids, positions and names of heliostats in a
+compact binary format, so large fields can be loaded into typed arrays without parsing JSON.
+All numbers are little-endian and every column starts at a multiple of its item size::
+
+    header        4s magic, uint32 version, uint32 count, uint32 byte length of the names
+    ids           count x int64
+    positions     count x 3 x float32, the x, y and z coordinates of each heliostat
+    name offsets  (count + 1) x uint32, the i-th name is names[offsets[i]:offsets[i + 1]]
+    names         the UTF-8 encoded names
+"""
+
+import struct
+import sys
+from array import array
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+HELIOSTAT_COLUMNS_MAGIC = b"CNVH"
+HELIOSTAT_COLUMNS_VERSION = 1
+HELIOSTAT_COLUMNS_HEADER = struct.Struct("<4sIII")
+
+
+def _little_endian(column: array) -> bytes:
+    """Get the bytes of a column in little-endian byte order."""
+    if sys.byteorder == "big":
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+class HeliostatColumnsRenderer(BaseRenderer):
+    """Renderer for the heliostat columns built by ``heliostat_columns``.
+
+    Other data, like the body of an error response, is rendered as JSON.
+    """
+
+    media_type = "application/vnd.canvas.heliostat-columns"
+    format = "columnar"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Pack the heliostat columns into the binary format."""
+        if not isinstance(data, dict) or "positions" not in data:
+            response = (renderer_context or {}).get("response")
+            if response is not None:
+                response["Content-Type"] = JSONRenderer.media_type
+            return JSONRenderer().render(data, renderer_context=renderer_context)
+
+        names = [name.encode() for name in data["names"]]
+        name_offsets = array("I", [0])
+        for name in names:
+            name_offsets.append(name_offsets[-1] + len(name))
+        return b"".join(
+            [
+                HELIOSTAT_COLUMNS_HEADER.pack(
+                    HELIOSTAT_COLUMNS_MAGIC,
+                    HELIOSTAT_COLUMNS_VERSION,
+                    len(data["ids"]),
+                    name_offsets[-1],
+                ),
+                _little_endian(data["ids"]),
+                _little_endian(data["positions"]),
+                _little_endian(name_offsets),
+                *names,
+            ]
+        )
+
+
+def heliostat_columns(queryset) -> dict:
+    """Read the ids, positions and names of heliostats into columns.
+
+    Parameters
+    ----------
+    queryset : QuerySet
+        The heliostats to read.
+
+    Returns
+    -------
+    dict
+        The ``ids`` as int64 array, the ``positions`` as float32 array with three
+        coordinates per heliostat and the ``names`` as list.
+    """
+    ids = array("q")
+    positions = array("f")
+    names = []
+    rows = queryset.values_list("id", "name", "position_x", "position_y", "position_z")
+    for heliostat_id, name, *position in rows:
+        ids.append(heliostat_id)
+        positions.extend(position)
+        names.append(name)
+    return {"ids": ids, "positions": positions, "names": names}
@@ -6,8 +6,13 @@ of the model, in most cases those would be foreign fields.
 The meta class defines the model used by serializer and also the fields that should be serialized.
 """
 
+from collections.abc import Callable
+from functools import cache
+
+from django.db.models import QuerySet
 from rest_framework import serializers
 
+from autosave_api.models import ApiToken
 from project_management.models import (
     Heliostat,
     LightSource,
@@ -24,7 +29,7 @@ class HeliostatSerializer(serializers.ModelSerializer):
         """Meta class for HeliostatSerializer."""
 
         model = Heliostat
-        exclude = ["project"]
+        exclude = ["project", "revision"]
 
 
 class ReceiverSerializer(serializers.ModelSerializer):
@@ -34,7 +39,7 @@ class ReceiverSerializer(serializers.ModelSerializer):
         """Meta class for ReceiverSerializer."""
 
         model = Receiver
-        exclude = ["project"]
+        exclude = ["project", "revision"]
 
 
 class LightSourceSerializer(serializers.ModelSerializer):
@@ -44,7 +49,7 @@ class LightSourceSerializer(serializers.ModelSerializer):
         """Meta class for LightSourceSerializer."""
 
         model = LightSource
-        exclude = ["project"]
+        exclude = ["project", "revision"]
 
 
 class SettingsSerializer(serializers.ModelSerializer):
@@ -54,7 +59,7 @@ class SettingsSerializer(serializers.ModelSerializer):
         """Meta class for SettingsSerializer."""
 
         model = Settings
-        exclude = ["project", "id"]
+        exclude = ["project", "id", "revision"]
 
 
 class ProjectSerializer(serializers.ModelSerializer):
@@ -84,8 +89,93 @@ class ProjectDetailSerializer(serializers.ModelSerializer):
         model = Project
         fields = [
             "name",
+            "revision",
             "heliostats",
             "receivers",
             "light_sources",
             "settings",
         ]
+        # The revision is only advanced by the server, see project_management.models.Project
+        read_only_fields = ["revision"]
+
+
+class ApiTokenSerializer(serializers.ModelSerializer):
+    """Serializer to convert an api token into JSON, the token itself is never part of it."""
+
+    class Meta:
+        """Meta class for ApiTokenSerializer."""
+
+        model = ApiToken
+        fields = ["id", "name", "prefix", "created_at", "last_used", "expires_at"]
+        read_only_fields = ["prefix", "created_at", "last_used"]
+
+
+NATIVE_FIELDS = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.FloatField,
+    serializers.IntegerField,
+)
+"""Serializer fields whose representation is the value the database returns for the model field."""
+
+
+@cache
+def _value_fields(
+    serializer_class: type[serializers.ModelSerializer],
+) -> tuple[list[str], list[str], dict[int, Callable]]:
+    """Get the names, model sources and conversions of the fields of a serializer.
+
+    Parameters
+    ----------
+    serializer_class : type[serializers.ModelSerializer]
+        A serializer whose fields are all plain model fields.
+
+    Returns
+    -------
+    tuple[list[str], list[str], dict[int, Callable]]
+        The names of the fields in the response, the model fields they are read from and
+        the representations of the fields that are not returned as is by the database,
+        by their position.
+    """
+    names, sources, representations = [], [], {}
+    for position, (name, field) in enumerate(serializer_class().fields.items()):
+        names.append(name)
+        sources.append(field.source)
+        if type(field) not in NATIVE_FIELDS:
+            representations[position] = field.to_representation
+    return names, sources, representations
+
+
+def serialize_values(
+    queryset: QuerySet, serializer_class: type[serializers.ModelSerializer]
+) -> list[dict]:
+    """Serialize a queryset like ``serializer_class(queryset, many=True).data``, but faster.
+
+    The rows are fetched with ``values_list`` and assembled into dictionaries directly,
+    instead of building a model instance and running every serializer field per row.
+
+    Parameters
+    ----------
+    queryset : QuerySet
+        The objects to serialize.
+    serializer_class : type[serializers.ModelSerializer]
+        The serializer defining the fields and their order, all of them plain model fields.
+
+    Returns
+    -------
+    list[dict]
+        The same data the serializer produces.
+    """
+    names, sources, representations = _value_fields(serializer_class)
+    rows = queryset.values_list(*sources)
+    if not representations:
+        return [dict(zip(names, row)) for row in rows]
+
+    data = []
+    for row in rows:
+        row = list(row)
+        for position, representation in representations.items():
+            if row[position] is not None:
+                row[position] = representation(row[position])
+        data.append(dict(zip(names, row)))
+    return data
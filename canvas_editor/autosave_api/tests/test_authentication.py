@@ -0,0 +1,155 @@
+import time
+from datetime import timedelta
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from autosave_api.authentication import token_cache
+from autosave_api.models import ApiToken
+from canvas.test_constants import SECURE_PASSWORD, TEST_PROJECT_NAME, TEST_USERNAME
+from canvas.view_name_dict import (
+    autosave_api_token_detail_view,
+    autosave_api_token_list_view,
+    autosave_project_list_view,
+)
+from project_management.models import Project
+
+
+class ApiTokenAuthenticationTest(TestCase):
+    """Tests for the api token authentication and the token endpoints."""
+
+    def setUp(self):
+        """Create a user with a project and an empty token cache."""
+        self.user = User.objects.create_user(
+            username=TEST_USERNAME, password=SECURE_PASSWORD
+        )
+        Project.objects.create(name=TEST_PROJECT_NAME, owner=self.user)
+        token_cache.clear()
+        self.addCleanup(token_cache.clear)
+        self.client = APIClient()
+
+    def _get_projects(self, key: str):
+        """List the projects authenticated with a token."""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {key}")
+        return self.client.get(reverse(autosave_project_list_view))
+
+    def test_token_authenticates_user(self):
+        """Test that a token grants access to the projects of its user."""
+        _, key = ApiToken.issue(self.user)
+
+        response = self._get_projects(key)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]["name"], TEST_PROJECT_NAME)
+
+    def test_only_digest_is_stored(self):
+        """Test that the token itself is not stored."""
+        token, key = ApiToken.issue(self.user)
+
+        self.assertNotEqual(token.digest, key)
+        self.assertEqual(token.digest, ApiToken.digest_for(key))
+        self.assertEqual(token.prefix, key[: ApiToken.PREFIX_LENGTH])
+
+    def test_cached_token_skips_database(self):
+        """Test that a recently used token authenticates without querying the token."""
+        _, key = ApiToken.issue(self.user)
+        self._get_projects(key)
+
+        # Only the user and the projects are queried
+        with self.assertNumQueries(2):
+            response = self._get_projects(key)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_invalid_token_is_rejected(self):
+        """Test that an unknown token is rejected."""
+        response = self._get_projects("unknown")
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_expired_token_is_rejected(self):
+        """Test that an expired token is rejected."""
+        _, key = ApiToken.issue(
+            self.user, expires_at=timezone.now() - timedelta(seconds=1)
+        )
+
+        response = self._get_projects(key)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_cache_expires(self):
+        """Test that a token deleted by another process stops working once its cache entry expired."""
+        token, key = ApiToken.issue(self.user)
+        self._get_projects(key)
+        # Deleting the token directly leaves the cache of this process untouched
+        token.delete()
+        self.assertEqual(self._get_projects(key).status_code, status.HTTP_200_OK)
+
+        now = time.monotonic()
+        with mock.patch(
+            "autosave_api.authentication.time.monotonic",
+            return_value=now + settings.API_TOKEN_CACHE_SECONDS,
+        ):
+            response = self._get_projects(key)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_deactivated_user_is_rejected(self):
+        """Test that the cached token of a deactivated user stops working right away."""
+        _, key = ApiToken.issue(self.user)
+        self._get_projects(key)
+
+        self.user.is_active = False
+        self.user.save()
+
+        self.assertEqual(self._get_projects(key).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_token_cannot_manage_tokens(self):
+        """Test that a token can neither issue, list nor revoke tokens."""
+        token, key = ApiToken.issue(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {key}")
+
+        for response in (
+            self.client.post(
+                reverse(autosave_api_token_list_view), {"name": "copy"}, format="json"
+            ),
+            self.client.get(reverse(autosave_api_token_list_view)),
+            self.client.delete(
+                reverse(autosave_api_token_detail_view, kwargs={"pk": token.pk})
+            ),
+        ):
+            self.assertIn(
+                response.status_code,
+                (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN),
+            )
+        self.assertEqual(ApiToken.objects.get().pk, token.pk)
+
+    def test_issue_and_revoke_token(self):
+        """Test that tokens are issued and revoked through the api."""
+        self.client.login(username=TEST_USERNAME, password=SECURE_PASSWORD)
+        response = self.client.post(
+            reverse(autosave_api_token_list_view), {"name": "script"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        key = response.data["key"]
+
+        listed = self.client.get(reverse(autosave_api_token_list_view))
+        self.assertEqual(listed.data[0]["name"], "script")
+        self.assertNotIn("key", listed.data[0])
+        self.client.logout()
+        self.assertEqual(self._get_projects(key).status_code, status.HTTP_200_OK)
+
+        self.client.credentials()
+        self.client.login(username=TEST_USERNAME, password=SECURE_PASSWORD)
+        response = self.client.delete(
+            reverse(autosave_api_token_detail_view, kwargs={"pk": response.data["id"]})
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.client.logout()
+        self.assertEqual(self._get_projects(key).status_code, status.HTTP_403_FORBIDDEN)
@@ -1,14 +1,25 @@
+import struct
+
 from django.contrib.auth.models import User
 from django.test import TestCase
 from django.urls import reverse
 from parameterized import parameterized
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APIClient
 
+from autosave_api.renderers import (
+    HELIOSTAT_COLUMNS_HEADER,
+    HELIOSTAT_COLUMNS_MAGIC,
+    HELIOSTAT_COLUMNS_VERSION,
+    HeliostatColumnsRenderer,
+)
 from autosave_api.serializers import (
     HeliostatSerializer,
     LightSourceSerializer,
+    ProjectDetailSerializer,
     ReceiverSerializer,
+    serialize_values,
 )
 from canvas.test_constants import (
     HELIOSTAT_LIST_NAME,
@@ -31,10 +42,15 @@ from canvas.test_constants import (
     TEST_USERNAME,
 )
 from canvas.view_name_dict import (
+    autosave_heliostat_bulk_view,
     autosave_heliostat_detail_view,
+    autosave_light_source_bulk_view,
     autosave_light_source_detail_view,
+    autosave_project_changes_view,
     autosave_project_detail_view,
     autosave_project_list_view,
+    autosave_project_operations_view,
+    autosave_receiver_bulk_view,
     autosave_receiver_detail_view,
     autosave_settings_detail_view,
 )
@@ -44,6 +60,7 @@ from project_management.models import (
     Project,
     Receiver,
     Settings,
+    Tombstone,
 )
 
 
@@ -82,6 +99,64 @@ class APITestCase(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["name"], self.project.name)
 
+    @parameterized.expand([(10,), (10_000,)])
+    def test_get_project_detail_query_count(self, number_of_heliostats):
+        """Test that loading a project needs the same number of queries regardless of its size."""
+        Heliostat.objects.bulk_create(
+            [Heliostat(project=self.project) for _ in range(number_of_heliostats)]
+        )
+        Receiver.objects.create(project=self.project)
+        LightSource.objects.create(project=self.project)
+        url = reverse(autosave_project_detail_view, kwargs={"pk": self.project.id})
+
+        # Session, user, project with settings, heliostats, receivers, light sources and
+        # the revision for the entity tag.
+        with self.assertNumQueries(7):
+            response = self.client.get(url, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["heliostats"]), number_of_heliostats)
+
+    def test_get_project_detail_matches_serializer(self):
+        """Test that the fast project detail response is identical to the serializer's."""
+        Heliostat.objects.create(
+            name="Heliostat \u2028 ä", project=self.project, position_x=1e-05
+        )
+        Heliostat.objects.create(project=self.project, position_y=TEST_FLOAT_NUMBER)
+        Receiver.objects.create(project=self.project, resolution_e=TEST_NUMBER)
+        LightSource.objects.create(project=self.project, covariance=TEST_FLOAT_NUMBER)
+        url = reverse(autosave_project_detail_view, kwargs={"pk": self.project.id})
+
+        response = self.client.get(url, format="json")
+
+        self.assertEqual(
+            response.content,
+            JSONRenderer().render(ProjectDetailSerializer(self.project).data),
+        )
+
+    @parameterized.expand(
+        [
+            (Heliostat, HeliostatSerializer, HELIOSTAT_LIST_NAME),
+            (Receiver, ReceiverSerializer, RECEIVER_LIST_NAME),
+            (LightSource, LightSourceSerializer, LIGHT_SOURCE_LIST_NAME),
+        ]
+    )
+    def test_serialize_values_matches_serializer(
+        self, model_class, serializer_class, url_list_name
+    ):
+        """Test that the fast serialization and the list views match the serializers."""
+        model_class.objects.create(project=self.project, name=NEW_PROJECT_NAME)
+        model_class.objects.create(project=self.project)
+        queryset = model_class.objects.filter(project=self.project)
+        expected = JSONRenderer().render(serializer_class(queryset, many=True).data)
+
+        self.assertEqual(
+            JSONRenderer().render(serialize_values(queryset, serializer_class)),
+            expected,
+        )
+        url = reverse(url_list_name, kwargs={"project_id": self.project.id})
+        self.assertEqual(self.client.get(url, format="json").content, expected)
+
     def test_get_heliostat_detail(self):
         """Test retrieving the details of a specific heliostat."""
         heliostat = Heliostat.objects.create(name=HELIOSTAT_NAME, project=self.project)
@@ -203,3 +278,703 @@ class APITestCase(TestCase):
     def test_get_objects(self, model_class, model_name, url_list_name):
         """Parameterized test for retrieving lists of heliostats, receivers, or light sources."""
         self.get_objects(model_class, model_name, url_list_name)
+
+
+class BulkAPITestCase(TestCase):
+    """Contains test cases for the bulk end points of the autosave api."""
+
+    def setUp(self):
+        """Set up a test user, log in, and create a test project for use in all tests."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username=TEST_USERNAME, password=SECURE_PASSWORD
+        )
+        self.client.login(username=TEST_USERNAME, password=SECURE_PASSWORD)
+        self.project = Project.objects.create(name=TEST_PROJECT_NAME, owner=self.user)
+
+    def bulk_url(self, url_bulk_name, project_id=None):
+        """Get the bulk end point of the test project."""
+        return reverse(
+            url_bulk_name, kwargs={"project_id": project_id or self.project.id}
+        )
+
+    @parameterized.expand(
+        [
+            (autosave_heliostat_bulk_view, Heliostat),
+            (autosave_receiver_bulk_view, Receiver),
+            (autosave_light_source_bulk_view, LightSource),
+        ]
+    )
+    def test_bulk_changes(self, url_bulk_name, model_class):
+        """Test that creates, updates and deletes are applied in one request."""
+        updated = model_class.objects.create(
+            name=TEST_PROJECT_NAME, project=self.project
+        )
+        deleted = model_class.objects.create(
+            name=TEST_PROJECT_NAME, project=self.project
+        )
+        names = [f"{NEW_PROJECT_NAME} {index}" for index in range(5)]
+        data = {
+            "create": [{"name": name} for name in names],
+            "update": [{"id": updated.id, "name": NEW_PROJECT_NAME}],
+            "delete": [deleted.id],
+        }
+
+        response = self.client.post(self.bulk_url(url_bulk_name), data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        created_names = [
+            model_class.objects.get(id=created_id).name
+            for created_id in response.data["created"]
+        ]
+        self.assertEqual(created_names, names)
+        self.assertEqual(response.data["updated"], [updated.id])
+        self.assertEqual(response.data["deleted"], [deleted.id])
+        updated.refresh_from_db()
+        self.assertEqual(updated.name, NEW_PROJECT_NAME)
+        self.assertFalse(model_class.objects.filter(id=deleted.id).exists())
+
+    def test_bulk_query_count_is_independent_of_size(self):
+        """Test that the number of queries does not grow with the number of objects."""
+        heliostats = Heliostat.objects.bulk_create(
+            [Heliostat(project=self.project) for _ in range(50)]
+        )
+        data = {
+            "create": [{"name": HELIOSTAT_NAME}] * 50,
+            "update": [
+                {"id": heliostat.id, "position_x": POSITION_COORDINATE}
+                for heliostat in heliostats[:25]
+            ],
+            "delete": [heliostat.id for heliostat in heliostats[25:]],
+        }
+
+        # Session, user, project, savepoint, revision, insert, select and update,
+        # select, delete and tombstones.
+        with self.assertNumQueries(13):
+            response = self.client.post(
+                self.bulk_url(autosave_heliostat_bulk_view), data, format="json"
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["created"]), 50)
+        self.assertEqual(Heliostat.objects.count(), 75)
+
+    def test_bulk_invalid_object_changes_nothing(self):
+        """Test that an invalid object rejects the whole request."""
+        heliostat = Heliostat.objects.create(project=self.project)
+        data = {
+            "create": [{"name": HELIOSTAT_NAME}],
+            "update": [{"id": heliostat.id, "position_x": "far"}],
+        }
+
+        response = self.client.post(
+            self.bulk_url(autosave_heliostat_bulk_view), data, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Heliostat.objects.count(), 1)
+
+    def test_bulk_unknown_object_changes_nothing(self):
+        """Test that deleting an object of another project rejects the whole request."""
+        other_project = Project.objects.create(name=NEW_PROJECT_NAME, owner=self.user)
+        other_heliostat = Heliostat.objects.create(project=other_project)
+        data = {
+            "create": [{"name": HELIOSTAT_NAME}],
+            "delete": [other_heliostat.id],
+        }
+
+        response = self.client.post(
+            self.bulk_url(autosave_heliostat_bulk_view), data, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(Heliostat.objects.count(), 1)
+
+    def test_bulk_project_of_other_user(self):
+        """Test that the bulk end points only change projects of the user."""
+        other_user = User.objects.create_user(
+            username=NEW_PROJECT_NAME, password=SECURE_PASSWORD
+        )
+        other_project = Project.objects.create(name=NEW_PROJECT_NAME, owner=other_user)
+
+        response = self.client.post(
+            self.bulk_url(autosave_heliostat_bulk_view, other_project.id),
+            {"create": [{"name": HELIOSTAT_NAME}]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(Heliostat.objects.exists())
+
+
+class OperationsAPITestCase(TestCase):
+    """Contains test cases for the operations end point of the autosave api."""
+
+    def setUp(self):
+        """Set up a test user, log in, and create a test project for use in all tests."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username=TEST_USERNAME, password=SECURE_PASSWORD
+        )
+        self.client.login(username=TEST_USERNAME, password=SECURE_PASSWORD)
+        self.project = Project.objects.create(name=TEST_PROJECT_NAME, owner=self.user)
+        self.url = reverse(
+            autosave_project_operations_view, kwargs={"project_id": self.project.id}
+        )
+
+    def test_apply_operations(self):
+        """Test that mixed operations are applied in order and return their results."""
+        receiver = Receiver.objects.create(name=RECEIVER_NAME, project=self.project)
+        light_source = LightSource.objects.create(
+            name=LIGHT_SOURCE_NAME, project=self.project
+        )
+        operations = [
+            {"op": "create", "type": "heliostat", "data": {"name": HELIOSTAT_NAME}},
+            {
+                "op": "update",
+                "type": "receiver",
+                "id": receiver.id,
+                "data": {"name": NEW_RECEIVER_NAME},
+            },
+            {"op": "delete", "type": "light_source", "id": light_source.id},
+            {"op": "update", "type": "settings", "data": {"fog": False}},
+        ]
+
+        response = self.client.post(self.url, operations, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        heliostat = Heliostat.objects.get(project=self.project)
+        self.assertEqual(response.data[0], HeliostatSerializer(heliostat).data)
+        receiver.refresh_from_db()
+        self.assertEqual(response.data[1]["name"], NEW_RECEIVER_NAME)
+        self.assertEqual(receiver.name, NEW_RECEIVER_NAME)
+        self.assertEqual(response.data[2], {"id": light_source.id})
+        self.assertFalse(LightSource.objects.exists())
+        self.assertFalse(response.data[3]["fog"])
+        self.assertFalse(Settings.objects.get(project=self.project).fog)
+
+    def test_later_operations_see_earlier_ones(self):
+        """Test that the operations are applied in the order they are sent."""
+        heliostat = Heliostat.objects.create(project=self.project)
+        operations = [
+            {
+                "op": "update",
+                "type": "heliostat",
+                "id": heliostat.id,
+                "data": {"name": NEW_HELIOSTAT_NAME},
+            },
+            {"op": "delete", "type": "heliostat", "id": heliostat.id},
+        ]
+
+        response = self.client.post(self.url, operations, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(Heliostat.objects.exists())
+
+    def test_failing_operation_changes_nothing(self):
+        """Test that a failing operation rolls back the operations before it."""
+        heliostat = Heliostat.objects.create(project=self.project)
+        operations = [
+            {"op": "create", "type": "receiver", "data": {"name": RECEIVER_NAME}},
+            {"op": "delete", "type": "heliostat", "id": heliostat.id},
+            {"op": "delete", "type": "heliostat", "id": heliostat.id},
+        ]
+
+        response = self.client.post(self.url, operations, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data[0]["index"], 2)
+        self.assertFalse(Receiver.objects.exists())
+        self.assertTrue(Heliostat.objects.filter(id=heliostat.id).exists())
+
+    @parameterized.expand(
+        [
+            ({"op": "delete", "type": "settings"},),
+            ({"op": "update", "type": "heliostat", "data": {}},),
+            ({"op": "move", "type": "heliostat", "id": 1},),
+            ({"op": "create", "type": "heliostat", "data": {"position_x": "far"}},),
+        ]
+    )
+    def test_invalid_operation(self, operation):
+        """Test that invalid operations are rejected with their index."""
+        operations = [
+            {"op": "create", "type": "heliostat", "data": {"name": HELIOSTAT_NAME}},
+            operation,
+        ]
+
+        response = self.client.post(self.url, operations, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0]["index"], 1)
+        self.assertFalse(Heliostat.objects.exists())
+
+
+class HeliostatColumnsTestCase(TestCase):
+    """Contains test cases for listing heliostats in the columnar format."""
+
+    def setUp(self):
+        """Set up a test user, log in, and create a test project with heliostats."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username=TEST_USERNAME, password=SECURE_PASSWORD
+        )
+        self.client.login(username=TEST_USERNAME, password=SECURE_PASSWORD)
+        self.project = Project.objects.create(name=TEST_PROJECT_NAME, owner=self.user)
+        self.heliostats = [
+            Heliostat.objects.create(
+                project=self.project,
+                name=name,
+                position_x=index,
+                position_y=POSITION_COORDINATE,
+                position_z=-index / 2,
+            )
+            for index, name in enumerate([HELIOSTAT_NAME, "Héliostat", ""])
+        ]
+        self.url = reverse(HELIOSTAT_LIST_NAME, kwargs={"project_id": self.project.id})
+
+    def decode(self, content):
+        """Decode the columnar format."""
+        magic, version, count, names_length = HELIOSTAT_COLUMNS_HEADER.unpack_from(
+            content
+        )
+        self.assertEqual(magic, HELIOSTAT_COLUMNS_MAGIC)
+        self.assertEqual(version, HELIOSTAT_COLUMNS_VERSION)
+        offset = HELIOSTAT_COLUMNS_HEADER.size
+        ids = struct.unpack_from(f"<{count}q", content, offset)
+        offset += count * 8
+        positions = struct.unpack_from(f"<{count * 3}f", content, offset)
+        offset += count * 12
+        name_offsets = struct.unpack_from(f"<{count + 1}I", content, offset)
+        offset += (count + 1) * 4
+        names = content[offset:]
+        self.assertEqual(len(names), names_length)
+        return (
+            list(ids),
+            [positions[i : i + 3] for i in range(0, len(positions), 3)],
+            [
+                names[start:end].decode()
+                for start, end in zip(name_offsets, name_offsets[1:])
+            ],
+        )
+
+    def assert_columns(self, response):
+        """Assert that the response contains the columns of the test heliostats."""
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], HeliostatColumnsRenderer.media_type)
+        ids, positions, names = self.decode(response.content)
+        self.assertEqual(ids, [heliostat.id for heliostat in self.heliostats])
+        self.assertEqual(
+            positions,
+            [
+                (heliostat.position_x, heliostat.position_y, heliostat.position_z)
+                for heliostat in self.heliostats
+            ],
+        )
+        self.assertEqual(names, [heliostat.name for heliostat in self.heliostats])
+
+    def test_columns_by_format_parameter(self):
+        """Test that the format query parameter selects the columnar format."""
+        self.assert_columns(self.client.get(self.url, {"format": "columnar"}))
+
+    def test_columns_by_accept_header(self):
+        """Test that the accept header selects the columnar format."""
+        self.assert_columns(
+            self.client.get(
+                self.url,
+                headers={"Accept": HeliostatColumnsRenderer.media_type},
+            )
+        )
+
+    def test_json_stays_default(self):
+        """Test that the heliostats are still listed as JSON by default."""
+        response = self.client.get(self.url, format="json")
+
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(len(response.data), len(self.heliostats))
+
+    def test_columns_error_is_json(self):
+        """Test that an error is still readable when the columnar format was requested."""
+        self.client.logout()
+
+        response = self.client.get(self.url, {"format": "columnar"})
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertIn("detail", response.json())
+
+
+class HeliostatPaginationTestCase(TestCase):
+    """Contains test cases for listing heliostats page by page and by region."""
+
+    def setUp(self):
+        """Set up a test user, log in, and create a test project with a row of heliostats."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username=TEST_USERNAME, password=SECURE_PASSWORD
+        )
+        self.client.login(username=TEST_USERNAME, password=SECURE_PASSWORD)
+        self.project = Project.objects.create(name=TEST_PROJECT_NAME, owner=self.user)
+        self.heliostats = [
+            Heliostat.objects.create(
+                project=self.project, position_x=index * 10, position_y=index
+            )
+            for index in range(5)
+        ]
+        self.url = reverse(HELIOSTAT_LIST_NAME, kwargs={"project_id": self.project.id})
+
+    def test_pages_cover_list(self):
+        """Test that following the next links lists every heliostat once and in order."""
+        ids = []
+        url, params = self.url, {"page_size": 2}
+        while url is not None:
+            response = self.client.get(url, params, format="json")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data["results"]), 2)
+            ids.extend(heliostat["id"] for heliostat in response.data["results"])
+            url, params = response.data["next"], None
+
+        self.assertEqual(ids, [heliostat.id for heliostat in self.heliostats])
+
+    def test_page_is_serialized_like_list(self):
+        """Test that a page contains the same heliostats as the whole list."""
+        response = self.client.get(self.url, {"page_size": 10}, format="json")
+
+        self.assertIsNone(response.data["next"])
+        self.assertEqual(
+            response.data["results"],
+            HeliostatSerializer(self.heliostats, many=True).data,
+        )
+
+    def test_list_without_page_size_is_not_paginated(self):
+        """Test that clients not asking for pages still receive the whole list."""
+        response = self.client.get(self.url, format="json")
+
+        self.assertEqual(len(response.data), len(self.heliostats))
+
+    def test_bounding_box(self):
+        """Test that only the heliostats inside the bounding box are listed."""
+        response = self.client.get(
+            self.url, {"bbox": "10,0,30,2.5", "page_size": 1}, format="json"
+        )
+        ids = [heliostat["id"] for heliostat in response.data["results"]]
+        response = self.client.get(response.data["next"], format="json")
+        ids.extend(heliostat["id"] for heliostat in response.data["results"])
+
+        self.assertEqual(ids, [heliostat.id for heliostat in self.heliostats[1:3]])
+
+    @parameterized.expand(
+        [
+            ({"page_size": "0"},),
+            ({"page_size": "many"},),
+            ({"page_size": "2", "cursor": "-1"},),
+            ({"bbox": "0,0,10"},),
+            ({"bbox": "10,0,0,10"},),
+            ({"bbox": "0,0,nan,10"},),
+        ]
+    )
+    def test_invalid_parameters(self, params):
+        """Test that invalid page sizes, cursors and bounding boxes are rejected."""
+        response = self.client.get(self.url, params, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_columnar_page_links_next_page(self):
+        """Test that a page in the columnar format links to the next page in a header."""
+        response = self.client.get(self.url, {"format": "columnar", "page_size": 3})
+
+        self.assertEqual(response["Content-Type"], HeliostatColumnsRenderer.media_type)
+        _, _, count, _ = HELIOSTAT_COLUMNS_HEADER.unpack_from(response.content)
+        self.assertEqual(count, 3)
+        self.assertIn(f"cursor={self.heliostats[2].id}", response["Link"])
+        self.assertIn('rel="next"', response["Link"])
+
+
+class ChangesAPITestCase(TestCase):
+    """Contains test cases for the revisions of projects and the changes end point."""
+
+    def setUp(self):
+        """Set up a test user, log in, and create a test project for use in all tests."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username=TEST_USERNAME, password=SECURE_PASSWORD
+        )
+        self.client.login(username=TEST_USERNAME, password=SECURE_PASSWORD)
+        self.project = Project.objects.create(name=TEST_PROJECT_NAME, owner=self.user)
+        self.changes_url = reverse(
+            autosave_project_changes_view, kwargs={"project_id": self.project.id}
+        )
+
+    def get_changes(self, since):
+        """Get the changes of the test project since the revision."""
+        response = self.client.get(self.changes_url, {"since": since}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_changes_since_revision(self):
+        """Test that autosave writes increase the revision and are listed as changes."""
+        url = reverse(HELIOSTAT_LIST_NAME, kwargs={"project_id": self.project.id})
+        first = self.client.post(url, {"name": HELIOSTAT_NAME}, format="json").data
+        second = self.client.post(url, {"name": HELIOSTAT_NAME}, format="json").data
+        self.client.put(
+            reverse(
+                autosave_heliostat_detail_view,
+                kwargs={"project_id": self.project.id, "pk": first["id"]},
+            ),
+            {"name": NEW_HELIOSTAT_NAME},
+            format="json",
+        )
+        self.client.delete(
+            reverse(
+                autosave_heliostat_detail_view,
+                kwargs={"project_id": self.project.id, "pk": second["id"]},
+            )
+        )
+
+        changes = self.get_changes(since=0)
+        self.assertEqual(changes["revision"], 4)
+        self.assertEqual(
+            changes["heliostats"],
+            [{**first, "name": NEW_HELIOSTAT_NAME}],
+        )
+        self.assertEqual(changes["deleted"][Tombstone.HELIOSTATS], [second["id"]])
+        self.assertIsNone(changes["settings"])
+
+        changes = self.get_changes(since=3)
+        self.assertEqual(changes["heliostats"], [])
+        self.assertEqual(changes["deleted"][Tombstone.HELIOSTATS], [second["id"]])
+
+        self.client.put(
+            reverse(
+                autosave_settings_detail_view, kwargs={"project_id": self.project.id}
+            ),
+            {"fog": False},
+            format="json",
+        )
+        changes = self.get_changes(since=4)
+        self.assertEqual(changes["revision"], 5)
+        self.assertFalse(changes["settings"]["fog"])
+        self.assertEqual(changes["deleted"][Tombstone.HELIOSTATS], [])
+
+    def test_batched_writes_share_a_revision(self):
+        """Test that the bulk and operations end points save their changes with one revision."""
+        receiver = Receiver.objects.create(project=self.project)
+        self.client.post(
+            reverse(
+                autosave_receiver_bulk_view, kwargs={"project_id": self.project.id}
+            ),
+            {"create": [{"name": RECEIVER_NAME}], "delete": [receiver.id]},
+            format="json",
+        )
+        self.client.post(
+            reverse(
+                autosave_project_operations_view,
+                kwargs={"project_id": self.project.id},
+            ),
+            [
+                {"op": "create", "type": "light_source", "data": {}},
+                {"op": "update", "type": "settings", "data": {"shadows": False}},
+            ],
+            format="json",
+        )
+
+        changes = self.get_changes(since=1)
+        self.assertEqual(changes["revision"], 2)
+        self.assertEqual(changes["receivers"], [])
+        self.assertEqual(len(changes["light_sources"]), 1)
+        self.assertFalse(changes["settings"]["shadows"])
+
+        changes = self.get_changes(since=0)
+        self.assertEqual(len(changes["receivers"]), 1)
+        self.assertEqual(changes["deleted"][Tombstone.RECEIVERS], [receiver.id])
+
+    def test_project_detail_contains_revision(self):
+        """Test that a full load of the project tells the client its revision."""
+        self.project.next_revision()
+        url = reverse(autosave_project_detail_view, kwargs={"pk": self.project.id})
+
+        response = self.client.get(url, format="json")
+
+        self.assertEqual(response.data["revision"], 1)
+
+    def test_tombstones_are_pruned(self):
+        """Test that old tombstones are pruned and syncing from before them needs a full load."""
+        url = reverse(HELIOSTAT_LIST_NAME, kwargs={"project_id": self.project.id})
+        heliostats = [
+            self.client.post(url, {"name": HELIOSTAT_NAME}, format="json").data
+            for _ in range(3)
+        ]
+        with self.settings(TOMBSTONE_RETENTION_REVISIONS=2):
+            for heliostat in heliostats:
+                self.client.delete(
+                    reverse(
+                        autosave_heliostat_detail_view,
+                        kwargs={"project_id": self.project.id, "pk": heliostat["id"]},
+                    )
+                )
+
+        self.assertEqual(
+            list(
+                self.project.tombstones.order_by("revision").values_list(
+                    "revision", flat=True
+                )
+            ),
+            [5, 6],
+        )
+        changes = self.get_changes(since=4)
+        self.assertEqual(
+            changes["deleted"][Tombstone.HELIOSTATS],
+            [heliostat["id"] for heliostat in heliostats[1:]],
+        )
+
+        response = self.client.get(self.changes_url, {"since": 3}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+        self.assertEqual(response.data["revision"], 6)
+
+    def test_revision_is_read_only(self):
+        """Test that a client cannot set the revision of a project."""
+        url = reverse(autosave_project_detail_view, kwargs={"pk": self.project.id})
+
+        response = self.client.patch(url, {"revision": 99}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["revision"], 0)
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.revision, 0)
+
+    @parameterized.expand([("",), ("-1",), ("1",), ("latest",)])
+    def test_invalid_revision(self, since):
+        """Test that unknown revisions are rejected."""
+        response = self.client.get(self.changes_url, {"since": since}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ConditionalRequestTestCase(TestCase):
+    """Contains test cases for the entity tags and conditional requests of the autosave api."""
+
+    def setUp(self):
+        """Set up a test user, log in, and create a test project for use in all tests."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username=TEST_USERNAME, password=SECURE_PASSWORD
+        )
+        self.client.login(username=TEST_USERNAME, password=SECURE_PASSWORD)
+        self.project = Project.objects.create(name=TEST_PROJECT_NAME, owner=self.user)
+        self.heliostat = Heliostat.objects.create(project=self.project)
+        self.detail_url = reverse(
+            autosave_project_detail_view, kwargs={"pk": self.project.id}
+        )
+        self.list_url = reverse(
+            HELIOSTAT_LIST_NAME, kwargs={"project_id": self.project.id}
+        )
+        self.heliostat_url = reverse(
+            autosave_heliostat_detail_view,
+            kwargs={"project_id": self.project.id, "pk": self.heliostat.id},
+        )
+        self.settings_url = reverse(
+            autosave_settings_detail_view, kwargs={"project_id": self.project.id}
+        )
+
+    def test_not_modified_without_serialization(self):
+        """Test that a matching If-None-Match is answered with 304 from the revision alone."""
+        etag = self.client.get(self.detail_url, format="json")["ETag"]
+
+        # Session, user and the revision of the project.
+        with self.assertNumQueries(3):
+            response = self.client.get(
+                self.detail_url, format="json", headers={"If-None-Match": etag}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+    @parameterized.expand(
+        [
+            ("detail_url",),
+            ("list_url",),
+            ("heliostat_url",),
+            ("settings_url",),
+        ]
+    )
+    def test_etag_changes_with_revision(self, url_name):
+        """Test that the entity tag changes with autosave writes."""
+        url = getattr(self, url_name)
+        etag = self.client.get(url, format="json")["ETag"]
+        self.client.put(self.heliostat_url, {"name": HELIOSTAT_NAME}, format="json")
+        self.client.put(self.settings_url, {"fog": False}, format="json")
+
+        response = self.client.get(url, format="json", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_etag_changes_with_project_name(self):
+        """Test that renaming the project changes the entity tag of its details."""
+        etag = self.client.get(self.detail_url, format="json")["ETag"]
+        self.project.name = NEW_PROJECT_NAME
+        self.project.save()
+
+        response = self.client.get(self.detail_url, format="json")
+
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_etag_depends_on_format(self):
+        """Test that the formats of the same url have different entity tags."""
+        json_etag = self.client.get(self.list_url, format="json")["ETag"]
+
+        response = self.client.get(
+            self.list_url,
+            {"format": "columnar"},
+            headers={"If-None-Match": json_etag},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], json_etag)
+
+    def test_write_with_outdated_etag_fails(self):
+        """Test that writes with an outdated If-Match header are rejected."""
+        etag = self.client.get(self.heliostat_url, format="json")["ETag"]
+        self.client.put(self.heliostat_url, {"name": HELIOSTAT_NAME}, format="json")
+
+        update = self.client.put(
+            self.heliostat_url,
+            {"name": NEW_HELIOSTAT_NAME},
+            format="json",
+            headers={"If-Match": etag},
+        )
+        delete = self.client.delete(self.heliostat_url, headers={"If-Match": etag})
+
+        self.assertEqual(update.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertEqual(delete.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.heliostat.refresh_from_db()
+        self.assertEqual(self.heliostat.name, HELIOSTAT_NAME)
+
+    def test_write_with_current_etag(self):
+        """Test that writes with the current If-Match header succeed and return the new tag."""
+        etag = self.client.get(self.settings_url, format="json")["ETag"]
+
+        response = self.client.put(
+            self.settings_url,
+            {"fog": False},
+            format="json",
+            headers={"If-Match": etag},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(
+            self.client.get(self.settings_url, format="json")["ETag"],
+            response["ETag"],
+        )
+
+    def test_outdated_project_does_not_reset_revision(self):
+        """Test that saving an outdated project instance keeps the current revision."""
+        outdated_project = Project.objects.get(pk=self.project.pk)
+        self.project.next_revision()
+
+        outdated_project.save()
+
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.revision, 1)
@@ -0,0 +1,269 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.db import DatabaseError
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from autosave_api.write_behind import write_behind
+from canvas.test_constants import (
+    HELIOSTAT_NAME,
+    SECURE_PASSWORD,
+    TEST_PROJECT_NAME,
+    TEST_USERNAME,
+)
+from canvas.view_name_dict import (
+    autosave_heliostat_detail_view,
+    autosave_heliostat_list_view,
+    autosave_light_source_detail_view,
+    autosave_receiver_detail_view,
+    autosave_write_behind_metrics_view,
+)
+from project_management.models import Heliostat, LightSource, Project, Receiver
+
+PREFER_ASYNC = {"Prefer": "respond-async"}
+
+
+class WriteBehindTestCase(TestCase):
+    """Contains test cases for coalescing autosave updates in the write-behind buffer."""
+
+    def setUp(self):
+        """Set up a test user, log in, and create a project with a heliostat."""
+        # The timer never fires during a test, the updates are written by the requests
+        settings_override = self.settings(AUTOSAVE_COALESCE_SECONDS=60)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.addCleanup(write_behind.flush)
+
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username=TEST_USERNAME, password=SECURE_PASSWORD
+        )
+        self.client.login(username=TEST_USERNAME, password=SECURE_PASSWORD)
+        self.project = Project.objects.create(name=TEST_PROJECT_NAME, owner=self.user)
+        self.heliostat = Heliostat.objects.create(
+            project=self.project, name=HELIOSTAT_NAME
+        )
+        self.url = reverse(
+            autosave_heliostat_detail_view,
+            kwargs={"project_id": self.project.id, "pk": self.heliostat.id},
+        )
+
+    def _drag(self, positions, headers=PREFER_ASYNC):
+        """Send an update of the x position for every position."""
+        return [
+            self.client.patch(
+                self.url, {"position_x": position}, format="json", headers=headers
+            )
+            for position in positions
+        ]
+
+    def test_updates_are_coalesced(self):
+        """Test that successive updates are acknowledged and written once."""
+        metrics = write_behind.metrics()
+
+        responses = self._drag([1, 2, 3])
+
+        for response in responses:
+            self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+            self.assertEqual(response["Preference-Applied"], "respond-async")
+            self.assertFalse(response.has_header("ETag"))
+        self.assertEqual(responses[-1].data["position_x"], 3)
+        self.heliostat.refresh_from_db()
+        self.assertEqual(self.heliostat.position_x, 0)
+
+        write_behind.flush(self.project.id)
+
+        self.heliostat.refresh_from_db()
+        self.project.refresh_from_db()
+        self.assertEqual(self.heliostat.position_x, 3)
+        self.assertEqual(self.heliostat.revision, self.project.revision)
+        self.assertEqual(self.project.revision, 1)
+        new_metrics = write_behind.metrics()
+        self.assertEqual(new_metrics["queued"] - metrics["queued"], 3)
+        self.assertEqual(new_metrics["coalesced"] - metrics["coalesced"], 2)
+        self.assertEqual(new_metrics["written"] - metrics["written"], 1)
+        self.assertEqual(new_metrics["pending"], 0)
+
+    def test_dragged_positions_are_coalesced(self):
+        """Test that the editor's updates of dragged objects are queued."""
+        receiver = Receiver.objects.create(project=self.project)
+        # The bodies of updateHeliostat and updateReceiver in saveAndLoadHandler.mjs,
+        # sent with the preference when an object is dropped after dragging it
+        updates = [
+            (
+                autosave_heliostat_detail_view,
+                self.heliostat,
+                {
+                    "id": self.heliostat.id,
+                    "name": HELIOSTAT_NAME,
+                    "position_x": 12,
+                    "position_y": 0,
+                    "position_z": 3,
+                },
+            ),
+            (
+                autosave_receiver_detail_view,
+                receiver,
+                {
+                    "id": receiver.id,
+                    "name": "Receiver",
+                    "receiver_type": "planar",
+                    "position_x": 1,
+                    "position_y": 50,
+                    "position_z": 2,
+                    "normal_x": 0,
+                    "normal_y": 1,
+                    "normal_z": 0,
+                    "curvature_e": 0,
+                    "curvature_u": 0,
+                    "plane_e": 9,
+                    "plane_u": 7,
+                    "resolution_e": 256,
+                    "resolution_u": 256,
+                },
+            ),
+        ]
+
+        for view_name, obj, body in updates:
+            url = reverse(
+                view_name, kwargs={"project_id": self.project.id, "pk": obj.id}
+            )
+            response = self.client.patch(url, body, format="json", headers=PREFER_ASYNC)
+            self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(write_behind.metrics()["pending"], 2)
+
+        write_behind.flush(self.project.id)
+
+        self.heliostat.refresh_from_db()
+        receiver.refresh_from_db()
+        self.assertEqual(self.heliostat.position_x, 12)
+        self.assertEqual(receiver.plane_e, 9)
+
+    def test_editor_field_updates_are_written(self):
+        """Test that the editor's other updates, e.g. from the inspector, are written right away."""
+        light_source = LightSource.objects.create(project=self.project)
+        url = reverse(
+            autosave_light_source_detail_view,
+            kwargs={"project_id": self.project.id, "pk": light_source.id},
+        )
+        # The body of updateLightsource in saveAndLoadHandler.mjs
+        body = {
+            "id": light_source.id,
+            "name": "Light source",
+            "number_of_rays": 200,
+            "lightsource_type": "sun",
+            "distribution_type": "normal",
+            "mean": 0,
+            "covariance": 4.3681e-06,
+        }
+
+        response = self.client.put(url, body, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(write_behind.metrics()["pending"], 0)
+        light_source.refresh_from_db()
+        self.assertEqual(light_source.number_of_rays, 200)
+
+    def test_reads_see_queued_updates(self):
+        """Test that reading the project writes its queued updates first."""
+        self._drag([4, 5])
+
+        response = self.client.get(self.url, format="json")
+
+        self.assertEqual(response.data["position_x"], 5)
+        self.assertEqual(response["ETag"], '"1-json"')
+        response = self.client.get(
+            reverse(
+                autosave_heliostat_list_view, kwargs={"project_id": self.project.id}
+            ),
+            format="json",
+        )
+        self.assertEqual(response.data[0]["position_x"], 5)
+
+    def test_later_write_is_not_overwritten(self):
+        """Test that a queued update is written before a later synchronous update."""
+        self._drag([6])
+
+        response = self.client.patch(self.url, {"position_x": 7}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        write_behind.flush()
+        self.heliostat.refresh_from_db()
+        self.assertEqual(self.heliostat.position_x, 7)
+
+    def test_conditional_update_is_not_coalesced(self):
+        """Test that an update with If-Match is checked and written right away."""
+        self._drag([8])
+
+        response = self.client.patch(
+            self.url,
+            {"position_x": 9},
+            format="json",
+            headers={**PREFER_ASYNC, "If-Match": '"0-json"'},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.heliostat.refresh_from_db()
+        self.assertEqual(self.heliostat.position_x, 8)
+
+    def test_updates_without_preference_are_written(self):
+        """Test that clients not asking for it keep writing every update."""
+        (response,) = self._drag([10], headers={})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.heliostat.refresh_from_db()
+        self.assertEqual(self.heliostat.position_x, 10)
+
+    def test_disabled_coalescing(self):
+        """Test that updates are written right away if coalescing is disabled."""
+        with self.settings(AUTOSAVE_COALESCE_SECONDS=0):
+            (response,) = self._drag([11])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.heliostat.refresh_from_db()
+        self.assertEqual(self.heliostat.position_x, 11)
+
+    def test_invalid_update_is_rejected(self):
+        """Test that a queued update is validated like a written one."""
+        (response,) = self._drag(["east"])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(write_behind.metrics()["pending"], 0)
+
+    def test_failing_update_is_dropped(self):
+        """Test that an update is dropped once writing it failed too often."""
+        dropped = write_behind.metrics()["dropped"]
+        self._drag([12])
+
+        with (
+            self.settings(AUTOSAVE_WRITE_ATTEMPTS=2),
+            mock.patch.object(
+                Project, "next_revision", side_effect=DatabaseError("locked")
+            ),
+            self.assertLogs("autosave_api.write_behind", level="ERROR"),
+        ):
+            write_behind.flush(self.project.id)
+            self.assertEqual(write_behind.metrics()["pending"], 1)
+            write_behind.flush(self.project.id)
+
+        metrics = write_behind.metrics()
+        self.assertEqual(metrics["pending"], 0)
+        self.assertEqual(metrics["dropped"], dropped + 1)
+
+    def test_metrics_are_for_staff(self):
+        """Test that only staff users can read the metrics."""
+        url = reverse(autosave_write_behind_metrics_view)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+
+        self.user.is_staff = True
+        self.user.save()
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            set(response.data),
+            {"queued", "coalesced", "written", "failed", "dropped", "pending"},
+        )
@@ -1,24 +1,40 @@
 from django.urls import path
 
+from autosave_api.views.api_token_detail import ApiTokenDetail
+from autosave_api.views.api_token_list import ApiTokenList
+from autosave_api.views.heliostat_bulk import HeliostatBulk
 from autosave_api.views.heliostat_detail import HeliostatDetail
 from autosave_api.views.heliostat_list import HeliostatList
+from autosave_api.views.light_source_bulk import LightSourceBulk
 from autosave_api.views.light_source_detail import LightSourceDetail
 from autosave_api.views.light_source_list import LightSourceList
+from autosave_api.views.project_changes import ProjectChanges
 from autosave_api.views.project_detail_list import ProjectDetailList
 from autosave_api.views.project_list import ProjectList
+from autosave_api.views.project_operations import ProjectOperations
+from autosave_api.views.receiver_bulk import ReceiverBulk
 from autosave_api.views.receiver_detail import ReceiverDetail
 from autosave_api.views.receiver_list import ReceiverList
 from autosave_api.views.settings_detail import SettingsDetail
+from autosave_api.views.write_behind_metrics import WriteBehindMetrics
 from canvas.view_name_dict import (
+    autosave_api_token_detail_view,
+    autosave_api_token_list_view,
+    autosave_heliostat_bulk_view,
     autosave_heliostat_detail_view,
     autosave_heliostat_list_view,
+    autosave_light_source_bulk_view,
     autosave_light_source_detail_view,
     autosave_light_source_list_view,
+    autosave_project_changes_view,
     autosave_project_detail_list_view,
     autosave_project_list_view,
+    autosave_project_operations_view,
+    autosave_receiver_bulk_view,
     autosave_receiver_detail_view,
     autosave_receiver_list_view,
     autosave_settings_detail_view,
+    autosave_write_behind_metrics_view,
 )
 
 urlpatterns = [
@@ -38,6 +54,11 @@ urlpatterns = [
         HeliostatDetail.as_view(),
         name=autosave_heliostat_detail_view,
     ),
+    path(
+        "projects/<int:project_id>/heliostats/bulk/",
+        HeliostatBulk.as_view(),
+        name=autosave_heliostat_bulk_view,
+    ),
     path(
         "projects/<int:project_id>/receivers/",
         ReceiverList.as_view(),
@@ -48,6 +69,11 @@ urlpatterns = [
         ReceiverDetail.as_view(),
         name=autosave_receiver_detail_view,
     ),
+    path(
+        "projects/<int:project_id>/receivers/bulk/",
+        ReceiverBulk.as_view(),
+        name=autosave_receiver_bulk_view,
+    ),
     path(
         "projects/<int:project_id>/light_sources/",
         LightSourceList.as_view(),
@@ -58,9 +84,35 @@ urlpatterns = [
         LightSourceDetail.as_view(),
         name=autosave_light_source_detail_view,
     ),
+    path(
+        "projects/<int:project_id>/light_sources/bulk/",
+        LightSourceBulk.as_view(),
+        name=autosave_light_source_bulk_view,
+    ),
+    path(
+        "projects/<int:project_id>/changes/",
+        ProjectChanges.as_view(),
+        name=autosave_project_changes_view,
+    ),
+    path(
+        "projects/<int:project_id>/ops/",
+        ProjectOperations.as_view(),
+        name=autosave_project_operations_view,
+    ),
     path(
         "projects/<int:project_id>/settings/",
         SettingsDetail.as_view(),
         name=autosave_settings_detail_view,
     ),
+    path("tokens/", ApiTokenList.as_view(), name=autosave_api_token_list_view),
+    path(
+        "tokens/<int:pk>/",
+        ApiTokenDetail.as_view(),
+        name=autosave_api_token_detail_view,
+    ),
+    path(
+        "write_behind/",
+        WriteBehindMetrics.as_view(),
+        name=autosave_write_behind_metrics_view,
+    ),
 ]
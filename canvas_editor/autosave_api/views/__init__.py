@@ -6,4 +6,10 @@ for that the detail view should be used.
 A detail view is used to view the model in detail, update or delete it.
 
 So for every object where multiple instances can exist, a list view and a detail view are needed
+
+A bulk view is used to create, update and delete many objects of one type in a single request and transaction.
+
+The operations view applies an ordered list of changes to objects of any type and the settings in a single transaction.
+
+Every change is saved with a new revision of the project, so the changes view can return only the changes since a revision.
 """
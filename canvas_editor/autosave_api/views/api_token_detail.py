@@ -0,0 +1,27 @@
+from rest_framework import generics
+from rest_framework.authentication import BasicAuthentication, SessionAuthentication
+from rest_framework.permissions import IsAuthenticated
+
+from autosave_api.authentication import token_cache
+from autosave_api.models import ApiToken
+from autosave_api.serializers import ApiTokenSerializer
+
+
+class ApiTokenDetail(generics.RetrieveDestroyAPIView):
+    """Creates a view of a specific api token to retrieve or revoke it."""
+
+    serializer_class = ApiTokenSerializer
+
+    # Tokens are managed with the password only, so a leaked token cannot issue new ones
+    # or keep itself from being revoked
+    authentication_classes = [SessionAuthentication, BasicAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def perform_destroy(self, instance):
+        """Delete the token and stop accepting it in this process right away."""
+        token_cache.invalidate(instance.digest)
+        instance.delete()
+
+    def get_queryset(self):
+        """Get the api tokens of the user making the request."""
+        return ApiToken.objects.filter(user=self.request.user)
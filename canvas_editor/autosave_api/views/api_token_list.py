@@ -0,0 +1,32 @@
+from rest_framework import generics, status
+from rest_framework.authentication import BasicAuthentication, SessionAuthentication
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from autosave_api.models import ApiToken
+from autosave_api.serializers import ApiTokenSerializer
+
+
+class ApiTokenList(generics.ListCreateAPIView):
+    """Creates a view to list the api tokens of the user and issue new ones."""
+
+    serializer_class = ApiTokenSerializer
+
+    # Tokens are managed with the password only, so a leaked token cannot issue new ones
+    # or keep itself from being revoked
+    authentication_classes = [SessionAuthentication, BasicAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def create(self, request, *args, **kwargs):
+        """Issue a new token, which is only part of this response and cannot be shown again."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        token, key = ApiToken.issue(request.user, **serializer.validated_data)
+        return Response(
+            {**self.get_serializer(token).data, "key": key},
+            status=status.HTTP_201_CREATED,
+        )
+
+    def get_queryset(self):
+        """Get the api tokens of the user making the request."""
+        return ApiToken.objects.filter(user=self.request.user)
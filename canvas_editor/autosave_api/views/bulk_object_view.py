@@ -0,0 +1,124 @@
+from django.db import transaction
+from rest_framework import generics, serializers, status
+from rest_framework.authentication import BasicAuthentication, SessionAuthentication
+from rest_framework.exceptions import NotFound
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from autosave_api.authentication import ApiTokenAuthentication
+from autosave_api.views.write_behind_mixin import WriteBehindMixin
+from project_management.models import Project, Tombstone
+
+
+class BulkObjectRequestSerializer(serializers.Serializer):
+    """Serializer to validate the structure of a bulk request.
+
+    The fields of the created and updated objects are validated by the serializer of the bulk view.
+    """
+
+    create = serializers.ListField(child=serializers.DictField(), default=list)
+    update = serializers.ListField(child=serializers.DictField(), default=list)
+    delete = serializers.ListField(child=serializers.IntegerField(), default=list)
+
+    def validate_update(self, value):
+        """Check that every update names the object it changes."""
+        for fields in value:
+            if not isinstance(fields.get("id"), int):
+                raise serializers.ValidationError(
+                    "Every update needs the id of the object."
+                )
+        return value
+
+
+class BulkObjectView(WriteBehindMixin, APIView):
+    """Base view to create, update and delete many objects of a project in a single request.
+
+    All changes are applied in one transaction, so either every change is saved or none is,
+    and they are saved with a single new revision of the project.
+    Subclasses define the model and the serializer used to validate its fields.
+    """
+
+    model = None
+    serializer_class = None
+
+    # Accepted authentication classes and the needed permissions to access the API
+    authentication_classes = [
+        SessionAuthentication,
+        ApiTokenAuthentication,
+        BasicAuthentication,
+    ]
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, project_id):
+        """Apply the creates, partial updates and deletes of the request.
+
+        Returns the ids of the created objects in the order they were requested.
+        """
+        project = generics.get_object_or_404(Project, id=project_id, owner=request.user)
+        bulk_request = BulkObjectRequestSerializer(data=request.data)
+        bulk_request.is_valid(raise_exception=True)
+        changes = bulk_request.validated_data
+
+        with transaction.atomic():
+            revision = project.next_revision()
+            created = self._create(project, changes["create"], revision)
+            updated = self._update(project, changes["update"], revision)
+            deleted = self._delete(project, changes["delete"], revision)
+
+        return Response(
+            {
+                "created": [obj.id for obj in created],
+                "updated": [obj.id for obj in updated],
+                "deleted": deleted,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    def _create(self, project, creates, revision):
+        """Create the new objects with a single insert."""
+        serializer = self.serializer_class(data=creates, many=True)
+        serializer.is_valid(raise_exception=True)
+        return self.model.objects.bulk_create(
+            [
+                self.model(project=project, revision=revision, **fields)
+                for fields in serializer.validated_data
+            ]
+        )
+
+    def _update(self, project, updates, revision):
+        """Apply the partial updates to the existing objects with a single update query."""
+        ids = [fields.get("id") for fields in updates]
+        objects = self.model.objects.filter(project=project).in_bulk(ids)
+        missing_ids = [obj_id for obj_id in ids if obj_id not in objects]
+        if missing_ids:
+            raise NotFound({"update": missing_ids})
+
+        updated = []
+        updated_fields = set()
+        for fields in updates:
+            obj = objects[fields["id"]]
+            serializer = self.serializer_class(obj, data=fields, partial=True)
+            serializer.is_valid(raise_exception=True)
+            for field, value in serializer.validated_data.items():
+                setattr(obj, field, value)
+            obj.revision = revision
+            updated_fields.update(serializer.validated_data)
+            updated.append(obj)
+
+        if updated:
+            self.model.objects.bulk_update(
+                updated, sorted(updated_fields | {"revision"})
+            )
+        return updated
+
+    def _delete(self, project, ids, revision):
+        """Delete the objects with a single delete query and record their deletion."""
+        queryset = self.model.objects.filter(project=project, id__in=ids)
+        existing_ids = set(queryset.values_list("id", flat=True))
+        missing_ids = [obj_id for obj_id in ids if obj_id not in existing_ids]
+        if missing_ids:
+            raise NotFound({"delete": missing_ids})
+        queryset.delete()
+        Tombstone.bury(project, self.model, ids, revision)
+        return ids
@@ -0,0 +1,110 @@
+from rest_framework import status
+from rest_framework.response import Response
+
+from project_management.models import Project
+
+SAFE_METHODS = ("GET", "HEAD")
+WRITE_METHODS = ("PUT", "PATCH", "DELETE")
+
+
+class _ConditionalResponseError(Exception):
+    """Raised to answer a conditional request before the handler of the view runs."""
+
+    def __init__(self, response: Response):
+        """Store the response to answer with."""
+        super().__init__()
+        self.response = response
+
+
+def _entity_tags(header: str) -> list[str]:
+    """Split an If-Match or If-None-Match header into its entity tags."""
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+class ConditionalRequestMixin:
+    """Mixin for api views whose representation only changes with a revision of the project.
+
+    The entity tag of a response is built from the revision instead of hashing the body, so
+    an If-None-Match request is answered with 304 before anything is serialized, and a write
+    with an outdated If-Match header is rejected with 412 instead of overwriting a change
+    made in another tab.
+
+    Views using the mixin have a project_id in the url, others override ``get_revision``.
+    """
+
+    def get_revision(self) -> str | None:
+        """Get the revision the representation depends on.
+
+        Returns
+        -------
+        str | None
+            The revision, or None if the resource does not exist for the user.
+        """
+        revision = (
+            Project.objects.filter(
+                id=self.kwargs["project_id"], owner=self.request.user
+            )
+            .values_list("revision", flat=True)
+            .first()
+        )
+        return None if revision is None else str(revision)
+
+    def get_etag(self) -> str | None:
+        """Get the strong entity tag of the current representation."""
+        revision = self.get_revision()
+        if revision is None:
+            return None
+        # The same url can be negotiated into different formats
+        return f'"{revision}-{self.request.accepted_renderer.format}"'
+
+    def initial(self, request, *args, **kwargs):
+        """Answer the conditional request if its precondition decides the response."""
+        super().initial(request, *args, **kwargs)
+        if_none_match = request.headers.get("If-None-Match")
+        if_match = request.headers.get("If-Match")
+        if request.method in SAFE_METHODS and if_none_match:
+            etag = self.get_etag()
+            # If-None-Match uses the weak comparison
+            tags = [tag.removeprefix("W/") for tag in _entity_tags(if_none_match)]
+            if etag is not None and ("*" in tags or etag in tags):
+                raise _ConditionalResponseError(
+                    Response(
+                        status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+                    )
+                )
+        elif request.method in WRITE_METHODS and if_match:
+            etag = self.get_etag()
+            tags = _entity_tags(if_match)
+            if etag is None:
+                # A missing resource is answered by the view
+                return
+            if "*" not in tags and etag not in tags:
+                raise _ConditionalResponseError(
+                    Response(
+                        {"detail": "The resource was changed in the meantime."},
+                        status=status.HTTP_412_PRECONDITION_FAILED,
+                        headers={"ETag": etag},
+                    )
+                )
+
+    def handle_exception(self, exc):
+        """Return the response of an answered conditional request."""
+        if isinstance(exc, _ConditionalResponseError):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        """Add the entity tag of the current representation to successful responses."""
+        response = super().finalize_response(request, response, *args, **kwargs)
+        # A created object is not the representation of the list it was created in, and an
+        # accepted update is not written yet
+        if (
+            request.method in (*SAFE_METHODS, "PUT", "PATCH")
+            and status.is_success(response.status_code)
+            and response.status_code != status.HTTP_202_ACCEPTED
+            and not response.has_header("ETag")
+        ):
+            etag = self.get_etag()
+            if etag is not None:
+                response["ETag"] = etag
+        return response
@@ -0,0 +1,10 @@
+from autosave_api.serializers import HeliostatSerializer
+from autosave_api.views.bulk_object_view import BulkObjectView
+from project_management.models import Heliostat
+
+
+class HeliostatBulk(BulkObjectView):
+    """Creates a view to create, update and delete many heliostats of a project in one request."""
+
+    model = Heliostat
+    serializer_class = HeliostatSerializer
@@ -2,19 +2,45 @@ from rest_framework import generics
 from rest_framework.authentication import BasicAuthentication, SessionAuthentication
 from rest_framework.permissions import IsAuthenticated
 
+from autosave_api.authentication import ApiTokenAuthentication
 from autosave_api.serializers import HeliostatSerializer
+from autosave_api.views.conditional_request_mixin import ConditionalRequestMixin
+from autosave_api.views.revision_mixin import RevisionMixin
+from autosave_api.views.write_behind_mixin import WriteBehindMixin
 from project_management.models import Heliostat
 
 
-class HeliostatDetail(generics.RetrieveUpdateDestroyAPIView):
+class HeliostatDetail(
+    ConditionalRequestMixin,
+    WriteBehindMixin,
+    RevisionMixin,
+    generics.RetrieveUpdateDestroyAPIView,
+):
     """Creates a view to retrieve, edit or delete a specific heliostat, defined by the pk in the url."""
 
     serializer_class = HeliostatSerializer
 
     # Accepted authentication classes and the needed permissions to access the API
-    authentication_classes = [SessionAuthentication, BasicAuthentication]
+    authentication_classes = [
+        SessionAuthentication,
+        ApiTokenAuthentication,
+        BasicAuthentication,
+    ]
     permission_classes = [IsAuthenticated]
 
+    # Updates sent while the object is dragged are merged, see autosave_api.write_behind
+    coalesce_updates = True
+
     def get_queryset(self):
         """Get the heliostats that belong to the user making the request."""
         return Heliostat.objects.filter(project__owner=self.request.user)
+
+    def get_revision(self):
+        """Get the revision the heliostat was last changed in."""
+        revision = (
+            self.get_queryset()
+            .filter(pk=self.kwargs["pk"])
+            .values_list("revision", flat=True)
+            .first()
+        )
+        return None if revision is None else str(revision)
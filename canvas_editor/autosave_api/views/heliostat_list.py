@@ -1,20 +1,64 @@
+from django.db import transaction
 from rest_framework import generics
 from rest_framework.authentication import BasicAuthentication, SessionAuthentication
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
 
+from autosave_api.authentication import ApiTokenAuthentication
+from autosave_api.filters import BoundingBoxFilter
+from autosave_api.pagination import KeysetPagination
+from autosave_api.renderers import HeliostatColumnsRenderer, heliostat_columns
 from autosave_api.serializers import HeliostatSerializer
+from autosave_api.views.conditional_request_mixin import ConditionalRequestMixin
+from autosave_api.views.values_list_mixin import ValuesListMixin
+from autosave_api.views.write_behind_mixin import WriteBehindMixin
 from project_management.models import Heliostat, Project
 
 
-class HeliostatList(generics.ListCreateAPIView):
+class HeliostatList(
+    ConditionalRequestMixin,
+    WriteBehindMixin,
+    ValuesListMixin,
+    generics.ListCreateAPIView,
+):
     """Creates a view to list all heliostats and create new ones."""
 
     serializer_class = HeliostatSerializer
 
     # Accepted authentication classes and the needed permissions to access the API
-    authentication_classes = [SessionAuthentication, BasicAuthentication]
+    authentication_classes = [
+        SessionAuthentication,
+        ApiTokenAuthentication,
+        BasicAuthentication,
+    ]
     permission_classes = [IsAuthenticated]
 
+    # Large fields can be listed in the compact columnar format, see autosave_api.renderers
+    renderer_classes = [
+        *api_settings.DEFAULT_RENDERER_CLASSES,
+        HeliostatColumnsRenderer,
+    ]
+
+    # Large fields can be loaded page by page or only in the region in view
+    pagination_class = KeysetPagination
+    filter_backends = [BoundingBoxFilter]
+
+    def list(self, request, *args, **kwargs):
+        """List the heliostats as JSON or, if requested, as binary columns."""
+        if isinstance(request.accepted_renderer, HeliostatColumnsRenderer):
+            queryset = self.filter_queryset(self.get_queryset())
+            page = self.paginate_queryset(queryset)
+            if page is None:
+                return Response(heliostat_columns(queryset.order_by("id")))
+            # The binary format has no room for the next link, so it is sent as header
+            columns = heliostat_columns(page)
+            ids = columns["ids"]
+            next_link = self.paginator.get_next_link(ids[-1] if ids else None, len(ids))
+            headers = {"Link": f'<{next_link}>; rel="next"'} if next_link else None
+            return Response(columns, headers=headers)
+        return super().list(request, *args, **kwargs)
+
     # Overwrite the default function to use the project defined by the project_id in the url for saving the heliostat
     def perform_create(self, serializer):
         """Save the new heliostat with the project defined by the project_id in the url."""
@@ -23,7 +67,8 @@ class HeliostatList(generics.ListCreateAPIView):
         project = generics.get_object_or_404(
             Project, id=project_id, owner=self.request.user
         )
-        serializer.save(project=project)
+        with transaction.atomic():
+            serializer.save(project=project, revision=project.next_revision())
 
     def get_queryset(self):
         """Get the heliostats that belong to the user making the request and the project defined by the project_id in the url."""
@@ -0,0 +1,10 @@
+from autosave_api.serializers import LightSourceSerializer
+from autosave_api.views.bulk_object_view import BulkObjectView
+from project_management.models import LightSource
+
+
+class LightSourceBulk(BulkObjectView):
+    """Creates a view to create, update and delete many light sources of a project in one request."""
+
+    model = LightSource
+    serializer_class = LightSourceSerializer
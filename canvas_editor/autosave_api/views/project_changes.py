@@ -0,0 +1,104 @@
+from django.db import transaction
+from rest_framework import generics, serializers, status
+from rest_framework.authentication import BasicAuthentication, SessionAuthentication
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from autosave_api.authentication import ApiTokenAuthentication
+from autosave_api.serializers import (
+    HeliostatSerializer,
+    LightSourceSerializer,
+    ReceiverSerializer,
+    SettingsSerializer,
+    serialize_values,
+)
+from autosave_api.views.write_behind_mixin import WriteBehindMixin
+from canvas.message_dict import changes_pruned_text
+from project_management.models import Project, Tombstone
+
+
+class ChangesRequestSerializer(serializers.Serializer):
+    """Serializer to validate the revision the changes are requested since."""
+
+    since = serializers.IntegerField(min_value=0)
+
+
+class ProjectChanges(WriteBehindMixin, APIView):
+    """Creates a view to get the changes of a project since a revision.
+
+    Clients holding a copy of the project at a revision only need to apply the created and
+    changed heliostats, receivers, light sources and settings and delete the deleted ones to
+    get the current revision, instead of loading the whole project again.
+    """
+
+    # Accepted authentication classes and the needed permissions to access the API
+    authentication_classes = [
+        SessionAuthentication,
+        ApiTokenAuthentication,
+        BasicAuthentication,
+    ]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, project_id):
+        """Get the components created, changed or deleted after the given revision.
+
+        The settings are only included if they changed, otherwise they are null. The deleted
+        components are listed by their ids. If their tombstones since the revision are
+        already pruned, the response is 410 Gone and the client has to load the whole project.
+        """
+        changes_request = ChangesRequestSerializer(data=request.query_params)
+        changes_request.is_valid(raise_exception=True)
+        since = changes_request.validated_data["since"]
+
+        # Read everything in one transaction, so the changes match the returned revision
+        with transaction.atomic():
+            project = generics.get_object_or_404(
+                Project.objects.select_related("settings"),
+                id=project_id,
+                owner=request.user,
+            )
+            if since > project.revision:
+                return Response(
+                    {"since": ["The project has no such revision."]},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            if since < project.pruned_revision:
+                return Response(
+                    {"detail": changes_pruned_text, "revision": project.revision},
+                    status=status.HTTP_410_GONE,
+                )
+
+            deleted = {
+                object_type: [] for object_type, _ in Tombstone.OBJECT_TYPE_CHOICES
+            }
+            tombstones = project.tombstones.filter(revision__gt=since).values_list(
+                "object_type", "object_id"
+            )
+            for object_type, object_id in tombstones:
+                deleted[object_type].append(object_id)
+
+            settings = project.settings
+            return Response(
+                {
+                    "revision": project.revision,
+                    "heliostats": serialize_values(
+                        project.heliostats.filter(revision__gt=since),
+                        HeliostatSerializer,
+                    ),
+                    "receivers": serialize_values(
+                        project.receivers.filter(revision__gt=since),
+                        ReceiverSerializer,
+                    ),
+                    "light_sources": serialize_values(
+                        project.light_sources.filter(revision__gt=since),
+                        LightSourceSerializer,
+                    ),
+                    "settings": (
+                        SettingsSerializer(settings).data
+                        if settings.revision > since
+                        else None
+                    ),
+                    "deleted": deleted,
+                }
+            )
@@ -1,21 +1,87 @@
+import zlib
+
 from rest_framework import generics
 from rest_framework.authentication import BasicAuthentication, SessionAuthentication
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 
-from autosave_api.serializers import ProjectDetailSerializer
+from autosave_api.authentication import ApiTokenAuthentication
+from autosave_api.serializers import (
+    HeliostatSerializer,
+    LightSourceSerializer,
+    ProjectDetailSerializer,
+    ReceiverSerializer,
+    SettingsSerializer,
+    serialize_values,
+)
+from autosave_api.views.conditional_request_mixin import ConditionalRequestMixin
+from autosave_api.views.write_behind_mixin import WriteBehindMixin
 from project_management.models import Project
 
 
-class ProjectDetailList(generics.RetrieveUpdateDestroyAPIView):
+class ProjectDetailList(
+    ConditionalRequestMixin, WriteBehindMixin, generics.RetrieveUpdateDestroyAPIView
+):
     """Creates a view to list a specific project, specified by the given pk in the url, where you can also delete the project."""
 
     serializer_class = ProjectDetailSerializer
 
     # Accepted authentication classes and the needed permissions to access the API
-    authentication_classes = [SessionAuthentication, BasicAuthentication]
+    authentication_classes = [
+        SessionAuthentication,
+        ApiTokenAuthentication,
+        BasicAuthentication,
+    ]
     permission_classes = [IsAuthenticated]
 
+    project_url_kwarg = "pk"
+
     def get_queryset(self):
         """Get the projects that belong to the user making the request."""
-        # Select only the projects the user owns
-        return Project.objects.filter(owner=self.request.user)
+        # Select only the projects the user owns, loading every relation of the serializer
+        # up front, so the number of queries does not depend on the size of the project
+        return (
+            Project.objects.filter(owner=self.request.user)
+            .select_related("settings")
+            .prefetch_related("heliostats", "receivers", "light_sources")
+        )
+
+    def get_revision(self):
+        """Get the revision of the project, which also changes when the project is renamed."""
+        project = (
+            Project.objects.filter(pk=self.kwargs["pk"], owner=self.request.user)
+            .values_list("revision", "name")
+            .first()
+        )
+        if project is None:
+            return None
+        # Renaming a project does not change its components, so it keeps the revision
+        revision, name = project
+        return f"{revision}.{zlib.crc32(name.encode()):08x}"
+
+    def retrieve(self, request, *args, **kwargs):
+        """Get the project with the same response as the ProjectDetailSerializer.
+
+        The heliostats, receivers and light sources are serialized from plain values, since
+        building a serializer per object is too slow for large projects.
+        """
+        # The relations are read as values, so the prefetched instances are not needed
+        queryset = self.get_queryset().prefetch_related(None)
+        project = generics.get_object_or_404(queryset, pk=kwargs["pk"])
+        self.check_object_permissions(request, project)
+        return Response(
+            {
+                "name": project.name,
+                "revision": project.revision,
+                "heliostats": serialize_values(
+                    project.heliostats.all(), HeliostatSerializer
+                ),
+                "receivers": serialize_values(
+                    project.receivers.all(), ReceiverSerializer
+                ),
+                "light_sources": serialize_values(
+                    project.light_sources.all(), LightSourceSerializer
+                ),
+                "settings": SettingsSerializer(project.settings).data,
+            }
+        )
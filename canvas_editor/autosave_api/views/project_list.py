@@ -2,6 +2,7 @@ from rest_framework import generics
 from rest_framework.authentication import BasicAuthentication, SessionAuthentication
 from rest_framework.permissions import IsAuthenticated
 
+from autosave_api.authentication import ApiTokenAuthentication
 from autosave_api.serializers import ProjectSerializer
 from project_management.models import Project
 
@@ -12,7 +13,11 @@ class ProjectList(generics.ListCreateAPIView):
     serializer_class = ProjectSerializer
 
     # Accepted authentication classes and the needed permissions to access the API
-    authentication_classes = [SessionAuthentication, BasicAuthentication]
+    authentication_classes = [
+        SessionAuthentication,
+        ApiTokenAuthentication,
+        BasicAuthentication,
+    ]
     permission_classes = [IsAuthenticated]
 
     # Overwrite the default function to use the request user as the owner of the project and also create a new settings object
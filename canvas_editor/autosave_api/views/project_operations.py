@@ -0,0 +1,138 @@
+from django.db import transaction
+from rest_framework import generics, serializers, status
+from rest_framework.authentication import BasicAuthentication, SessionAuthentication
+from rest_framework.exceptions import APIException, NotFound
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from autosave_api.authentication import ApiTokenAuthentication
+from autosave_api.serializers import (
+    HeliostatSerializer,
+    LightSourceSerializer,
+    ReceiverSerializer,
+    SettingsSerializer,
+)
+from autosave_api.views.write_behind_mixin import WriteBehindMixin
+from project_management.models import Project, Tombstone
+
+CREATE = "create"
+UPDATE = "update"
+DELETE = "delete"
+
+OBJECT_SERIALIZERS = {
+    "heliostat": HeliostatSerializer,
+    "receiver": ReceiverSerializer,
+    "light_source": LightSourceSerializer,
+}
+"""The serializers of the object types that can be created, updated and deleted."""
+
+SETTINGS = "settings"
+
+
+class OperationSerializer(serializers.Serializer):
+    """Serializer to validate the structure of a single operation.
+
+    The fields of the changed object are validated by the serializer of its type.
+    """
+
+    op = serializers.ChoiceField(choices=[CREATE, UPDATE, DELETE])
+    type = serializers.ChoiceField(choices=[*OBJECT_SERIALIZERS, SETTINGS])
+    id = serializers.IntegerField(required=False)
+    data = serializers.DictField(default=dict)
+
+    def validate(self, attrs):
+        """Check that the operation is supported for the type and names its object."""
+        if attrs["type"] == SETTINGS and attrs["op"] != UPDATE:
+            raise serializers.ValidationError("The settings can only be updated.")
+        if attrs["type"] != SETTINGS and attrs["op"] != CREATE and "id" not in attrs:
+            raise serializers.ValidationError(
+                "Updates and deletes need the id of the object."
+            )
+        return attrs
+
+
+class ProjectOperations(WriteBehindMixin, APIView):
+    """Creates a view to apply an ordered list of operations to a project in one transaction.
+
+    Every operation creates, updates or deletes a heliostat, receiver or light source, or updates
+    the settings. Either all operations are applied with a single new revision of the project or,
+    if one of them fails, none is.
+    """
+
+    # Accepted authentication classes and the needed permissions to access the API
+    authentication_classes = [
+        SessionAuthentication,
+        ApiTokenAuthentication,
+        BasicAuthentication,
+    ]
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, project_id):
+        """Apply the operations in order and return the result of each operation.
+
+        The result of a create or update is the changed object, the result of a delete is the
+        id of the deleted object. A failing operation is identified by its index.
+        """
+        project = generics.get_object_or_404(Project, id=project_id, owner=request.user)
+        if not isinstance(request.data, list):
+            return Response(
+                {"non_field_errors": ["Expected a list of operations."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        operations = [OperationSerializer(data=data) for data in request.data]
+        invalid_operations = [
+            {"index": index, "errors": operation.errors}
+            for index, operation in enumerate(operations)
+            if not operation.is_valid()
+        ]
+        if invalid_operations:
+            return Response(invalid_operations, status=status.HTTP_400_BAD_REQUEST)
+
+        results = []
+        try:
+            with transaction.atomic():
+                revision = project.next_revision()
+                for index, operation in enumerate(operations):
+                    results.append(
+                        self._apply(project, operation.validated_data, revision)
+                    )
+        except APIException as error:
+            # Leaving the transaction with the exception rolled back all operations.
+            return Response(
+                [{"index": index, "errors": error.detail}], status=error.status_code
+            )
+        return Response(results, status=status.HTTP_200_OK)
+
+    def _apply(self, project, operation, revision):
+        """Apply a single operation and return its result."""
+        if operation["type"] == SETTINGS:
+            serializer = SettingsSerializer(
+                project.settings, data=operation["data"], partial=True
+            )
+            serializer.is_valid(raise_exception=True)
+            serializer.save(revision=revision)
+            return serializer.data
+
+        serializer_class = OBJECT_SERIALIZERS[operation["type"]]
+        if operation["op"] == CREATE:
+            serializer = serializer_class(data=operation["data"])
+            serializer.is_valid(raise_exception=True)
+            serializer.save(project=project, revision=revision)
+            return serializer.data
+
+        model = serializer_class.Meta.model
+        instance = model.objects.filter(project=project, id=operation["id"]).first()
+        if instance is None:
+            raise NotFound(f"No {operation['type']} with id {operation['id']}.")
+        if operation["op"] == UPDATE:
+            serializer = serializer_class(
+                instance, data=operation["data"], partial=True
+            )
+            serializer.is_valid(raise_exception=True)
+            serializer.save(revision=revision)
+            return serializer.data
+
+        instance.delete()
+        Tombstone.bury(project, model, [operation["id"]], revision)
+        return {"id": operation["id"]}
@@ -0,0 +1,10 @@
+from autosave_api.serializers import ReceiverSerializer
+from autosave_api.views.bulk_object_view import BulkObjectView
+from project_management.models import Receiver
+
+
+class ReceiverBulk(BulkObjectView):
+    """Creates a view to create, update and delete many receivers of a project in one request."""
+
+    model = Receiver
+    serializer_class = ReceiverSerializer
@@ -1,18 +1,32 @@
+from django.db import transaction
 from rest_framework import generics
 from rest_framework.authentication import BasicAuthentication, SessionAuthentication
 from rest_framework.permissions import IsAuthenticated
 
+from autosave_api.authentication import ApiTokenAuthentication
 from autosave_api.serializers import ReceiverSerializer
+from autosave_api.views.conditional_request_mixin import ConditionalRequestMixin
+from autosave_api.views.values_list_mixin import ValuesListMixin
+from autosave_api.views.write_behind_mixin import WriteBehindMixin
 from project_management.models import Project, Receiver
 
 
-class ReceiverList(generics.ListCreateAPIView):
+class ReceiverList(
+    ConditionalRequestMixin,
+    WriteBehindMixin,
+    ValuesListMixin,
+    generics.ListCreateAPIView,
+):
     """Creates a view to list all receivers or to create a new one."""
 
     serializer_class = ReceiverSerializer
 
     # Accepted authentication classes and the needed permissions to access the API
-    authentication_classes = [SessionAuthentication, BasicAuthentication]
+    authentication_classes = [
+        SessionAuthentication,
+        ApiTokenAuthentication,
+        BasicAuthentication,
+    ]
     permission_classes = [IsAuthenticated]
 
     # Overwrite the default function to use the project defined by the project_id in the url for saving the heliostat
@@ -22,7 +36,8 @@ class ReceiverList(generics.ListCreateAPIView):
         project = generics.get_object_or_404(
             Project, id=project_id, owner=self.request.user
         )
-        serializer.save(project=project)
+        with transaction.atomic():
+            serializer.save(project=project, revision=project.next_revision())
 
     def get_queryset(self):
         """Get the receivers that belong to the user making the request and the project defined by the project_id in the url."""
@@ -0,0 +1,25 @@
+from django.db import transaction
+
+from project_management.models import Tombstone
+
+
+class RevisionMixin:
+    """Mixin for detail views that saves every change with a new revision of the project.
+
+    Deleted components are recorded as tombstones, so clients syncing the changes of the
+    project can delete them too.
+    """
+
+    def perform_update(self, serializer):
+        """Save the changes with a new revision of the project."""
+        with transaction.atomic():
+            serializer.save(revision=serializer.instance.project.next_revision())
+
+    def perform_destroy(self, instance):
+        """Delete the component and record its deletion with a new revision of the project."""
+        with transaction.atomic():
+            project = instance.project
+            Tombstone.bury(
+                project, type(instance), [instance.pk], project.next_revision()
+            )
+            instance.delete()
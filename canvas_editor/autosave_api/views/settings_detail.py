@@ -2,17 +2,30 @@ from rest_framework import generics
 from rest_framework.authentication import BasicAuthentication, SessionAuthentication
 from rest_framework.permissions import IsAuthenticated
 
+from autosave_api.authentication import ApiTokenAuthentication
 from autosave_api.serializers import SettingsSerializer
+from autosave_api.views.conditional_request_mixin import ConditionalRequestMixin
+from autosave_api.views.revision_mixin import RevisionMixin
+from autosave_api.views.write_behind_mixin import WriteBehindMixin
 from project_management.models import Settings
 
 
-class SettingsDetail(generics.RetrieveUpdateAPIView):
+class SettingsDetail(
+    ConditionalRequestMixin,
+    WriteBehindMixin,
+    RevisionMixin,
+    generics.RetrieveUpdateAPIView,
+):
     """Creates a view to list and update all settings."""
 
     serializer_class = SettingsSerializer
 
     # Accepted authentication classes and the needed permissions to access the API
-    authentication_classes = [SessionAuthentication, BasicAuthentication]
+    authentication_classes = [
+        SessionAuthentication,
+        ApiTokenAuthentication,
+        BasicAuthentication,
+    ]
     permission_classes = [IsAuthenticated]
 
     # Overwrite the default get_object function to not use the primary key, but select the settings object by the corresponding project
@@ -26,3 +39,13 @@ class SettingsDetail(generics.RetrieveUpdateAPIView):
     def get_queryset(self):
         """Return the settings for the project of the user."""
         return Settings.objects.filter(project__owner=self.request.user)
+
+    def get_revision(self):
+        """Get the revision the settings were last changed in."""
+        revision = (
+            self.get_queryset()
+            .filter(project__id=self.kwargs["project_id"])
+            .values_list("revision", flat=True)
+            .first()
+        )
+        return None if revision is None else str(revision)
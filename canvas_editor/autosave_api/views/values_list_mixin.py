@@ -0,0 +1,22 @@
+from rest_framework.response import Response
+
+from autosave_api.serializers import serialize_values
+
+
+class ValuesListMixin:
+    """Mixin for list views that serializes the listed objects with ``serialize_values``.
+
+    The response is the same as the one of the serializer of the view, but large lists are
+    serialized a lot faster.
+    """
+
+    def list(self, request, *args, **kwargs):
+        """List the objects without building a serializer per object."""
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            # A page is only lazily sliced by the keyset pagination, see autosave_api.pagination
+            return self.get_paginated_response(
+                serialize_values(page, self.get_serializer_class())
+            )
+        return Response(serialize_values(queryset, self.get_serializer_class()))
@@ -0,0 +1,23 @@
+from rest_framework.authentication import BasicAuthentication, SessionAuthentication
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from autosave_api.authentication import ApiTokenAuthentication
+from autosave_api.write_behind import write_behind
+
+
+class WriteBehindMetrics(APIView):
+    """Creates a view of the number of coalesced and written autosave updates of this process."""
+
+    # Accepted authentication classes and the needed permissions to access the API
+    authentication_classes = [
+        SessionAuthentication,
+        ApiTokenAuthentication,
+        BasicAuthentication,
+    ]
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        """Get the metrics of the write-behind buffer, see autosave_api.write_behind."""
+        return Response(write_behind.metrics())
@@ -0,0 +1,57 @@
+from rest_framework import status
+from rest_framework.response import Response
+
+from autosave_api.write_behind import write_behind
+
+RESPOND_ASYNC = "respond-async"
+
+
+class WriteBehindMixin:
+    """Mixin for api views of a project that keeps them consistent with the write-behind buffer.
+
+    The queued updates of the project are written before the view reads or changes it. A
+    partial update asking for it with ``Prefer: respond-async`` is queued instead of
+    written and answered with 202, see ``autosave_api.write_behind``.
+
+    Views using the mixin have a project_id in the url, others set ``project_url_kwarg``.
+    Only views setting ``coalesce_updates`` queue partial updates.
+    """
+
+    project_url_kwarg = "project_id"
+    coalesce_updates = False
+
+    def coalesces_request(self, request) -> bool:
+        """Check whether the request is queued in the write-behind buffer."""
+        prefer = request.headers.get("Prefer", "")
+        return (
+            request.method == "PATCH"
+            and self.coalesce_updates
+            and write_behind.enabled
+            # A conditional update has to be checked against the written state
+            and "If-Match" not in request.headers
+            and RESPOND_ASYNC in [token.strip() for token in prefer.split(",")]
+        )
+
+    def initial(self, request, *args, **kwargs):
+        """Write the queued updates of the project before the request is handled."""
+        super().initial(request, *args, **kwargs)
+        if not self.coalesces_request(request):
+            write_behind.flush(self.kwargs[self.project_url_kwarg])
+
+    def partial_update(self, request, *args, **kwargs):
+        """Queue the update or, if it is not coalesced, write it right away."""
+        if not self.coalesces_request(request):
+            return super().partial_update(request, *args, **kwargs)
+        instance = self.get_object()
+        serializer = self.get_serializer(instance, data=request.data, partial=True)
+        serializer.is_valid(raise_exception=True)
+        # Answer with the object as it will be written
+        for name, value in write_behind.queue(
+            instance, serializer.validated_data
+        ).items():
+            setattr(instance, name, value)
+        return Response(
+            self.get_serializer(instance).data,
+            status=status.HTTP_202_ACCEPTED,
+            headers={"Preference-Applied": RESPOND_ASYNC},
+        )
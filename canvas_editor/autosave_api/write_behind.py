@@ -0,0 +1,202 @@
+"""A write-behind buffer for high-frequency autosave updates.
+
+While an object is dragged in the editor, it sends an update of the object many times a
+second. Each of those would be a write transaction of its own, so updates asking for it are
+only queued and successive updates of the same object are merged. The queued updates are
+written in one transaction per project once the coalescing window has passed, and before
+any other request reads or changes the project, see ``WriteBehindMixin``.
+
+The buffer lives in the memory of a process. Queued updates are lost if the process is
+killed within the window, and another process serving the same project only sees them once
+they are written.
+"""
+
+import atexit
+import logging
+import threading
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.db import connections, models, transaction
+
+from project_management.models import Project
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingUpdate:
+    """The merged changes of an object that are not written yet."""
+
+    model: type[models.Model]
+    project_id: int
+    fields: dict = field(default_factory=dict)
+    # The number of failed attempts to write the changes
+    failures: int = 0
+
+
+class WriteBehindBuffer:
+    """Coalesces updates of the same object and writes them behind the request."""
+
+    def __init__(self):
+        """Create an empty buffer."""
+        self._lock = threading.Lock()
+        # Held while writing, so a flush waits for the writes of a concurrent one
+        self._flush_lock = threading.Lock()
+        self._pending: dict[tuple[type[models.Model], int], _PendingUpdate] = {}
+        self._timer: threading.Timer | None = None
+        self._metrics = {
+            "queued": 0,
+            "coalesced": 0,
+            "written": 0,
+            "failed": 0,
+            "dropped": 0,
+        }
+
+    @property
+    def enabled(self) -> bool:
+        """Whether updates are coalesced at all."""
+        return settings.AUTOSAVE_COALESCE_SECONDS > 0
+
+    def queue(self, instance: models.Model, changes: dict) -> dict:
+        """Queue changes of an object to be written with its other pending changes.
+
+        Parameters
+        ----------
+        instance : models.Model
+            The changed heliostat, receiver or light source.
+        changes : dict
+            The new values by field name.
+
+        Returns
+        -------
+        dict
+            All pending changes of the object, including the new ones.
+        """
+        key = (type(instance), instance.pk)
+        with self._lock:
+            self._metrics["queued"] += 1
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = self._pending[key] = _PendingUpdate(
+                    type(instance), instance.project_id
+                )
+            else:
+                self._metrics["coalesced"] += 1
+            pending.fields.update(changes)
+            self._schedule()
+            return dict(pending.fields)
+
+    def flush(self, project_id: int | None = None):
+        """Write the pending updates.
+
+        Parameters
+        ----------
+        project_id : int | None
+            Only write the updates of this project, None writes all of them.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if project_id is None:
+                    flushed, self._pending = self._pending, {}
+                else:
+                    flushed = {
+                        key: pending
+                        for key, pending in self._pending.items()
+                        if pending.project_id == project_id
+                    }
+                    for key in flushed:
+                        del self._pending[key]
+                if not self._pending and self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+            if not flushed:
+                return
+
+            by_project: dict[int, dict] = {}
+            for key, pending in flushed.items():
+                by_project.setdefault(pending.project_id, {})[key] = pending
+            for updates in by_project.values():
+                self._write(updates)
+
+    def metrics(self) -> dict:
+        """Get the number of queued, coalesced, written, failed and dropped updates of this process.
+
+        Returns
+        -------
+        dict
+            The counters and the number of objects with pending updates.
+        """
+        with self._lock:
+            return {**self._metrics, "pending": len(self._pending)}
+
+    def _write(self, updates: dict):
+        """Write the pending updates of a project with one new revision."""
+        project_id = next(iter(updates.values())).project_id
+        try:
+            with transaction.atomic():
+                revision = Project(pk=project_id).next_revision()
+                for (model, pk), pending in updates.items():
+                    # A deleted object was flushed before its deletion, nothing to write
+                    model.objects.filter(pk=pk).update(
+                        **pending.fields, revision=revision
+                    )
+        except Exception:
+            logger.exception(
+                "Writing the queued updates of project %s failed", project_id
+            )
+            self._requeue(updates)
+            return
+        with self._lock:
+            self._metrics["written"] += len(updates)
+
+    def _requeue(self, updates: dict):
+        """Queue failed updates again, below the changes queued in the meantime.
+
+        Updates that failed ``AUTOSAVE_WRITE_ATTEMPTS`` times are dropped, so an update that
+        can never be written does not keep failing the writes of its project.
+        """
+        with self._lock:
+            self._metrics["failed"] += len(updates)
+            for key, pending in updates.items():
+                pending.failures += 1
+                if pending.failures >= settings.AUTOSAVE_WRITE_ATTEMPTS:
+                    logger.error(
+                        "Dropping the queued update of %s %s after %s failed writes",
+                        pending.model.__name__,
+                        key[1],
+                        pending.failures,
+                    )
+                    self._metrics["dropped"] += 1
+                    continue
+                newer = self._pending.get(key)
+                if newer is not None:
+                    pending.fields.update(newer.fields)
+                self._pending[key] = pending
+            self._schedule()
+
+    def _schedule(self):
+        """Start the timer writing the pending updates, the lock has to be held."""
+        if self._timer is None:
+            self._timer = threading.Timer(
+                settings.AUTOSAVE_COALESCE_SECONDS, self._flush_from_timer
+            )
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush_from_timer(self):
+        """Write all pending updates once the coalescing window has passed."""
+        with self._lock:
+            self._timer = None
+        try:
+            self.flush()
+        finally:
+            # The timer thread opened its own database connection
+            connections.close_all()
+
+
+write_behind = WriteBehindBuffer()
+"""The write-behind buffer shared by all requests of this process."""
+
+# Write what was acknowledged when the process shuts down
+atexit.register(write_behind.flush)
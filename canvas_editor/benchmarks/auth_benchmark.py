@@ -0,0 +1,72 @@
+"""Benchmark authenticated requests to the autosave api with Basic and token authentication.
+
+Every scheme sends the same requests for the project list of a user. Basic authentication
+hashes the password of the user on every request, a token is only looked up once and then
+served from the token cache.
+
+Run from the ``canvas_editor`` directory::
+
+    python -m benchmarks.auth_benchmark --requests 50
+"""
+
+import argparse
+import base64
+
+from benchmarks.utils import (
+    benchmark_database,
+    create_synthetic_project,
+    measure,
+    setup_django,
+)
+
+PASSWORD = "benchmark-password"
+
+
+def main():
+    """Run the benchmark and print the requests per second of every scheme."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.test import Client
+    from django.urls import reverse
+
+    from autosave_api.models import ApiToken
+    from canvas.view_name_dict import autosave_project_list_view
+
+    with benchmark_database():
+        project = create_synthetic_project("benchmark_auth", 1)
+        user = project.owner
+        # The password is hashed with the hasher configured for the site
+        user.set_password(PASSWORD)
+        user.save()
+        _, key = ApiToken.issue(user, name="benchmark")
+
+        basic = base64.b64encode(f"{user.username}:{PASSWORD}".encode()).decode()
+        schemes = {
+            "basic": f"Basic {basic}",
+            "token": f"Token {key}",
+        }
+        url = reverse(autosave_project_list_view)
+        client = Client()
+
+        print(f"{'scheme':>8} {'requests/s':>11} {'per request [ms]':>17}")
+        for scheme, authorization in schemes.items():
+
+            def requests(authorization=authorization):
+                for _ in range(args.requests):
+                    response = client.get(url, HTTP_AUTHORIZATION=authorization)
+                    if response.status_code != 200:
+                        raise RuntimeError(f"{scheme} request failed: {response}")
+
+            duration = measure(requests, args.repeat)
+            print(
+                f"{scheme:>8} {args.requests / duration:>11.1f} "
+                f"{duration / args.requests * 1000:>17.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark building the ARTIST configurations of large projects.
+
+Compares the batched configuration builders of ``HDF5Manager`` with the previous
+per-row construction, which created one small tensor per heliostat and receiver.
+Pass ``--full`` to additionally time the whole scenario export, which needs the STRAL
+data and a warm surface prototype cache.
+
+Run from the ``canvas_editor`` directory::
+
+    python -m benchmarks.export_benchmark --sizes 1000 10000 100000
+"""
+
+import argparse
+
+from benchmarks.utils import (
+    benchmark_database,
+    create_synthetic_project,
+    measure,
+    setup_django,
+)
+
+
+def _per_row_heliostat_config(project, device):
+    """Build the heliostat configuration the way it was built before batching."""
+    import torch
+    from artist.scenario.configuration_classes import (
+        HeliostatConfig,
+        HeliostatListConfig,
+    )
+
+    heliostat_list = []
+    for heliostat in project.heliostats.all():
+        heliostat_list.append(
+            HeliostatConfig(
+                name=str(heliostat),
+                id=heliostat.pk,
+                position=torch.tensor(
+                    [
+                        heliostat.position_x,
+                        heliostat.position_y,
+                        heliostat.position_z,
+                        1.0,
+                    ],
+                    device=device,
+                ),
+            )
+        )
+    return HeliostatListConfig(heliostat_list=heliostat_list)
+
+
+def main():
+    """Run the benchmark and print one row per project size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--full", action="store_true", help="also time the whole scenario export"
+    )
+    args = parser.parse_args()
+
+    setup_django()
+    from hdf5_management.hdf5_manager import HDF5Manager
+
+    device = HDF5Manager._pick_device()
+    header = (
+        f"{'heliostats':>10} {'per row [s]':>12} {'batched [s]':>12} {'speedup':>8}"
+    )
+    if args.full:
+        header += f" {'export [s]':>11}"
+    print(header)
+
+    with benchmark_database():
+        for size in args.sizes:
+            project = create_synthetic_project(f"benchmark_{size}", size)
+            per_row = measure(
+                lambda: _per_row_heliostat_config(project, device), args.repeat
+            )
+            batched = measure(
+                lambda: HDF5Manager._create_heliostat_config(project, device),
+                args.repeat,
+            )
+            row = f"{size:>10} {per_row:>12.3f} {batched:>12.3f} {per_row / batched:>7.1f}x"
+            if args.full:
+                export = measure(
+                    lambda: HDF5Manager.create_hdf5_file(
+                        project.owner, project
+                    ).unlink(),
+                    args.repeat,
+                )
+                row += f" {export:>11.3f}"
+            print(row)
+
+
+if __name__ == "__main__":
+    main()
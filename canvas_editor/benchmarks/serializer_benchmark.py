@@ -0,0 +1,65 @@
+"""Benchmark serializing the heliostats of large projects for the autosave api.
+
+Compares ``HeliostatSerializer`` with ``serialize_values``, which builds the same
+response from ``values_list`` rows, and checks that both render to the same bytes.
+The rendering with the JSON renderer of the api is timed separately.
+
+Run from the ``canvas_editor`` directory::
+
+    python -m benchmarks.serializer_benchmark --sizes 1000 10000 50000
+"""
+
+import argparse
+
+from benchmarks.utils import (
+    benchmark_database,
+    create_synthetic_project,
+    measure,
+    setup_django,
+)
+
+
+def main():
+    """Run the benchmark and print one row per project size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    setup_django()
+    from rest_framework.renderers import JSONRenderer
+
+    from autosave_api.serializers import HeliostatSerializer, serialize_values
+
+    renderer = JSONRenderer()
+    print(
+        f"{'heliostats':>10} {'serializer [s]':>15} {'values [s]':>11} "
+        f"{'speedup':>8} {'render [s]':>11}"
+    )
+
+    with benchmark_database():
+        for size in args.sizes:
+            project = create_synthetic_project(f"benchmark_{size}", size)
+
+            # A new queryset per run, so both paths fetch the rows from the database.
+            def serializer():
+                return HeliostatSerializer(project.heliostats.all(), many=True).data
+
+            def values():
+                return serialize_values(project.heliostats.all(), HeliostatSerializer)
+
+            data = values()
+            if renderer.render(serializer()) != renderer.render(data):
+                raise RuntimeError("serialize_values does not match the serializer")
+
+            serializer_time = measure(serializer, args.repeat)
+            values_time = measure(values, args.repeat)
+            render_time = measure(lambda: renderer.render(data), args.repeat)
+            print(
+                f"{size:>10} {serializer_time:>15.3f} {values_time:>11.3f} "
+                f"{serializer_time / values_time:>7.1f}x {render_time:>11.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark the startup of a Django process.
+
+Runs ``manage.py check`` in fresh interpreters, which loads the settings, all apps and
+the URLconf, like every web worker and management command does. Reports the wall time,
+the peak RSS and which of the heavy scientific packages were imported, together with
+their cumulative import time from ``python -X importtime``.
+
+Run from the ``canvas_editor`` directory::
+
+    python -m benchmarks.startup_benchmark --repeat 5
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+HEAVY_PACKAGES = ["torch", "h5py", "artist", "numpy"]
+"""Top level packages whose import time is reported."""
+
+IMPORTTIME_PATTERN = re.compile(r"^import time:\s+\d+\s+\|\s+(\d+)\s+\|\s(\s*)(\S+)$")
+
+
+def _run_check(importtime: bool = False) -> tuple[float, int, str]:
+    """Run ``manage.py check`` once.
+
+    Returns
+    -------
+    tuple[float, int, str]
+        The wall time in seconds, the peak RSS in KiB and the captured standard error.
+    """
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["manage.py", "check"]
+
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+    stderr = process.stderr.read()
+    # wait4 reports the resource usage of this child only.
+    _, status, rusage = os.wait4(process.pid, 0)
+    wall_time = time.perf_counter() - start
+    process.returncode = os.waitstatus_to_exitcode(status)
+    if process.returncode != 0:
+        raise RuntimeError(f"manage.py check failed:\n{stderr}")
+    return wall_time, rusage.ru_maxrss, stderr
+
+
+def _heavy_import_times(importtime_output: str) -> dict[str, float]:
+    """Get the cumulative import time in seconds of the heavy top level packages."""
+    import_times = {}
+    for line in importtime_output.splitlines():
+        match = IMPORTTIME_PATTERN.match(line)
+        if match is None:
+            continue
+        cumulative, _, module = match.groups()
+        if module in HEAVY_PACKAGES:
+            import_times[module] = int(cumulative) / 1_000_000
+    return import_times
+
+
+def main():
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # Warm the file system cache, so the first run is not slower than the others.
+    _run_check()
+    runs = [_run_check() for _ in range(args.repeat)]
+    _, _, importtime_output = _run_check(importtime=True)
+
+    wall_times = [wall_time for wall_time, _, _ in runs]
+    peak_rss = [rss for _, rss, _ in runs]
+    print(f"manage.py check: {statistics.median(wall_times):.3f}s (median)")
+    print(f"peak RSS:        {statistics.median(peak_rss) / 1024:.1f} MiB (median)")
+    import_times = _heavy_import_times(importtime_output)
+    for package in HEAVY_PACKAGES:
+        if package in import_times:
+            print(f"import {package}: {import_times[package]:.3f}s")
+        else:
+            print(f"import {package}: not imported")
+
+
+if __name__ == "__main__":
+    main()
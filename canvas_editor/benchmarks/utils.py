@@ -0,0 +1,94 @@
+"""Helpers shared by the benchmarks.
+
+The benchmarks are run from the ``canvas_editor`` directory, e.g.
+``python -m benchmarks.export_benchmark``. They run against a throwaway test database,
+so the development database is never touched.
+"""
+
+import contextlib
+import os
+import statistics
+import time
+from collections.abc import Callable, Iterator
+
+
+def setup_django():
+    """Configure Django for a standalone benchmark script."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "canvas.settings")
+    import django
+
+    django.setup()
+
+
+@contextlib.contextmanager
+def benchmark_database() -> Iterator[None]:
+    """Create a test database for the duration of the benchmark."""
+    from django.test.utils import (
+        setup_databases,
+        setup_test_environment,
+        teardown_databases,
+        teardown_test_environment,
+    )
+
+    setup_test_environment()
+    old_config = setup_databases(verbosity=0, interactive=False)
+    try:
+        yield
+    finally:
+        teardown_databases(old_config, verbosity=0)
+        teardown_test_environment()
+
+
+def create_synthetic_project(
+    name: str, number_of_heliostats: int, number_of_receivers: int = 1
+):
+    """Create a project with heliostats laid out on a square grid.
+
+    Parameters
+    ----------
+    name : str
+        The name of the project and its owner.
+    number_of_heliostats : int
+        The number of heliostats in the project.
+    number_of_receivers : int
+        The number of receivers in the project.
+
+    Returns
+    -------
+    Project
+        The created project.
+    """
+    from django.contrib.auth.models import User
+
+    from project_management.models import Heliostat, LightSource, Project, Receiver
+
+    owner, _ = User.objects.get_or_create(username=name)
+    project = Project.objects.create(name=name, owner=owner)
+    columns = max(int(number_of_heliostats**0.5), 1)
+    Heliostat.objects.bulk_create(
+        (
+            Heliostat(
+                project=project,
+                position_x=(i % columns) * 10.0,
+                position_y=(i // columns) * 10.0,
+            )
+            for i in range(number_of_heliostats)
+        ),
+        batch_size=1000,
+    )
+    Receiver.objects.bulk_create(
+        Receiver(project=project, position_x=i * 20.0)
+        for i in range(number_of_receivers)
+    )
+    LightSource.objects.create(project=project)
+    return project
+
+
+def measure(function: Callable[[], object], repeat: int) -> float:
+    """Run the function repeatedly and return the median wall time in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
@@ -51,6 +51,34 @@ folder_not_found_text = (
     "The folder ``{folder}`` selected to save the scenario does not exist. "
     "Please create the folder or adjust the file path before running again!"
 )
+scenario_export_timed_out_text = (
+    "The export is taking longer than expected, please try again later."
+)
+"""Message shown when the export pool did not generate a scenario in time."""
+invalid_export_profile_text = "Unknown export profile."
+"""Message shown when a download requests an export profile that does not exist."""
+invalid_api_token_text = "Invalid or expired api token."
+"""Message shown when a request authenticates with an unknown or expired api token."""
+invalid_page_size_text = "The page size must be a positive integer."
+"""Message shown when a list is requested with an invalid page size."""
+invalid_cursor_text = "Invalid cursor."
+"""Message shown when a list is requested with a cursor that was not issued by the api."""
+invalid_bounding_box_text = (
+    "The bounding box must be four numbers: min_x,min_y,max_x,max_y."
+)
+"""Message shown when a list is requested with an invalid bounding box."""
+job_without_project_text = "The project of the job no longer exists."
+"""Error of a job whose project was deleted before it ran."""
+job_worker_crashed_text = "The job engine stopped while running the job."
+"""Error of a job whose worker process crashed, e.g. because it ran out of memory."""
+job_result_evicted_text = "The result of the job was removed before it could be saved."
+"""Error of a job whose result was evicted from the result cache before the job referenced it."""
+changes_pruned_text = (
+    "The changes since this revision are no longer kept, load the whole project again."
+)
+"""Message shown when the changes of a project are requested since a pruned revision."""
+invalid_job_priority_text = "The priority of a job must be an integer."
+"""Message shown when a job is created with an invalid priority."""
 project_name_must_be_unique = "The project name must be unique"
 """Message shown when a project name is not unique."""
 new_password_prompt = "Please enter a new password."
@@ -17,6 +17,64 @@ from pathlib import Path
 BASE_DIR = Path(__file__).resolve().parent.parent
 HDF5_SCENARIO_DIR = BASE_DIR / "hdf5_management" / "scenarios"
 
+# Fitted surface prototypes, stored content-addressed by STRAL file and fit hyperparameters
+SURFACE_PROTOTYPE_CACHE_DIR = BASE_DIR / "hdf5_management" / "cache" / "surfaces"
+# Number of surface prototypes additionally kept in memory by every process
+SURFACE_PROTOTYPE_CACHE_SIZE = 4
+
+# Generated scenarios, stored by project, export profile and revision for repeated downloads
+SCENARIO_CACHE_DIR = BASE_DIR / "hdf5_management" / "cache" / "scenarios"
+# Size limit of the scenario cache, the least recently downloaded scenarios are evicted first
+SCENARIO_CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024
+# "cache" serves downloads from the scenario cache, "memory" builds every download in memory
+SCENARIO_EXPORT_MODE = os.environ.get("SCENARIO_EXPORT_MODE", "cache")
+# Scenarios built in memory that are larger than this are spooled to a temporary file
+SCENARIO_SPOOL_MAX_BYTES = 64 * 1024 * 1024
+# Number of processes generating scenarios started by each web process, 0 generates them in the web worker
+SCENARIO_EXPORT_WORKERS_PER_PROCESS = 2
+# Number of threads torch may use in each of these processes
+SCENARIO_EXPORT_TORCH_THREADS = 1
+# Seconds a download waits for its scenario before giving up
+SCENARIO_EXPORT_TIMEOUT = 300
+
+# Uploaded projects are stored here until their import is done
+PROJECT_IMPORT_DIR = BASE_DIR / "project_management" / "imports"
+# Number of threads importing uploaded projects, 0 imports them in the request
+PROJECT_IMPORT_WORKERS = 2
+
+# Seconds the user of an api token is kept in memory, bounds how long a deleted token still works
+API_TOKEN_CACHE_SECONDS = 60
+# Number of api tokens kept in memory by every process
+API_TOKEN_CACHE_SIZE = 1024
+
+# Seconds successive autosave updates of the same object are merged before being written, 0 writes every update
+AUTOSAVE_COALESCE_SECONDS = 0.5
+# Number of times writing queued autosave updates is tried before they are dropped
+AUTOSAVE_WRITE_ATTEMPTS = 3
+# Number of revisions the deletions in a project are kept for syncing, older clients load the whole project
+TOMBSTONE_RETENTION_REVISIONS = 1000
+
+# Results of ray tracing jobs, served to their owners only
+JOB_RESULT_DIR = BASE_DIR / "job_interface" / "results"
+# Size limit of the job results, results no job references anymore are evicted first
+JOB_RESULT_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+# Number of processes running ray tracing jobs started by each web process, 0 runs them in the request
+JOB_WORKERS_PER_PROCESS = 1
+# Number of threads torch may use in each of these processes
+JOB_TORCH_THREADS = 2
+# Number of jobs each user may run at once, further jobs wait in the queue
+JOB_MAX_RUNNING_PER_USER = 1
+# Seconds the run_job_worker command waits before looking at an empty queue again
+JOB_POLL_SECONDS = 5
+# Seconds between two reads of the job statuses by a stream of job events
+JOB_EVENTS_POLL_SECONDS = 0.5
+# Seconds after which a stream of job events ends and the browser reconnects
+JOB_EVENTS_MAX_SECONDS = 300
+# Resolution of the flux density bitmaps in both directions
+JOB_BITMAP_RESOLUTION = 256
+# Number of heliostats ray traced at once, bounds the memory used by a job
+JOB_RAY_TRACING_BATCH_SIZE = 100
+
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/4.2/howto/deployment/checklist/
@@ -43,6 +101,7 @@ INSTALLED_APPS = [
     "django.contrib.staticfiles",
     "editor",
     "autosave_api",
+    "hdf5_management",
     "job_interface",
     "project_management",
     "account_management",
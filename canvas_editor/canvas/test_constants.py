@@ -124,6 +124,9 @@ LIGHT_SOURCE_COVARIANCE = 4.3681e-06
 # job interface
 
 STATUS = "status"
+STAGE = "stage"
 PROGRESS = "progress"
-FINISHED = "Finished"
+FINISHED = "finished"
+FAILED = "failed"
 RESULT = "result"
+ERROR = "error"
@@ -17,15 +17,23 @@ account_invalid_uid_view = "invalid_uid"
 account_test_project_view = "test_project"
 
 # Autosave api
+autosave_api_token_detail_view = "api_token_detail"
+autosave_api_token_list_view = "api_token_list"
+autosave_heliostat_bulk_view = "heliostat_bulk"
 autosave_heliostat_detail_view = "heliostat_detail"
 autosave_heliostat_list_view = "heliostat_list"
+autosave_light_source_bulk_view = "light_source_bulk"
 autosave_light_source_detail_view = "light_source_detail"
 autosave_light_source_list_view = "light_source_list"
+autosave_project_changes_view = "project_changes"
 autosave_project_detail_list_view = "project_detail"
 autosave_project_list_view = "project_list"
+autosave_project_operations_view = "project_operations"
+autosave_receiver_bulk_view = "receiver_bulk"
 autosave_receiver_detail_view = "receiver_detail"
 autosave_receiver_list_view = "receiver_list"
 autosave_settings_detail_view = "settings_detail"
+autosave_write_behind_metrics_view = "write_behind_metrics"
 autosave_project_detail_view = "project_detail"
 
 # editor
@@ -37,6 +45,9 @@ editor_preview_upload_view = "upload"
 # job interface
 job_create_new_job_view = "createNewJob"
 job_status_view = "jobStatus"
+job_result_view = "jobResult"
+job_project_status_view = "projectJobStatus"
+job_events_view = "jobEvents"
 
 # project management
 project_update_project_view = "updateProject"
@@ -46,3 +57,5 @@ project_duplicate_project_view = "duplicateProject"
 project_share_project_view = "shareProject"
 project_shared_projects_view = "sharedProjects"
 project_projects_view = "projects"
+project_import_view = "importProject"
+project_import_status_view = "importStatus"
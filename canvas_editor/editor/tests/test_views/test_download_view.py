@@ -1,9 +1,14 @@
 import io
+import os
+import pathlib
+import tempfile
+import threading
+from unittest import mock
 
 import h5py
 from artist.util import config_dictionary
 from django.contrib.auth.models import User
-from django.test import Client, TestCase
+from django.test import Client, TestCase, TransactionTestCase
 from django.urls import reverse
 
 from canvas.test_constants import (
@@ -14,7 +19,17 @@ from canvas.test_constants import (
     TEST_USERNAME,
 )
 from canvas.view_name_dict import editor_download_view
-from project_management.models import Heliostat, LightSource, Project, Receiver
+from hdf5_management.export_executor import scenario_exports
+from hdf5_management.hdf5_manager import HDF5Manager
+from hdf5_management.scenario_cache import scenario_cache
+from hdf5_management.tests.test_single_flight import THREADS, wait_for_participants
+from project_management.models import (
+    Heliostat,
+    LightSource,
+    Project,
+    Receiver,
+    Settings,
+)
 
 
 class DownloadViewTest(TestCase):
@@ -22,6 +37,16 @@ class DownloadViewTest(TestCase):
 
     def setUp(self):
         """Set up a test user, log in, and create a test project with components for use in all tests."""
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.directory = pathlib.Path(temporary_directory.name)
+        settings_override = self.settings(
+            SCENARIO_CACHE_DIR=self.directory / "cache",
+            SCENARIO_EXPORT_WORKERS_PER_PROCESS=0,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
         self.download = reverse(
             editor_download_view,
             kwargs={PROJECT_NAME_FIELD: TEST_PROJECT_NAME},
@@ -32,14 +57,14 @@ class DownloadViewTest(TestCase):
         self.client = Client()
         self.client.login(username=TEST_USERNAME, password=SECURE_PASSWORD)
 
-        project = Project()
+        self.project = project = Project()
         project.name = TEST_PROJECT_NAME
         project.description = TEST_PROJECT_DESCRIPTION
         project.owner = user
         project.save()
 
         # Add a heliostat to the project
-        heliostat = Heliostat()
+        self.heliostat = heliostat = Heliostat()
         heliostat.name = "testHeliostat"
         heliostat.project = project
         heliostat.position_x = 42
@@ -99,3 +124,256 @@ class DownloadViewTest(TestCase):
         self.client.logout()
         response = self.client.get(self.download)
         self.assertEqual(response.status_code, 302)
+
+    def _fake_scenario_generation(self):
+        """Replace the scenario generation by writing numbered stand-in files."""
+        generated_scenarios = []
+
+        def create_hdf5_file(user, project, profile=None):
+            generated_scenarios.append((project, profile))
+            file_descriptor, name = tempfile.mkstemp(dir=self.directory, suffix=".h5")
+            with os.fdopen(file_descriptor, "wb") as scenario_file:
+                scenario_file.write(f"scenario {len(generated_scenarios)}".encode())
+            return pathlib.Path(name)
+
+        patches = [
+            mock.patch.object(
+                HDF5Manager, "create_hdf5_file", side_effect=create_hdf5_file
+            ),
+            mock.patch.object(
+                HDF5Manager,
+                "prototype_version",
+                side_effect=lambda profile=Settings.FITTED: f"test-{profile}",
+            ),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        return generated_scenarios
+
+    def test_repeated_download_uses_cached_scenario(self):
+        """Test that downloading an unchanged project twice generates the scenario once."""
+        generated_scenarios = self._fake_scenario_generation()
+
+        first = b"".join(self.client.get(self.download).streaming_content)
+        second = b"".join(self.client.get(self.download).streaming_content)
+
+        self.assertEqual(len(generated_scenarios), 1)
+        self.assertEqual(first, b"scenario 1")
+        self.assertEqual(first, second)
+
+    def test_download_after_edit_regenerates_scenario(self):
+        """Test that editing the project invalidates the cached scenario."""
+        generated_scenarios = self._fake_scenario_generation()
+        first_response = self.client.get(self.download)
+        b"".join(first_response.streaming_content)
+
+        # Edits are saved with a new revision of the project, like the autosave api does
+        self.heliostat.position_y = 42
+        self.heliostat.revision = self.project.next_revision()
+        self.heliostat.save()
+        second_response = self.client.get(self.download)
+
+        self.assertEqual(len(generated_scenarios), 2)
+        self.assertEqual(b"".join(second_response.streaming_content), b"scenario 2")
+        self.assertNotEqual(first_response["ETag"], second_response["ETag"])
+        self.assertEqual(len(list((self.directory / "cache").iterdir())), 1)
+
+    def test_download_of_evicted_scenario(self):
+        """Test that a scenario evicted before it could be opened is generated again."""
+        generated_scenarios = self._fake_scenario_generation()
+
+        with mock.patch.object(scenario_cache, "open", return_value=None):
+            response = self.client.get(self.download)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), b"scenario 2")
+        self.assertEqual(len(generated_scenarios), 2)
+        self.assertEqual([path.name for path in self.directory.iterdir()], ["cache"])
+
+    def test_download_not_modified(self):
+        """Test that a download revalidated with a matching ETag returns 304."""
+        generated_scenarios = self._fake_scenario_generation()
+        etag = self.client.get(self.download)["ETag"]
+
+        response = self.client.get(self.download, headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(len(generated_scenarios), 1)
+
+    def test_download_range(self):
+        """Test that a partial download can be resumed with a range request."""
+        self._fake_scenario_generation()
+        etag = self.client.get(self.download)["ETag"]
+
+        response = self.client.get(
+            self.download, headers={"Range": "bytes=2-5", "If-Range": etag}
+        )
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Range"], "bytes 2-5/10")
+        self.assertEqual(b"".join(response.streaming_content), b"enar")
+
+    def test_download_range_outdated(self):
+        """Test that a range of an outdated version is answered with the whole file."""
+        self._fake_scenario_generation()
+
+        response = self.client.get(
+            self.download, headers={"Range": "bytes=2-5", "If-Range": '"outdated"'}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), b"scenario 1")
+
+    def test_download_range_not_satisfiable(self):
+        """Test that a range beyond the end of the file returns 416."""
+        self._fake_scenario_generation()
+
+        response = self.client.get(self.download, headers={"Range": "bytes=100-"})
+
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], "bytes */10")
+
+    def test_download_in_memory(self):
+        """Test that the in-memory export generates every download and leaves no files."""
+        generated_scenarios = self._fake_scenario_generation()
+
+        with self.settings(SCENARIO_EXPORT_MODE="memory"):
+            first = self.client.get(self.download)
+            second = self.client.get(self.download)
+
+        self.assertEqual(b"".join(first.streaming_content), b"scenario 1")
+        self.assertEqual(b"".join(second.streaming_content), b"scenario 2")
+        self.assertEqual(first["ETag"], second["ETag"])
+        self.assertEqual(len(generated_scenarios), 2)
+        self.assertEqual(list(self.directory.iterdir()), [])
+
+    def test_scenario_buffer_spools_large_scenarios(self):
+        """Test that scenarios above the spool threshold are moved out of memory."""
+        self._fake_scenario_generation()
+
+        with self.settings(SCENARIO_SPOOL_MAX_BYTES=1024):
+            small_buffer = HDF5Manager.create_hdf5_buffer(None, self.project)
+        with self.settings(SCENARIO_SPOOL_MAX_BYTES=4):
+            large_buffer = HDF5Manager.create_hdf5_buffer(None, self.project)
+
+        for scenario_buffer in (small_buffer, large_buffer):
+            self.addCleanup(scenario_buffer.close)
+        self.assertFalse(small_buffer._rolled)
+        self.assertTrue(large_buffer._rolled)
+        self.assertEqual(large_buffer.read(), b"scenario 2")
+
+    def test_download_export_profile(self):
+        """Test that the export profile is taken from the settings or the query parameter."""
+        generated_scenarios = self._fake_scenario_generation()
+        fitted_etag = self.client.get(self.download)["ETag"]
+        ideal_etag = self.client.get(self.download, {"profile": Settings.IDEAL})["ETag"]
+
+        self.project.settings.export_profile = Settings.IDEAL
+        self.project.settings.save()
+        self.assertEqual(self.client.get(self.download)["ETag"], ideal_etag)
+
+        self.assertNotEqual(fitted_etag, ideal_etag)
+        self.assertEqual(
+            [profile for _, profile in generated_scenarios],
+            [Settings.FITTED, Settings.IDEAL],
+        )
+
+    def test_download_invalid_export_profile(self):
+        """Test that an unknown export profile returns 400."""
+        response = self.client.get(self.download, {"profile": "unknown"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_download_export_timeout(self):
+        """Test that a download whose scenario is not generated in time returns 503."""
+        with (
+            mock.patch.object(HDF5Manager, "prototype_version", return_value="test"),
+            mock.patch(
+                "editor.views.download_view.export_scenario", side_effect=TimeoutError
+            ),
+        ):
+            response = self.client.get(self.download)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertTrue(response.has_header("Retry-After"))
+
+
+class ConcurrentDownloadTest(TransactionTestCase):
+    """Tests for concurrent downloads of the same project."""
+
+    def setUp(self):
+        """Create a test project and fake its scenario generation."""
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.directory = pathlib.Path(temporary_directory.name)
+
+        self.user = User.objects.create_user(
+            username=TEST_USERNAME, password=SECURE_PASSWORD
+        )
+        self.project = Project.objects.create(name=TEST_PROJECT_NAME, owner=self.user)
+        Heliostat.objects.create(project=self.project)
+        self.download = reverse(
+            editor_download_view,
+            kwargs={PROJECT_NAME_FIELD: TEST_PROJECT_NAME},
+        )
+
+    def _download_in_threads(self):
+        """Download the project from several threads at once."""
+        downloads = []
+        downloads_lock = threading.Lock()
+        # Logging in writes to the database, which SQLite does not allow concurrently.
+        clients = [Client() for _ in range(THREADS)]
+        for client in clients:
+            client.force_login(self.user)
+
+        def download(client):
+            response = client.get(self.download)
+            content = b"".join(response.streaming_content)
+            with downloads_lock:
+                downloads.append(content)
+
+        threads = [
+            threading.Thread(target=download, args=(client,)) for client in clients
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+        return downloads
+
+    def _generate_scenario(self, user, project, profile=None):
+        """Write a stand-in scenario once all downloads wait for it."""
+        flight_key = next(iter(scenario_exports._flights))
+        wait_for_participants(scenario_exports, flight_key, THREADS)
+        file_descriptor, name = tempfile.mkstemp(dir=self.directory, suffix=".h5")
+        with os.fdopen(file_descriptor, "wb") as scenario_file:
+            scenario_file.write(b"scenario")
+        return pathlib.Path(name)
+
+    def test_concurrent_downloads_generate_once(self):
+        """Test that concurrent downloads of the same scenario share one generation."""
+        for export_mode in ["cache", "memory"]:
+            with (
+                self.subTest(export_mode=export_mode),
+                self.settings(
+                    SCENARIO_CACHE_DIR=self.directory / export_mode,
+                    SCENARIO_EXPORT_MODE=export_mode,
+                    SCENARIO_EXPORT_WORKERS_PER_PROCESS=0,
+                ),
+                mock.patch.object(
+                    HDF5Manager, "prototype_version", return_value="test"
+                ),
+                mock.patch.object(
+                    HDF5Manager, "create_hdf5_file", side_effect=self._generate_scenario
+                ) as create_hdf5_file,
+            ):
+                downloads = self._download_in_threads()
+
+                create_hdf5_file.assert_called_once()
+                self.assertEqual(downloads, [b"scenario"] * THREADS)
+                # Only the cached scenario is left.
+                self.assertEqual(
+                    [path.name for path in self.directory.glob("*.h5")], []
+                )
@@ -1,39 +1,102 @@
+from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import FileResponse
+from django.http import FileResponse, HttpResponse, HttpResponseBadRequest
 from django.shortcuts import get_object_or_404
 from django.views import View
 
+from autosave_api.write_behind import write_behind
+from canvas.message_dict import (
+    invalid_export_profile_text,
+    scenario_export_timed_out_text,
+)
+from editor.views.utils import not_modified_response, ranged_file_response
+from hdf5_management.export_executor import export_scenario, scenario_exports
 from hdf5_management.hdf5_manager import HDF5Manager
-from project_management.models import Project
+from hdf5_management.scenario_cache import compute_scenario_hash, scenario_cache
+from project_management.models import Project, Settings
 
 
 class DownloadView(LoginRequiredMixin, View):
     """Converts the specified project into an hdf5 file and downloads it."""
 
     def get(self, request, project_name):
-        """Create and download the hdf5 file."""
+        """Download the hdf5 file, creating it only if the project changed since the last download."""
         project = get_object_or_404(Project, name=project_name, owner=request.user)
 
-        path = HDF5Manager.create_hdf5_file(request.user, project)
+        # The query parameter overrides the export profile of the project settings.
+        profile = request.GET.get("profile") or project.settings.export_profile
+        if profile not in dict(Settings.EXPORT_PROFILE_CHOICES):
+            return HttpResponseBadRequest(invalid_export_profile_text)
 
-        f = open(path, "rb")
-        response = FileResponse(f, as_attachment=True, filename=project_name + ".h5")
+        # The scenario has to contain the updates still queued by the autosave api.
+        write_behind.flush(project.pk)
 
-        original_close = response.close
+        # The scenario hash changes with every edit, so it also serves as entity tag.
+        scenario_hash = compute_scenario_hash(
+            project, HDF5Manager.prototype_version(profile)
+        )
+        etag = f'"{scenario_hash}"'
+        response = not_modified_response(request, etag)
+        if response is not None:
+            return response
 
-        def close_and_cleanup(*args, **kwargs):
+        # Concurrent downloads of the same scenario share one generation.
+        flight_key = (project.pk, scenario_hash)
+        if settings.SCENARIO_EXPORT_MODE == "memory":
+            # Nothing is left on disk, at the cost of generating the scenario for every download.
             try:
-                try:
-                    if not f.closed:
-                        f.close()
-                finally:
-                    # Delete the temporary file after sending it
-                    try:
-                        path.unlink()
-                    except FileNotFoundError:
-                        pass
+                with scenario_exports.share(
+                    flight_key,
+                    lambda: export_scenario(request.user, project, profile),
+                    cleanup=lambda path: path.unlink(missing_ok=True),
+                ) as scenario_path:
+                    scenario_buffer = HDF5Manager.spool_scenario(scenario_path)
+            except TimeoutError:
+                return self._export_timed_out()
+            response = FileResponse(
+                scenario_buffer, as_attachment=True, filename=project_name + ".h5"
+            )
+            response["ETag"] = etag
+            return response
+
+        scenario_file = scenario_cache.open(project.pk, profile, scenario_hash)
+        if scenario_file is None:
+            try:
+                with scenario_exports.share(
+                    flight_key,
+                    lambda: scenario_cache.store(
+                        project.pk,
+                        profile,
+                        scenario_hash,
+                        export_scenario(request.user, project, profile),
+                    ),
+                ):
+                    scenario_file = scenario_cache.open(
+                        project.pk, profile, scenario_hash
+                    )
+            except TimeoutError:
+                return self._export_timed_out()
+        if scenario_file is None:
+            # The new entry was evicted before it was opened, so this download skips the cache.
+            try:
+                scenario_path = export_scenario(request.user, project, profile)
+            except TimeoutError:
+                return self._export_timed_out()
+            try:
+                scenario_file = HDF5Manager.spool_scenario(scenario_path)
             finally:
-                original_close(*args, **kwargs)
+                scenario_path.unlink(missing_ok=True)
+
+        return ranged_file_response(
+            request,
+            scenario_file,
+            filename=project_name + ".h5",
+            etag=etag,
+        )
 
-        response.close = close_and_cleanup
+    @staticmethod
+    def _export_timed_out() -> HttpResponse:
+        """Ask the client to retry once the busy export pool has caught up."""
+        response = HttpResponse(scenario_export_timed_out_text, status=503)
+        response["Retry-After"] = "30"
         return response
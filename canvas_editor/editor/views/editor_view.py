@@ -1,10 +1,11 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.shortcuts import get_object_or_404
+from django.shortcuts import get_object_or_404, redirect
 from django.utils import timezone
 from django.views.generic import TemplateView
 
+from canvas import view_name_dict
 from project_management.forms.project_form import ProjectForm
-from project_management.models import Project
+from project_management.models import Project, ProjectImport
 
 
 class EditorView(LoginRequiredMixin, TemplateView):
@@ -12,6 +13,19 @@ class EditorView(LoginRequiredMixin, TemplateView):
 
     template_name = "editor/editor.html"
 
+    def get(self, request, *args, **kwargs):
+        """Render the editor, or the import progress while the project is being imported."""
+        project_name = self.kwargs.get("project_name")
+        if ProjectImport.objects.filter(
+            project__owner=request.user,
+            project__name=project_name,
+            status__in=[ProjectImport.PENDING, ProjectImport.RUNNING],
+        ).exists():
+            return redirect(
+                view_name_dict.project_import_view, project_name=project_name
+            )
+        return super().get(request, *args, **kwargs)
+
     def get_context_data(self, **kwargs):
         """Get the context of the editor page."""
         context = super().get_context_data(**kwargs)
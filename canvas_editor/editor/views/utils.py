@@ -0,0 +1,149 @@
+import os
+import re
+from typing import BinaryIO
+
+from django.http import (
+    FileResponse,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseNotModified,
+    StreamingHttpResponse,
+)
+from django.utils.http import content_disposition_header
+
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+"""Matches a single byte range, multiple ranges are answered with the whole file."""
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """Parse a range header into the first and last byte position.
+
+    Returns None for a malformed header and raises ValueError for an unsatisfiable range.
+    """
+    match = RANGE_PATTERN.match(header.strip())
+    if match is None:
+        return None
+    start, end = match.groups()
+    if not start and not end:
+        return None
+    if not start:
+        # A suffix range requests the last bytes of the file.
+        length = int(end)
+        if length == 0:
+            raise ValueError(header)
+        return max(size - length, 0), size - 1
+    first, last = int(start), int(end) if end else size - 1
+    if first >= size or last < first:
+        raise ValueError(header)
+    return first, min(last, size - 1)
+
+
+class _FileRange:
+    """Iterates over a byte range of a file, closing the file with the response."""
+
+    def __init__(self, file: BinaryIO, first: int, last: int):
+        """Wrap the bytes from first to last of the file."""
+        self.file = file
+        self.first = first
+        self.last = last
+
+    def __iter__(self):
+        """Yield the range in chunks."""
+        self.file.seek(self.first)
+        remaining = self.last - self.first + 1
+        while remaining > 0:
+            chunk = self.file.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+    def close(self):
+        """Close the file."""
+        self.file.close()
+
+
+def not_modified_response(request: HttpRequest, etag: str) -> HttpResponse | None:
+    """Create a 304 response if the client's copy matches the entity tag.
+
+    Parameters
+    ----------
+    request : HttpRequest
+        The request that may carry an If-None-Match header.
+    etag : str
+        The quoted entity tag of the current version.
+
+    Returns
+    -------
+    HttpResponse | None
+        The 304 response or None if the client needs the current version.
+    """
+    if_none_match = request.headers.get("If-None-Match", "")
+    if etag not in [tag.strip() for tag in if_none_match.split(",")]:
+        return None
+    response = HttpResponseNotModified()
+    response["ETag"] = etag
+    return response
+
+
+def ranged_file_response(
+    request: HttpRequest, file: BinaryIO, filename: str, etag: str
+) -> HttpResponse:
+    """Create a file download that supports revalidation and resumption.
+
+    Parameters
+    ----------
+    request : HttpRequest
+        The request for the file.
+    file : BinaryIO
+        The opened file, it is closed once the response is done with it.
+    filename : str
+        The name of the downloaded file.
+    etag : str
+        The quoted entity tag of the file.
+
+    Returns
+    -------
+    HttpResponse
+        A 304 if the client's copy is still valid, a 206 for a satisfiable range request,
+        a 416 for an unsatisfiable one and the whole file otherwise.
+    """
+    response = not_modified_response(request, etag)
+    if response is not None:
+        file.close()
+        return response
+
+    size = os.fstat(file.fileno()).st_size
+    byte_range = None
+    range_header = request.headers.get("Range")
+    # A range only applies to the version of the file the client already has parts of.
+    if range_header and request.headers.get("If-Range", etag) == etag:
+        try:
+            byte_range = _parse_range(range_header, size)
+        except ValueError:
+            file.close()
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            response["ETag"] = etag
+            return response
+
+    if byte_range is None:
+        response = FileResponse(file, as_attachment=True, filename=filename)
+    else:
+        first, last = byte_range
+        response = StreamingHttpResponse(
+            _FileRange(file, first, last),
+            status=206,
+            content_type="application/x-hdf5",
+        )
+        response["Content-Range"] = f"bytes {first}-{last}/{size}"
+        response["Content-Length"] = str(last - first + 1)
+        response["Content-Disposition"] = content_disposition_header(
+            as_attachment=True, filename=filename
+        )
+
+    response["Accept-Ranges"] = "bytes"
+    response["ETag"] = etag
+    return response
@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class HDF5ManagementConfig(AppConfig):
+    """Configuration for the hdf5_management app."""
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "hdf5_management"
@@ -0,0 +1,152 @@
+"""A module for generating scenarios in a dedicated pool of processes.
+
+Scenario generation runs torch, whose intra-op threads occupy every core. Running it in
+the web workers lets a few parallel downloads starve all other requests, so it runs in a
+bounded pool of long-lived processes instead. Each process imports torch and ARTIST and
+warms the surface prototype cache once, and limits the number of threads torch may use.
+
+The pool is started lazily by every web process that exports a scenario, so its size
+``SCENARIO_EXPORT_WORKERS_PER_PROCESS`` is a limit per web process. A server with N web
+processes runs up to N times as many exporting processes, size both settings together.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import multiprocessing
+import os
+import pathlib
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+
+from hdf5_management.single_flight import SingleFlight
+
+# Worker processes import this module before Django is set up, so models are imported late.
+if TYPE_CHECKING:
+    from django.contrib.auth.models import User
+
+    from project_management.models import Project
+
+logger = logging.getLogger(__name__)
+
+scenario_exports = SingleFlight()
+"""Deduplicates concurrent exports of the same scenario within this process."""
+
+_executor: ProcessPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _initialize_worker(torch_threads: int):
+    """Prepare a new worker process for generating scenarios."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "canvas.settings")
+    import django
+
+    django.setup()
+
+    import torch
+
+    torch.set_num_threads(torch_threads)
+
+    from hdf5_management.hdf5_manager import HDF5Manager
+
+    try:
+        HDF5Manager.warm_surface_prototype_cache()
+    except Exception:
+        # The worker is still usable, the first export fits the surface instead.
+        logger.exception("Warming the surface prototype cache failed")
+
+
+def _create_hdf5_file(user_id: int, project_id: int, profile: str | None) -> str:
+    """Generate the scenario of a project inside a worker process."""
+    from django.contrib.auth.models import User
+    from django.db import close_old_connections
+
+    from hdf5_management.hdf5_manager import HDF5Manager
+    from project_management.models import Project
+
+    close_old_connections()
+    try:
+        user = User.objects.get(pk=user_id)
+        project = Project.objects.get(pk=project_id)
+        return str(HDF5Manager.create_hdf5_file(user, project, profile))
+    finally:
+        close_old_connections()
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Get the process pool of this web process, creating it on first use or after it broke."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.SCENARIO_EXPORT_WORKERS_PER_PROCESS,
+                # Forking a process with running threads is unsafe, so workers are spawned.
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_initialize_worker,
+                initargs=(settings.SCENARIO_EXPORT_TORCH_THREADS,),
+            )
+        return _executor
+
+
+def _discard_executor(executor: ProcessPoolExecutor):
+    """Drop a broken pool, so the next export starts a new one."""
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _remove_abandoned_scenario(future: Future):
+    """Remove a scenario nobody waits for anymore."""
+    if not future.cancelled() and future.exception() is None:
+        pathlib.Path(future.result()).unlink(missing_ok=True)
+
+
+def export_scenario(
+    user: User, project: Project, profile: str | None = None
+) -> pathlib.Path:
+    """Generate the scenario of a project in the export pool and wait for it.
+
+    Parameters
+    ----------
+    user : User
+        The user associated with the project.
+    project : Project
+        The project to be converted to an HDF5 file.
+    profile : str | None
+        The export profile, defaults to the export profile in the project settings.
+
+    Returns
+    -------
+    pathlib.Path
+        The path to the generated scenario.
+
+    Raises
+    ------
+    TimeoutError
+        If the scenario is not generated within ``SCENARIO_EXPORT_TIMEOUT`` seconds.
+    """
+    if settings.SCENARIO_EXPORT_WORKERS_PER_PROCESS == 0:
+        from hdf5_management.hdf5_manager import HDF5Manager
+
+        return HDF5Manager.create_hdf5_file(user, project, profile)
+
+    executor = _get_executor()
+    try:
+        future = executor.submit(_create_hdf5_file, user.pk, project.pk, profile)
+        return pathlib.Path(future.result(timeout=settings.SCENARIO_EXPORT_TIMEOUT))
+    except BrokenProcessPool:
+        _discard_executor(executor)
+        raise
+    except concurrent.futures.TimeoutError:
+        future.add_done_callback(_remove_abandoned_scenario)
+        raise TimeoutError(
+            f"Generating the scenario of {project} took longer than "
+            f"{settings.SCENARIO_EXPORT_TIMEOUT} seconds"
+        ) from None
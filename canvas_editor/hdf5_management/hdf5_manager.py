@@ -1,34 +1,62 @@
-"""A module for managing hdf5 files in Canvas."""
+"""A module for managing hdf5 files in Canvas.
 
+torch, h5py and ARTIST take seconds and hundreds of MB to import, so they are only
+imported inside the methods exporting or importing a project. Every other process, like
+web workers that never export and management commands, starts without them.
+"""
+
+from __future__ import annotations
+
+import logging
 import os
 import pathlib
+import shutil
+import tempfile
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, BinaryIO
 
-import h5py
-import torch
-from artist.data_parser import stral_scenario_parser
-from artist.scenario.configuration_classes import (
-    ActuatorConfig,
-    ActuatorPrototypeConfig,
-    HeliostatConfig,
-    HeliostatListConfig,
-    KinematicPrototypeConfig,
-    LightSourceConfig,
-    LightSourceListConfig,
-    PowerPlantConfig,
-    PrototypeConfig,
-    SurfacePrototypeConfig,
-    TargetAreaConfig,
-    TargetAreaListConfig,
-)
-from artist.scenario.h5_scenario_generator import H5ScenarioGenerator
-from artist.scenario.surface_generator import SurfaceGenerator
-from artist.util import config_dictionary, set_logger_config
 from django.conf import settings
 from django.contrib.auth.models import User
+from django.db import transaction
 
 from canvas.message_dict import folder_not_found_text
 from canvas.path_dict import SCENARIO_EXT, SCENARIO_FILE_SUFFIX, TEST_STRAL_DATA_PATH
+from hdf5_management.surface_cache import surface_prototype_cache
 from project_management.models import Heliostat, LightSource, Project, Receiver
+from project_management.models import Settings as ProjectSettings
+
+if TYPE_CHECKING:
+    import h5py
+    import torch
+    from artist.scenario.configuration_classes import (
+        PrototypeConfig,
+        SurfacePrototypeConfig,
+    )
+
+logger = logging.getLogger(__name__)
+
+IMPORT_BATCH_SIZE = 1000
+"""Number of rows inserted per query when importing a project."""
+
+NURBS_FIT_LEARNING_RATE = 1e-3
+"""Initial learning rate of the NURBS surface fit."""
+
+NURBS_FIT_SCHEDULER_PARAMETERS = {
+    "mode": "min",
+    "factor": 0.2,
+    "patience": 50,
+    "threshold": 1e-7,
+    "threshold_mode": "abs",
+}
+"""Parameters of the learning rate scheduler of the NURBS surface fit."""
+
+SURFACE_PROFILE_ATTRIBUTE = "canvas_surface_profile"
+"""Attribute of the scenario file recording which kind of surface prototype it contains."""
+
+PROTOTYPE_CONFIG_VERSION = 1
+"""Version of the kinematic and actuator prototypes, increase it whenever they change."""
 
 
 class HDF5Manager:
@@ -48,7 +76,9 @@ class HDF5Manager:
             return x
 
     @staticmethod
-    def create_hdf5_file(user: User, project: Project) -> pathlib.Path:
+    def create_hdf5_file(
+        user: User, project: Project, profile: str | None = None
+    ) -> pathlib.Path:
         """Create a HDF5 file for the given project.
 
         Parameters
@@ -57,17 +87,29 @@ class HDF5Manager:
             The user associated with the project.
         project : Project
             The project to be converted to an HDF5 file.
+        profile : str | None
+            The export profile, either the fitted or the ideal surface. Defaults to the
+            export profile in the project settings.
 
         Returns
         -------
         Path
             The path to where the hdf5 file is stored
         """
+        import h5py
+        import torch
+        from artist.scenario.configuration_classes import PowerPlantConfig
+        from artist.scenario.h5_scenario_generator import H5ScenarioGenerator
+        from artist.util import set_logger_config
+
         # Set up logger.
         set_logger_config()
 
         device = HDF5Manager._pick_device()
 
+        if profile is None:
+            profile = project.settings.export_profile
+
         scenario_path = HDF5Manager._prepare_paths(user, project)
 
         # Include the power plant configuration.
@@ -86,7 +128,9 @@ class HDF5Manager:
         )
 
         # Include the prototype configuration.
-        prototype_config = HDF5Manager._create_prototype_config(device=device)
+        prototype_config = HDF5Manager._create_prototype_config(
+            device=device, profile=profile
+        )
 
         # Include the heliostat prototype config.
         heliostats_list_config = HDF5Manager._create_heliostat_config(
@@ -105,23 +149,88 @@ class HDF5Manager:
         # Generate the scenario and save it to the specified HDF5 file.
         scenario_generator.generate_scenario()
 
-        return scenario_path.with_suffix(SCENARIO_EXT)
+        # Record the kind of surface, so consumers of the file can tell them apart.
+        scenario_path = scenario_path.with_suffix(SCENARIO_EXT)
+        with h5py.File(scenario_path, "a") as hdf5_file:
+            hdf5_file.attrs[SURFACE_PROFILE_ATTRIBUTE] = profile
+
+        return scenario_path
+
+    @staticmethod
+    def create_hdf5_buffer(
+        user: User, project: Project
+    ) -> tempfile.SpooledTemporaryFile:
+        """Create the HDF5 file for the given project in memory.
+
+        The scenario is kept in memory up to ``SCENARIO_SPOOL_MAX_BYTES`` and spooled to an
+        anonymous temporary file above that, which is deleted once the buffer is closed.
+
+        Parameters
+        ----------
+        user : User
+            The user associated with the project.
+        project : Project
+            The project to be converted to an HDF5 file.
+
+        Returns
+        -------
+        tempfile.SpooledTemporaryFile
+            The HDF5 file, positioned at its start.
+        """
+        scenario_path = HDF5Manager.create_hdf5_file(user, project)
+        try:
+            return HDF5Manager.spool_scenario(scenario_path)
+        finally:
+            scenario_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def spool_scenario(scenario_path: pathlib.Path) -> tempfile.SpooledTemporaryFile:
+        """Copy a generated scenario file into memory.
+
+        Parameters
+        ----------
+        scenario_path : pathlib.Path
+            The path of the generated scenario.
+
+        Returns
+        -------
+        tempfile.SpooledTemporaryFile
+            The HDF5 file, positioned at its start.
+        """
+        scenario_buffer = tempfile.SpooledTemporaryFile(
+            max_size=settings.SCENARIO_SPOOL_MAX_BYTES
+        )
+        # ARTIST's scenario generator only writes to a path, so the scenario is read back
+        # before anything is sent to the client, the file can be removed right after.
+        try:
+            with open(scenario_path, "rb") as scenario_file:
+                shutil.copyfileobj(scenario_file, scenario_buffer)
+        except BaseException:
+            scenario_buffer.close()
+            raise
+
+        scenario_buffer.seek(0)
+        return scenario_buffer
 
     @staticmethod
     def _pick_device() -> torch.device:
         """Pick the device for tensor operations, either CPU or CUDA if available."""
+        import torch
+
         return torch.device("cuda" if torch.cuda.is_available() else "cpu")
 
     @staticmethod
     def _prepare_paths(user: User, project: Project) -> pathlib.Path:
         """Prepare the paths for saving the scenario file."""
-        scenario_dir = pathlib.Path("./hdf5_management/scenarios")
+        scenario_dir = pathlib.Path(settings.HDF5_SCENARIO_DIR)
         # Check if scenario folder exists
         os.makedirs(scenario_dir, exist_ok=True)
 
         # The following parameter is the name of the scenario.
+        # It is unique per export, so concurrent exports of the same project don't clash.
         scenario_path = pathlib.Path(
-            f"{scenario_dir}/{user.id}_{project.name}{SCENARIO_FILE_SUFFIX}"
+            f"{scenario_dir}/{user.id}_{project.name}_{uuid.uuid4().hex}"
+            f"{SCENARIO_FILE_SUFFIX}"
         )
         # This checks to make sure the path you defined is valid and a scenario HDF5 can be saved there.
         if not pathlib.Path(scenario_path).parent.is_dir():
@@ -132,14 +241,99 @@ class HDF5Manager:
         return scenario_path
 
     @staticmethod
-    def _create_surface_prototype_from_stral(
-        device: torch.device,
-    ) -> SurfacePrototypeConfig:
-        """Build the surface prototype configuration from a STRAL file."""
+    def prototype_version(profile: str = ProjectSettings.FITTED) -> str:
+        """Identify the prototypes written into every scenario of an export profile.
+
+        Parameters
+        ----------
+        profile : str, optional
+            The export profile of the scenario.
+
+        Returns
+        -------
+        str
+            Changes whenever the prototype configuration of new scenarios changes.
+        """
+        surface_key = HDF5Manager._surface_prototype_cache_key(profile)
+        return f"{PROTOTYPE_CONFIG_VERSION}-{profile}-{surface_key}"
+
+    @staticmethod
+    def warm_surface_prototype_cache(
+        force: bool = False, profile: str = ProjectSettings.FITTED
+    ) -> str:
+        """Create the surface prototype and store it in the surface prototype cache.
+
+        Parameters
+        ----------
+        force : bool, optional
+            Discard an existing cache entry and create the surface again.
+        profile : str, optional
+            The export profile whose surface prototype is created.
+
+        Returns
+        -------
+        str
+            The cache key of the surface prototype.
+        """
+        key = HDF5Manager._surface_prototype_cache_key(profile)
+        if force:
+            surface_prototype_cache.discard(key)
+        HDF5Manager._create_surface_prototype_from_stral(
+            device=HDF5Manager._pick_device(), profile=profile
+        )
+        return key
+
+    @staticmethod
+    def _stral_file_path() -> pathlib.Path:
+        """Get the path to the STRAL file the surface prototype is fitted to."""
         # Set CANVAS_ROOT
         canvas_root = settings.BASE_DIR
 
-        stral_file_path = canvas_root / TEST_STRAL_DATA_PATH
+        return canvas_root / TEST_STRAL_DATA_PATH
+
+    @staticmethod
+    def _surface_prototype_cache_key(profile: str = ProjectSettings.FITTED) -> str:
+        """Get the cache key of the surface prototype of the export profile."""
+        if profile == ProjectSettings.IDEAL:
+            parameters = {"profile": profile}
+        else:
+            # The fitted surface depends on the current fit hyperparameters.
+            parameters = {
+                "learning_rate": NURBS_FIT_LEARNING_RATE,
+                "scheduler": NURBS_FIT_SCHEDULER_PARAMETERS,
+            }
+        return surface_prototype_cache.make_key(
+            HDF5Manager._stral_file_path(), parameters
+        )
+
+    @staticmethod
+    def _create_surface_prototype_from_stral(
+        device: torch.device, profile: str = ProjectSettings.FITTED
+    ) -> SurfacePrototypeConfig:
+        """Build the surface prototype configuration from a STRAL file.
+
+        The fit only depends on the STRAL file and the fit hyperparameters, so the result is
+        taken from the surface prototype cache whenever possible.
+        """
+        if profile == ProjectSettings.IDEAL:
+            factory = HDF5Manager._generate_ideal_surface_prototype
+        else:
+            factory = HDF5Manager._fit_surface_prototype
+        return surface_prototype_cache.get_or_create(
+            key=HDF5Manager._surface_prototype_cache_key(profile),
+            device=device,
+            factory=lambda: factory(device=device),
+        )
+
+    @staticmethod
+    def _fit_surface_prototype(device: torch.device) -> SurfacePrototypeConfig:
+        """Fit the surface prototype configuration to the STRAL deflectometry data."""
+        import torch
+        from artist.data_parser import stral_scenario_parser
+        from artist.scenario.configuration_classes import SurfacePrototypeConfig
+        from artist.scenario.surface_generator import SurfaceGenerator
+
+        stral_file_path = HDF5Manager._stral_file_path()
 
         (
             facet_translation_vectors,
@@ -155,17 +349,11 @@ class HDF5Manager:
 
         # Please leave the optimizable parameters empty, they will automatically be added for the surface fit.
         nurbs_fit_optimizer = torch.optim.Adam(
-            [torch.empty(1, requires_grad=True)], lr=1e-3
+            [torch.empty(1, requires_grad=True)], lr=NURBS_FIT_LEARNING_RATE
         )
         nurbs_fit_scheduler = torch.optim.lr_scheduler.ReduceLROnPlateau(
             nurbs_fit_optimizer,
-            **{
-                "mode": "min",
-                "factor": 0.2,
-                "patience": 50,
-                "threshold": 1e-7,
-                "threshold_mode": "abs",
-            },
+            **NURBS_FIT_SCHEDULER_PARAMETERS,
         )
 
         # Use this surface config for fitted deflectometry surfaces.
@@ -180,23 +368,58 @@ class HDF5Manager:
             device=device,
         )
 
+        surface_prototype_config = SurfacePrototypeConfig(
+            facet_list=surface_config.facet_list
+        )
+        return surface_prototype_config
+
+    @staticmethod
+    def _generate_ideal_surface_prototype(
+        device: torch.device,
+    ) -> SurfacePrototypeConfig:
+        """Build an ideal surface prototype configuration with the facets of the STRAL data."""
+        from artist.data_parser import stral_scenario_parser
+        from artist.scenario.configuration_classes import SurfacePrototypeConfig
+        from artist.scenario.surface_generator import SurfaceGenerator
+
+        (
+            facet_translation_vectors,
+            canting,
+            _,
+            _,
+        ) = stral_scenario_parser.extract_stral_deflectometry_data(
+            stral_file_path=HDF5Manager._stral_file_path(), device=device
+        )
+
         # Use this surface configuration for ideal surfaces.
-        # surface_config = surface_generator.generate_ideal_surface_config(
-        #     facet_translation_vectors=facet_translation_vectors,
-        #     canting=canting,
-        #     device=device,
-        # )
+        surface_generator = SurfaceGenerator(device=device)
+        surface_config = surface_generator.generate_ideal_surface_config(
+            facet_translation_vectors=facet_translation_vectors,
+            canting=canting,
+            device=device,
+        )
         surface_prototype_config = SurfacePrototypeConfig(
             facet_list=surface_config.facet_list
         )
         return surface_prototype_config
 
     @staticmethod
-    def _create_prototype_config(device: torch.device) -> PrototypeConfig:
+    def _create_prototype_config(
+        device: torch.device, profile: str = ProjectSettings.FITTED
+    ) -> PrototypeConfig:
         """Build the prototype configuration for the project."""
+        import torch
+        from artist.scenario.configuration_classes import (
+            ActuatorConfig,
+            ActuatorPrototypeConfig,
+            KinematicPrototypeConfig,
+            PrototypeConfig,
+        )
+        from artist.util import config_dictionary
+
         # Build the surface prototype from the STRAL file.
         surface_prototype_config = HDF5Manager._create_surface_prototype_from_stral(
-            device=device
+            device=device, profile=profile
         )
 
         # Include the kinematic prototype configuration.
@@ -240,33 +463,59 @@ class HDF5Manager:
     @staticmethod
     def _create_target_area_config(project: Project, device: torch.device):
         """Build the target area configuration for the project."""
-        # Create list for target area (receiver) configs
-        target_area_config_list = []
+        from artist.scenario.configuration_classes import (
+            TargetAreaConfig,
+            TargetAreaListConfig,
+        )
+        from artist.util import config_dictionary
+
+        receivers = list(
+            project.receivers.order_by("pk").values_list(
+                "pk",
+                "position_x",
+                "position_y",
+                "position_z",
+                "normal_x",
+                "normal_y",
+                "normal_z",
+                "plane_e",
+                "plane_u",
+                "curvature_e",
+                "curvature_u",
+            )
+        )
+
+        # Build the centers and normal vectors of all receivers as one block
+        # and move it to the device at once, instead of one small tensor per receiver.
+        centers = HDF5Manager._homogeneous_block(
+            [receiver[1:4] for receiver in receivers], 1.0, device
+        )
+        normal_vectors = HDF5Manager._homogeneous_block(
+            [receiver[4:7] for receiver in receivers], 0.0, device
+        )
 
-        # Add all receivers to list
-        for receiver in project.receivers.all():
-            receiver_config = TargetAreaConfig(
-                target_area_key=str(receiver),
+        # Create list for target area (receiver) configs
+        target_area_config_list = [
+            TargetAreaConfig(
+                # Matches the stringified version of the receiver
+                target_area_key=f"{project} Receiver {pk}",
                 geometry=config_dictionary.target_area_type_planar,
-                center=torch.tensor(
-                    [
-                        receiver.position_x,
-                        receiver.position_y,
-                        receiver.position_z,
-                        1.0,
-                    ],
-                    device=device,
-                ),
-                normal_vector=torch.tensor(
-                    [receiver.normal_x, receiver.normal_y, receiver.normal_z, 0.0],
-                    device=device,
-                ),
-                plane_e=receiver.plane_e,
-                plane_u=receiver.plane_u,
-                curvature_e=receiver.curvature_e,
-                curvature_u=receiver.curvature_u,
+                center=center,
+                normal_vector=normal_vector,
+                plane_e=plane_e,
+                plane_u=plane_u,
+                curvature_e=curvature_e,
+                curvature_u=curvature_u,
             )
-            target_area_config_list.append(receiver_config)
+            for (
+                pk,
+                *_,
+                plane_e,
+                plane_u,
+                curvature_e,
+                curvature_u,
+            ), center, normal_vector in zip(receivers, centers, normal_vectors)
+        ]
 
         # Include the tower area configurations.
         target_area_list_config = TargetAreaListConfig(target_area_config_list)
@@ -275,6 +524,11 @@ class HDF5Manager:
     @staticmethod
     def _create_light_source_config(project: Project, device: torch.device):
         """Build the light source configuration for the project."""
+        from artist.scenario.configuration_classes import (
+            LightSourceConfig,
+            LightSourceListConfig,
+        )
+
         # Create a list of light source configs
         light_source_list = []
 
@@ -299,6 +553,11 @@ class HDF5Manager:
     @staticmethod
     def _create_heliostat_config(project: Project, device: torch.device):
         """Build the heliostat configuration for the project."""
+        from artist.scenario.configuration_classes import (
+            HeliostatConfig,
+            HeliostatListConfig,
+        )
+
         # Note, not all individual heliostat parameters are provided here
 
         # Generate the surface configuration.
@@ -306,70 +565,174 @@ class HDF5Manager:
         # the facet_prototype_list will be used here.
         # Due to this, the number of facettes will always be the one set in the stral-file in this version (=4).
 
+        heliostats = list(
+            project.heliostats.order_by("pk").values_list(
+                "pk", "position_x", "position_y", "position_z"
+            )
+        )
+
+        # Build the positions of all heliostats as one block
+        # and move it to the device at once, instead of one small tensor per heliostat.
+        positions = HDF5Manager._homogeneous_block(
+            [heliostat[1:] for heliostat in heliostats], 1.0, device
+        )
+
         # Create a list of all heliostats
-        heliostat_list = []
-
-        # Add all heliostats to list
-        for heliostat in project.heliostats.all():
-            heliostat_config = HeliostatConfig(
-                name=str(heliostat),
-                id=heliostat.pk,
-                position=torch.tensor(
-                    [
-                        heliostat.position_x,
-                        heliostat.position_y,
-                        heliostat.position_z,
-                        1.0,
-                    ],
-                    device=device,
-                ),
+        heliostat_list = [
+            HeliostatConfig(
+                # Matches the stringified version of the heliostat
+                name=f"{project} Heliostat {pk}",
+                id=pk,
+                position=position,
             )
-            heliostat_list.append(heliostat_config)
+            for (pk, *_), position in zip(heliostats, positions)
+        ]
 
         # Create the configuration for all heliostats.
         heliostats_list_config = HeliostatListConfig(heliostat_list=heliostat_list)
         return heliostats_list_config
 
     @staticmethod
-    def create_project_from_hdf5_file(project_file: str, new_project: Project):
+    def _homogeneous_block(
+        coordinates: list[tuple[float, float, float]],
+        w: float,
+        device: torch.device,
+    ) -> tuple[torch.Tensor, ...]:
+        """Stack coordinates into homogeneous 4D vectors sharing one tensor.
+
+        Parameters
+        ----------
+        coordinates : list[tuple[float, float, float]]
+            The x, y and z coordinates of each vector.
+        w : float
+            The homogeneous coordinate, 1.0 for positions and 0.0 for directions.
+        device : torch.device
+            The device the block is created on.
+
+        Returns
+        -------
+        tuple[torch.Tensor, ...]
+            One row of the block per vector.
+        """
+        import torch
+
+        block = torch.full((len(coordinates), 4), w)
+        if coordinates:
+            block[:, :3] = torch.tensor(coordinates, dtype=block.dtype)
+        return block.to(device).unbind(0)
+
+    @staticmethod
+    def create_project_from_hdf5_file(
+        project_file: str | BinaryIO,
+        new_project: Project,
+        progress_callback: Callable[[str, int, int], None] | None = None,
+    ) -> dict[str, float]:
         """Create a project from a HDF5 file.
 
+        All components are written in one transaction, so a failing import does not leave
+        a partially populated project behind.
+
         Parameters
         ----------
-        project_file: str
-            The path to the HDF5 file
+        project_file: str | BinaryIO
+            The path to the HDF5 file or the opened file
         new_project: Project
             The project in which the data is to be stored
+        progress_callback: Callable[[str, int, int], None] | None
+            Called with the current stage and the number of processed and total components
+            after every component read and once before saving
 
+        Returns
+        -------
+        dict[str, float]
+            The time in seconds spent in each stage of the import.
         """
+        import h5py
+        from artist.util import config_dictionary
+
+        timings = {}
+        stage_start = time.perf_counter()
+
+        def finish_stage(stage: str):
+            nonlocal stage_start
+            now = time.perf_counter()
+            timings[stage] = now - stage_start
+            stage_start = now
+
+        readers = [
+            (
+                "heliostats",
+                config_dictionary.heliostat_key,
+                HDF5Manager._read_heliostats_from_hdf5_file,
+            ),
+            (
+                "light_sources",
+                config_dictionary.light_source_key,
+                HDF5Manager._read_light_sources_from_hdf5_file,
+            ),
+            (
+                "receivers",
+                config_dictionary.target_area_key,
+                HDF5Manager._read_receivers_from_hdf5_file,
+            ),
+        ]
+        components = {}
+        processed = 0
         with h5py.File(project_file, "r") as hdf5_file:
-            # create the heliostats from the hdf5 file
-            HDF5Manager._create_heliostats_from_hdf5_file(
-                h5f=hdf5_file, new_project=new_project
-            )
-            # creates the light sources from the hdf5 file
-            HDF5Manager._create_light_sources_from_hdf5_file(
-                h5f=hdf5_file, new_project=new_project
-            )
-            # creates the receivers from the hdf5 file
-            HDF5Manager._create_receivers_from_hdf5_file(
-                h5f=hdf5_file, new_project=new_project
-            )
+            total = sum(len(hdf5_file.get(key, ())) for _, key, _ in readers)
+            for stage, _, read in readers:
+                components[stage] = []
+                for component in read(h5f=hdf5_file, new_project=new_project):
+                    components[stage].append(component)
+                    processed += 1
+                    if progress_callback is not None:
+                        progress_callback(stage, processed, total)
+                finish_stage(f"read_{stage}")
+
+        if progress_callback is not None:
+            progress_callback("saving", processed, total)
+        with transaction.atomic():
+            # Clients that loaded the project before the import finished see it as changed
+            revision = new_project.next_revision()
+            for stage, model in [
+                ("heliostats", Heliostat),
+                ("light_sources", LightSource),
+                ("receivers", Receiver),
+            ]:
+                for component in components[stage]:
+                    component.revision = revision
+                model.objects.bulk_create(
+                    components[stage], batch_size=IMPORT_BATCH_SIZE
+                )
+                finish_stage(f"write_{stage}")
+
+        timings["total"] = sum(timings.values())
+        logger.info(
+            "Imported %d heliostats, %d light sources and %d receivers into %s: %s",
+            len(components["heliostats"]),
+            len(components["light_sources"]),
+            len(components["receivers"]),
+            new_project,
+            ", ".join(f"{stage} {seconds:.3f}s" for stage, seconds in timings.items()),
+        )
+        return timings
 
     @staticmethod
-    def _create_heliostats_from_hdf5_file(h5f: h5py.File, new_project: Project):
-        """Create heliostats from a HDF5 file."""
+    def _read_heliostats_from_hdf5_file(
+        h5f: h5py.File, new_project: Project
+    ) -> Iterator[Heliostat]:
+        """Read the heliostats from a HDF5 file without saving them."""
+        from artist.util import config_dictionary
+
         heliostats_group: h5py.Group = h5f.get(config_dictionary.heliostat_key)
         if heliostats_group is not None:
-            for heliostat_object in heliostats_group:
-                heliostat = heliostats_group[heliostat_object]
+            for heliostat_object, heliostat in heliostats_group.items():
+                # Read the whole dataset at once instead of one coordinate at a time.
+                position_x, position_y, position_z = heliostat[
+                    config_dictionary.heliostat_position
+                ][()][:3]
 
-                position = heliostat[config_dictionary.heliostat_position]
-                position_x = position[0]
-                position_y = position[1]
-                position_z = position[2]
-
-                Heliostat.objects.create(
+                yield Heliostat(
                     project=new_project,
                     name=str(heliostat_object),
                     position_x=position_x,
@@ -378,67 +741,60 @@ class HDF5Manager:
                 )
 
     @staticmethod
-    def _create_light_sources_from_hdf5_file(h5f: h5py.File, new_project: Project):
-        """Create light sources from a HDF5 file."""
+    def _read_light_sources_from_hdf5_file(
+        h5f: h5py.File, new_project: Project
+    ) -> Iterator[LightSource]:
+        """Read the light sources from a HDF5 file without saving them."""
+        from artist.util import config_dictionary
+
         light_sources_group: h5py.Group = h5f.get(config_dictionary.light_source_key)
         if light_sources_group is not None:
-            for light_source_object in light_sources_group:
-                light_source = light_sources_group[light_source_object]
-                number_of_rays = light_source[
-                    config_dictionary.light_source_number_of_rays
-                ]
-                light_source_type = light_source[config_dictionary.light_source_type]
-
+            for light_source_object, light_source in light_sources_group.items():
                 distribution_params = light_source[
                     config_dictionary.light_source_distribution_parameters
                 ]
-                covariance = distribution_params[
-                    config_dictionary.light_source_covariance
-                ]
-                distribution_type = distribution_params[
-                    config_dictionary.light_source_distribution_type
-                ]
-                mean = distribution_params[config_dictionary.light_source_mean]
 
-                LightSource.objects.create(
+                yield LightSource(
                     project=new_project,
                     name=str(light_source_object),
-                    number_of_rays=number_of_rays[()],
-                    light_source_type=light_source_type[()].decode("utf-8"),
-                    covariance=covariance[()],
-                    distribution_type=distribution_type[()].decode("utf-8"),
-                    mean=mean[()],
+                    number_of_rays=light_source[
+                        config_dictionary.light_source_number_of_rays
+                    ][()],
+                    light_source_type=light_source[config_dictionary.light_source_type][
+                        ()
+                    ].decode("utf-8"),
+                    covariance=distribution_params[
+                        config_dictionary.light_source_covariance
+                    ][()],
+                    distribution_type=distribution_params[
+                        config_dictionary.light_source_distribution_type
+                    ][()].decode("utf-8"),
+                    mean=distribution_params[config_dictionary.light_source_mean][()],
                 )
 
     @staticmethod
-    def _create_receivers_from_hdf5_file(h5f: h5py.File, new_project: Project):
-        """Create receivers from a HDF5 file."""
+    def _read_receivers_from_hdf5_file(
+        h5f: h5py.File, new_project: Project
+    ) -> Iterator[Receiver]:
+        """Read the receivers from a HDF5 file without saving them."""
+        from artist.util import config_dictionary
+
         receivers_group: h5py.Group = h5f.get(config_dictionary.target_area_key)
         if receivers_group is not None:
-            for receiver_object in receivers_group:
-                receiver = receivers_group[receiver_object]
-
-                position = receiver[config_dictionary.target_area_position_center]
-                position_x = position[0]
-                position_y = position[1]
-                position_z = position[2]
-
-                normal = receiver[config_dictionary.target_area_normal_vector]
-                normal_x = normal[0]
-                normal_y = normal[1]
-                normal_z = normal[2]
-
-                plane_e = receiver[config_dictionary.target_area_plane_e]
-                plane_u = receiver[config_dictionary.target_area_plane_u]
+            for receiver_object, receiver in receivers_group.items():
+                # Read the whole datasets at once instead of one coordinate at a time.
+                position_x, position_y, position_z = receiver[
+                    config_dictionary.target_area_position_center
+                ][()][:3]
+                normal_x, normal_y, normal_z = receiver[
+                    config_dictionary.target_area_normal_vector
+                ][()][:3]
 
                 # Optional datasets (often absent for planar target areas)
                 curv_e_ds = receiver.get(config_dictionary.target_area_curvature_e)
                 curv_u_ds = receiver.get(config_dictionary.target_area_curvature_u)
 
-                curvature_e = HDF5Manager.safe_val(curv_e_ds, default=0.0)
-                curvature_u = HDF5Manager.safe_val(curv_u_ds, default=0.0)
-
-                Receiver.objects.create(
+                yield Receiver(
                     project=new_project,
                     name=str(receiver_object),
                     position_x=position_x,
@@ -447,8 +803,8 @@ class HDF5Manager:
                     normal_x=normal_x,
                     normal_y=normal_y,
                     normal_z=normal_z,
-                    plane_e=plane_e[()],
-                    plane_u=plane_u[()],
-                    curvature_e=curvature_e,
-                    curvature_u=curvature_u,
+                    plane_e=receiver[config_dictionary.target_area_plane_e][()],
+                    plane_u=receiver[config_dictionary.target_area_plane_u][()],
+                    curvature_e=HDF5Manager.safe_val(curv_e_ds, default=0.0),
+                    curvature_u=HDF5Manager.safe_val(curv_u_ds, default=0.0),
                 )
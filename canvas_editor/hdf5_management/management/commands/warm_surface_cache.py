@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from hdf5_management.hdf5_manager import HDF5Manager
+
+
+class Command(BaseCommand):
+    """Fit the surface prototype once, so the first download after a deployment is fast."""
+
+    help = "Pre-warm the surface prototype cache used for scenario exports."
+
+    def add_arguments(self, parser):
+        """Add the command line arguments of the command."""
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Discard an existing cache entry and fit the surface again.",
+        )
+
+    def handle(self, *args, **options):
+        """Fit the surface prototype and store it in the cache."""
+        key = HDF5Manager.warm_surface_prototype_cache(force=options["force"])
+        self.stdout.write(self.style.SUCCESS(f"Surface prototype cached as {key}."))
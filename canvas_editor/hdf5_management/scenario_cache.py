@@ -0,0 +1,156 @@
+"""A module for caching generated scenario files of Canvas projects."""
+
+import hashlib
+import json
+import os
+import pathlib
+import shutil
+import threading
+from typing import BinaryIO
+
+from django.conf import settings
+
+from canvas.path_dict import SCENARIO_EXT
+from project_management.models import Project
+
+
+def compute_scenario_hash(project: Project, prototype_version: str) -> str:
+    """Compute a hash identifying a scenario of the project in its current state.
+
+    Every change of the heliostats, receivers and light sources advances the revision of
+    the project, so the revision stands in for them and they are not read. The name and
+    revision are read from the database, as the instance may be older than the updates
+    just written by the autosave api.
+
+    Parameters
+    ----------
+    project : Project
+        The project the scenario is generated for.
+    prototype_version : str
+        Identifies the prototypes written into the scenario.
+
+    Returns
+    -------
+    str
+        The hex digest of the project's scenario.
+    """
+    name, revision = Project.objects.values_list("name", "revision").get(pk=project.pk)
+    scenario = [project.pk, name, revision, prototype_version]
+    return hashlib.sha256(json.dumps(scenario).encode()).hexdigest()
+
+
+class ScenarioCache:
+    """Stores generated scenario files, so unchanged projects are not generated again.
+
+    Entries are named after the project, the export profile and the hash of its scenario.
+    Storing a new entry for a project removes its outdated ones of the same profile, and the
+    least recently used entries are evicted once the cache exceeds its size limit.
+    """
+
+    def __init__(self):
+        """Create a cache using the directory and size limit from the settings."""
+        self._lock = threading.Lock()
+
+    @property
+    def cache_dir(self) -> pathlib.Path:
+        """The directory the cached scenarios are stored in."""
+        return pathlib.Path(settings.SCENARIO_CACHE_DIR)
+
+    def open(
+        self, project_id: int, profile: str, scenario_hash: str
+    ) -> BinaryIO | None:
+        """Open the cached scenario, if there is one.
+
+        Parameters
+        ----------
+        project_id : int
+            The id of the project the scenario belongs to.
+        profile : str
+            The export profile the scenario was generated with.
+        scenario_hash : str
+            The hash of the scenario, see ``compute_scenario_hash``.
+
+        Returns
+        -------
+        BinaryIO | None
+            The opened scenario file or None on a cache miss.
+        """
+        path = self._entry_path(project_id, profile, scenario_hash)
+        try:
+            scenario_file = open(path, "rb")
+        except FileNotFoundError:
+            return None
+        # The modification time doubles as last access time for the eviction.
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return scenario_file
+
+    def store(
+        self,
+        project_id: int,
+        profile: str,
+        scenario_hash: str,
+        scenario_path: pathlib.Path,
+    ) -> pathlib.Path:
+        """Move a generated scenario into the cache.
+
+        Parameters
+        ----------
+        project_id : int
+            The id of the project the scenario belongs to.
+        profile : str
+            The export profile the scenario was generated with.
+        scenario_hash : str
+            The hash of the scenario, see ``compute_scenario_hash``.
+        scenario_path : pathlib.Path
+            The path of the generated scenario, the file is moved.
+
+        Returns
+        -------
+        pathlib.Path
+            The path of the cached scenario.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entry_path = self._entry_path(project_id, profile, scenario_hash)
+        shutil.move(scenario_path, entry_path)
+        with self._lock:
+            # Scenarios of the other profiles stay valid, only the eviction removes them.
+            outdated_paths = self.cache_dir.glob(
+                f"{project_id}-{profile}-*{SCENARIO_EXT}"
+            )
+            for outdated_path in outdated_paths:
+                if outdated_path != entry_path:
+                    outdated_path.unlink(missing_ok=True)
+            self._evict(keep=entry_path)
+        return entry_path
+
+    def _entry_path(
+        self, project_id: int, profile: str, scenario_hash: str
+    ) -> pathlib.Path:
+        return self.cache_dir / f"{project_id}-{profile}-{scenario_hash}{SCENARIO_EXT}"
+
+    def _evict(self, keep: pathlib.Path):
+        """Remove the least recently used entries until the cache fits its size limit."""
+        entries = []
+        for path in self.cache_dir.glob(f"*{SCENARIO_EXT}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= settings.SCENARIO_CACHE_MAX_BYTES:
+                break
+            if path == keep:
+                continue
+            # Open downloads keep streaming, the file is only removed once they are done.
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+
+scenario_cache = ScenarioCache()
+"""The scenario cache shared by all downloads of this process."""
@@ -0,0 +1,84 @@
+"""A module for sharing one in-flight computation between concurrent callers."""
+
+import contextlib
+import threading
+from collections.abc import Callable, Hashable, Iterator
+from typing import Any
+
+
+class _Flight:
+    """The state of one in-flight computation."""
+
+    def __init__(self):
+        """Create a flight that has not finished yet."""
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.participants = 0
+
+
+class SingleFlight:
+    """Runs a computation once for all concurrent callers asking for the same key.
+
+    The first caller for a key runs the computation, callers arriving while it runs wait
+    for it and receive the same result or exception. Callers arriving after it finished
+    start a new computation.
+    """
+
+    def __init__(self):
+        """Create a single flight without computations in flight."""
+        self._lock = threading.Lock()
+        self._flights: dict[Hashable, _Flight] = {}
+
+    @contextlib.contextmanager
+    def share(
+        self,
+        key: Hashable,
+        function: Callable[[], Any],
+        cleanup: Callable[[Any], None] | None = None,
+    ) -> Iterator[Any]:
+        """Share the result of the function with all concurrent callers for the key.
+
+        Parameters
+        ----------
+        key : Hashable
+            Identifies the computation.
+        function : Callable[[], Any]
+            Computes the result, it is only called if no computation for the key is in flight.
+        cleanup : Callable[[Any], None] | None
+            Called with the result once the last caller sharing it is done with it.
+
+        Yields
+        ------
+        Any
+            The result of the function.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            flight.participants += 1
+
+        if leader:
+            try:
+                flight.result = function()
+            except BaseException as error:
+                flight.error = error
+            finally:
+                with self._lock:
+                    del self._flights[key]
+                flight.done.set()
+        else:
+            flight.done.wait()
+
+        try:
+            if flight.error is not None:
+                raise flight.error
+            yield flight.result
+        finally:
+            with self._lock:
+                flight.participants -= 1
+                last = flight.participants == 0
+            if last and flight.error is None and cleanup is not None:
+                cleanup(flight.result)
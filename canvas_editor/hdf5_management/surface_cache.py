@@ -0,0 +1,190 @@
+"""A module for caching the fitted surface prototype used in Canvas scenarios."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pathlib
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+
+if TYPE_CHECKING:
+    import torch
+    from artist.scenario.configuration_classes import SurfacePrototypeConfig
+
+
+class SurfacePrototypeCache:
+    """Caches surface prototype configurations on disk and in memory.
+
+    Fitting the NURBS surface to the STRAL deflectometry data is by far the most expensive
+    part of a scenario export, even though its result only depends on the STRAL file and the
+    fit hyperparameters. Entries are therefore stored content-addressed on disk, keyed by a
+    hash of both, with a small in-process LRU layer on top.
+    """
+
+    def __init__(self, max_memory_entries: int):
+        """Create an empty cache.
+
+        Parameters
+        ----------
+        max_memory_entries : int
+            The number of surface prototypes kept in memory.
+        """
+        self._max_memory_entries = max_memory_entries
+        self._memory: OrderedDict[tuple[str, str], SurfacePrototypeConfig] = (
+            OrderedDict()
+        )
+        self._file_digests: dict[tuple[str, int, int], str] = {}
+        # Held while fitting, so concurrent misses wait for one fit instead of starting their own.
+        self._lock = threading.RLock()
+
+    @property
+    def cache_dir(self) -> pathlib.Path:
+        """The directory the cache entries are stored in."""
+        return pathlib.Path(settings.SURFACE_PROTOTYPE_CACHE_DIR)
+
+    def make_key(self, stral_file_path: pathlib.Path, hyperparameters: dict) -> str:
+        """Compute the cache key for a STRAL file and a set of fit hyperparameters.
+
+        Parameters
+        ----------
+        stral_file_path : pathlib.Path
+            The path to the STRAL file the surface is fitted to.
+        hyperparameters : dict
+            The JSON serializable hyperparameters of the fit.
+
+        Returns
+        -------
+        str
+            The hex digest identifying the fitted surface.
+        """
+        key_hash = hashlib.sha256()
+        key_hash.update(self._file_digest(stral_file_path).encode())
+        key_hash.update(json.dumps(hyperparameters, sort_keys=True).encode())
+        return key_hash.hexdigest()
+
+    def get_or_create(
+        self,
+        key: str,
+        device: torch.device,
+        factory: Callable[[], SurfacePrototypeConfig],
+    ) -> SurfacePrototypeConfig:
+        """Return the cached surface prototype for the key, creating it if needed.
+
+        Parameters
+        ----------
+        key : str
+            The cache key, see ``make_key``.
+        device : torch.device
+            The device the tensors of the surface prototype should be on.
+        factory : Callable[[], SurfacePrototypeConfig]
+            Creates the surface prototype on a cache miss.
+
+        Returns
+        -------
+        SurfacePrototypeConfig
+            The cached or newly created surface prototype.
+        """
+        memory_key = (key, str(device))
+        with self._lock:
+            surface_prototype_config = self._memory.get(memory_key)
+            if surface_prototype_config is not None:
+                self._memory.move_to_end(memory_key)
+                return surface_prototype_config
+
+            surface_prototype_config = self._load(key, device)
+            if surface_prototype_config is None:
+                surface_prototype_config = self._detach(factory())
+                self._save(key, surface_prototype_config)
+
+            self._memory[memory_key] = surface_prototype_config
+            while len(self._memory) > self._max_memory_entries:
+                self._memory.popitem(last=False)
+            return surface_prototype_config
+
+    def contains(self, key: str) -> bool:
+        """Check whether an entry for the key is stored on disk."""
+        return self._entry_path(key).is_file()
+
+    def discard(self, key: str):
+        """Remove the entry for the key from memory and disk."""
+        with self._lock:
+            for memory_key in [k for k in self._memory if k[0] == key]:
+                del self._memory[memory_key]
+            self._entry_path(key).unlink(missing_ok=True)
+
+    def clear_memory(self):
+        """Drop the in-process layer, the entries on disk are kept."""
+        with self._lock:
+            self._memory.clear()
+
+    def _entry_path(self, key: str) -> pathlib.Path:
+        return self.cache_dir / f"{key}.pt"
+
+    def _file_digest(self, path: pathlib.Path) -> str:
+        """Hash the file, reusing the digest as long as the file is unchanged."""
+        stat = os.stat(path)
+        stat_key = (str(path), stat.st_mtime_ns, stat.st_size)
+        digest = self._file_digests.get(stat_key)
+        if digest is None:
+            file_hash = hashlib.sha256()
+            with open(path, "rb") as file:
+                for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                    file_hash.update(chunk)
+            digest = file_hash.hexdigest()
+            self._file_digests[stat_key] = digest
+        return digest
+
+    def _load(self, key: str, device: torch.device) -> SurfacePrototypeConfig | None:
+        import torch
+
+        path = self._entry_path(key)
+        if not path.is_file():
+            return None
+        try:
+            return torch.load(path, map_location=device, weights_only=False)
+        except Exception:
+            # A truncated or otherwise unreadable entry is treated as a miss and refitted.
+            path.unlink(missing_ok=True)
+            return None
+
+    def _save(self, key: str, surface_prototype_config: SurfacePrototypeConfig):
+        import torch
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Write to a temporary file first, so readers never see a partially written entry.
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=self.cache_dir, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                torch.save(surface_prototype_config, file)
+            os.replace(temporary_path, self._entry_path(key))
+        except BaseException:
+            pathlib.Path(temporary_path).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _detach(
+        surface_prototype_config: SurfacePrototypeConfig,
+    ) -> SurfacePrototypeConfig:
+        """Detach the fitted tensors, so the cache does not keep the autograd graph alive."""
+        import torch
+
+        for facet in surface_prototype_config.facet_list:
+            for name, value in vars(facet).items():
+                if isinstance(value, torch.Tensor):
+                    setattr(facet, name, value.detach())
+        return surface_prototype_config
+
+
+surface_prototype_cache = SurfacePrototypeCache(
+    max_memory_entries=settings.SURFACE_PROTOTYPE_CACHE_SIZE
+)
+"""The surface prototype cache shared by all exports of this process."""
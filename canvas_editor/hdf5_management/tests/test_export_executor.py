@@ -0,0 +1,121 @@
+import pathlib
+import tempfile
+from concurrent.futures import Future
+from unittest import mock
+
+import torch
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from canvas.test_constants import SECURE_PASSWORD, TEST_PROJECT_NAME, TEST_USERNAME
+from hdf5_management import export_executor
+from hdf5_management.hdf5_manager import HDF5Manager
+from project_management.models import Project
+
+
+class _InlineExecutor:
+    """Runs submitted functions right away, in place of the process pool."""
+
+    def submit(self, function, *args):
+        future = Future()
+        future.set_result(function(*args))
+        return future
+
+
+class _PendingExecutor:
+    """Never runs submitted functions on its own, like a busy process pool."""
+
+    def __init__(self):
+        self.future = Future()
+
+    def submit(self, function, *args):
+        return self.future
+
+
+class ExportExecutorTest(TestCase):
+    """Tests for generating scenarios in the export pool."""
+
+    def setUp(self):
+        """Create a test project and a stand-in for its generated scenario."""
+        self.user = User.objects.create_user(
+            username=TEST_USERNAME, password=SECURE_PASSWORD
+        )
+        self.project = Project.objects.create(name=TEST_PROJECT_NAME, owner=self.user)
+
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.scenario_path = pathlib.Path(temporary_directory.name) / "scenario.h5"
+        self.scenario_path.write_bytes(b"scenario")
+
+    def test_export_without_workers(self):
+        """Test that the scenario is generated in-process without export workers."""
+        with (
+            self.settings(SCENARIO_EXPORT_WORKERS_PER_PROCESS=0),
+            mock.patch.object(export_executor, "_get_executor") as get_executor,
+            mock.patch.object(
+                HDF5Manager, "create_hdf5_file", return_value=self.scenario_path
+            ) as create_hdf5_file,
+        ):
+            path = export_executor.export_scenario(self.user, self.project)
+
+        self.assertEqual(path, self.scenario_path)
+        create_hdf5_file.assert_called_once_with(self.user, self.project, None)
+        get_executor.assert_not_called()
+
+    def test_export_in_pool(self):
+        """Test that the worker generates the scenario of the submitted project."""
+        with (
+            self.settings(SCENARIO_EXPORT_WORKERS_PER_PROCESS=2),
+            mock.patch.object(
+                export_executor, "_get_executor", return_value=_InlineExecutor()
+            ),
+            mock.patch.object(
+                HDF5Manager, "create_hdf5_file", return_value=self.scenario_path
+            ) as create_hdf5_file,
+        ):
+            path = export_executor.export_scenario(self.user, self.project)
+
+        self.assertEqual(path, self.scenario_path)
+        create_hdf5_file.assert_called_once_with(self.user, self.project, None)
+
+    def test_export_timeout_removes_abandoned_scenario(self):
+        """Test that a scenario finished after its download gave up is removed."""
+        executor = _PendingExecutor()
+        with (
+            self.settings(
+                SCENARIO_EXPORT_WORKERS_PER_PROCESS=2, SCENARIO_EXPORT_TIMEOUT=0.01
+            ),
+            mock.patch.object(export_executor, "_get_executor", return_value=executor),
+        ):
+            with self.assertRaises(TimeoutError):
+                export_executor.export_scenario(self.user, self.project)
+
+        executor.future.set_result(str(self.scenario_path))
+        self.assertFalse(self.scenario_path.exists())
+
+    def test_worker_initialization(self):
+        """Test that workers limit the torch threads and warm the surface cache."""
+        torch_threads = torch.get_num_threads()
+        self.addCleanup(torch.set_num_threads, torch_threads)
+
+        with mock.patch.object(HDF5Manager, "warm_surface_prototype_cache") as warm:
+            export_executor._initialize_worker(torch_threads=1)
+
+        self.assertEqual(torch.get_num_threads(), 1)
+        warm.assert_called_once()
+
+    def test_broken_pool_is_replaced(self):
+        """Test that a pool whose worker died is replaced for the next export."""
+        broken_executor = mock.Mock()
+        broken_executor.submit.side_effect = export_executor.BrokenProcessPool(
+            "worker died"
+        )
+        export_executor._executor = broken_executor
+        self.addCleanup(setattr, export_executor, "_executor", None)
+
+        with self.settings(SCENARIO_EXPORT_WORKERS_PER_PROCESS=2):
+            with self.assertRaises(export_executor.BrokenProcessPool):
+                export_executor.export_scenario(self.user, self.project)
+
+        self.assertIsNone(export_executor._executor)
+        broken_executor.shutdown.assert_called_once()
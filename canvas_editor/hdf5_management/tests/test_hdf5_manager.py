@@ -0,0 +1,156 @@
+import pathlib
+from unittest import mock
+
+import h5py
+import torch
+from artist.util import config_dictionary
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from canvas.path_dict import hdf5_management_test_scenario_template
+from canvas.test_constants import SECURE_PASSWORD, TEST_PROJECT_NAME, TEST_USERNAME
+from hdf5_management.hdf5_manager import HDF5Manager
+from project_management.models import Heliostat, LightSource, Project, Receiver
+
+CPU = torch.device("cpu")
+
+
+class ConfigConstructionTest(TestCase):
+    """Tests for building the ARTIST configurations of a project."""
+
+    def setUp(self):
+        """Create a test project with a few heliostats and receivers."""
+        user = User.objects.create_user(
+            username=TEST_USERNAME, password=SECURE_PASSWORD
+        )
+        self.project = Project.objects.create(name=TEST_PROJECT_NAME, owner=user)
+        self.heliostats = [
+            Heliostat.objects.create(
+                project=self.project, position_x=i, position_y=2 * i, position_z=3
+            )
+            for i in range(3)
+        ]
+        self.receivers = [
+            Receiver.objects.create(
+                project=self.project, position_x=i, normal_z=1, plane_e=i + 1
+            )
+            for i in range(2)
+        ]
+
+    def test_heliostat_config(self):
+        """Test that every heliostat gets its name, id and homogeneous position."""
+        heliostat_list = HDF5Manager._create_heliostat_config(
+            self.project, CPU
+        ).heliostat_list
+
+        self.assertEqual(len(heliostat_list), len(self.heliostats))
+        for heliostat, heliostat_config in zip(self.heliostats, heliostat_list):
+            self.assertEqual(heliostat_config.name, str(heliostat))
+            self.assertEqual(heliostat_config.id, heliostat.pk)
+            self.assertTrue(
+                torch.equal(
+                    heliostat_config.position,
+                    torch.tensor(
+                        [
+                            heliostat.position_x,
+                            heliostat.position_y,
+                            heliostat.position_z,
+                            1.0,
+                        ]
+                    ),
+                )
+            )
+
+    def test_target_area_config(self):
+        """Test that every receiver gets its key, center and normal vector."""
+        target_area_list = HDF5Manager._create_target_area_config(
+            self.project, CPU
+        ).target_area_list
+
+        self.assertEqual(len(target_area_list), len(self.receivers))
+        for receiver, target_area_config in zip(self.receivers, target_area_list):
+            self.assertEqual(target_area_config.target_area_key, str(receiver))
+            self.assertEqual(target_area_config.plane_e, receiver.plane_e)
+            self.assertTrue(
+                torch.equal(
+                    target_area_config.center,
+                    torch.tensor([receiver.position_x, receiver.position_y, 0.0, 1.0]),
+                )
+            )
+            self.assertTrue(
+                torch.equal(
+                    target_area_config.normal_vector,
+                    torch.tensor([0.0, 1.0, 1.0, 0.0]),
+                )
+            )
+
+    def test_empty_project(self):
+        """Test that a project without heliostats builds an empty configuration."""
+        Heliostat.objects.all().delete()
+
+        heliostat_list_config = HDF5Manager._create_heliostat_config(self.project, CPU)
+
+        self.assertEqual(heliostat_list_config.heliostat_list, [])
+
+
+class ProjectImportTest(TestCase):
+    """Tests for creating a project from a HDF5 file."""
+
+    def setUp(self):
+        """Create an empty project to import the test scenario into."""
+        user = User.objects.create_user(
+            username=TEST_USERNAME, password=SECURE_PASSWORD
+        )
+        self.project = Project.objects.create(name=TEST_PROJECT_NAME, owner=user)
+        self.scenario_path = (
+            pathlib.Path(settings.BASE_DIR) / hdf5_management_test_scenario_template
+        )
+
+    def test_import_creates_all_components(self):
+        """Test that every component of the file is imported with a bounded number of queries."""
+        with h5py.File(self.scenario_path, "r") as hdf5_file:
+            expected_counts = [
+                len(hdf5_file.get(key, {}))
+                for key in (
+                    config_dictionary.heliostat_key,
+                    config_dictionary.light_source_key,
+                    config_dictionary.target_area_key,
+                )
+            ]
+
+        with CaptureQueriesContext(connection) as queries:
+            timings = HDF5Manager.create_project_from_hdf5_file(
+                self.scenario_path, self.project
+            )
+
+        self.assertEqual(
+            [
+                self.project.heliostats.count(),
+                self.project.light_sources.count(),
+                self.project.receivers.count(),
+            ],
+            expected_counts,
+        )
+        # One insert per model, the new revision and the savepoint queries of the transaction.
+        self.assertLessEqual(len(queries), 7)
+        self.assertIn("write_heliostats", timings)
+        self.assertAlmostEqual(
+            timings["total"],
+            sum(seconds for stage, seconds in timings.items() if stage != "total"),
+        )
+
+    def test_failed_import_saves_nothing(self):
+        """Test that a failing import does not leave a partially populated project."""
+        with mock.patch.object(
+            Receiver.objects, "bulk_create", side_effect=RuntimeError
+        ):
+            with self.assertRaises(RuntimeError):
+                HDF5Manager.create_project_from_hdf5_file(
+                    self.scenario_path, self.project
+                )
+
+        self.assertFalse(Heliostat.objects.exists())
+        self.assertFalse(LightSource.objects.exists())
@@ -0,0 +1,30 @@
+import subprocess
+import sys
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+HEAVY_MODULES = ["torch", "h5py", "artist"]
+
+
+class LazyImportTest(SimpleTestCase):
+    """Tests that the heavy scientific packages are only imported when needed."""
+
+    def test_startup_does_not_import_heavy_modules(self):
+        """Test that loading all apps and the URLconf imports neither torch, h5py nor ARTIST."""
+        script = (
+            "import sys, django\n"
+            "django.setup()\n"
+            "from django.urls import get_resolver\n"
+            "get_resolver().url_patterns\n"
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        self.assertEqual(result.stdout.strip(), "")
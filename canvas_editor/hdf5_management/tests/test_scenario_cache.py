@@ -0,0 +1,168 @@
+import os
+import pathlib
+import tempfile
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from canvas.test_constants import (
+    POSITION_COORDINATE,
+    SECURE_PASSWORD,
+    TEST_PROJECT_NAME,
+    TEST_USERNAME,
+)
+from hdf5_management.scenario_cache import ScenarioCache, compute_scenario_hash
+from project_management.models import (
+    Heliostat,
+    LightSource,
+    Project,
+    Receiver,
+    Settings,
+)
+
+PROTOTYPE_VERSION = "1-test"
+PROFILE = Settings.FITTED
+
+
+class ScenarioCacheTest(TestCase):
+    """Tests for the scenario cache and the scenario hash."""
+
+    def setUp(self):
+        """Point the cache to a temporary directory and create a test project."""
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.directory = pathlib.Path(temporary_directory.name)
+
+        settings_override = self.settings(
+            SCENARIO_CACHE_DIR=self.directory / "cache",
+            SCENARIO_CACHE_MAX_BYTES=1024,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.cache = ScenarioCache()
+
+        user = User.objects.create_user(
+            username=TEST_USERNAME, password=SECURE_PASSWORD
+        )
+        self.project = Project.objects.create(name=TEST_PROJECT_NAME, owner=user)
+        self.heliostat = Heliostat.objects.create(project=self.project)
+        Receiver.objects.create(project=self.project)
+        LightSource.objects.create(project=self.project)
+
+    def _generated_scenario(self, size: int = 100) -> pathlib.Path:
+        """Write a stand-in for a generated scenario file."""
+        file_descriptor, name = tempfile.mkstemp(dir=self.directory, suffix=".h5")
+        os.close(file_descriptor)
+        path = pathlib.Path(name)
+        path.write_bytes(b"x" * size)
+        return path
+
+    def test_hash_is_stable(self):
+        """Test that an unchanged project always hashes the same."""
+        self.assertEqual(
+            compute_scenario_hash(self.project, PROTOTYPE_VERSION),
+            compute_scenario_hash(self.project, PROTOTYPE_VERSION),
+        )
+
+    def test_hash_changes_with_project(self):
+        """Test that new revisions and new prototypes change the hash."""
+        scenario_hash = compute_scenario_hash(self.project, PROTOTYPE_VERSION)
+        self.assertNotEqual(
+            scenario_hash, compute_scenario_hash(self.project, "2-test")
+        )
+
+        # Edits are saved with a new revision of the project, like the autosave api does
+        self.heliostat.position_x = POSITION_COORDINATE
+        self.heliostat.revision = self.project.next_revision()
+        self.heliostat.save()
+        moved_hash = compute_scenario_hash(self.project, PROTOTYPE_VERSION)
+        self.assertNotEqual(scenario_hash, moved_hash)
+
+        LightSource.objects.create(
+            project=self.project, revision=self.project.next_revision()
+        )
+        self.assertNotEqual(
+            moved_hash, compute_scenario_hash(self.project, PROTOTYPE_VERSION)
+        )
+
+    def test_hash_differs_between_projects(self):
+        """Test that projects of the same name and revision hash differently."""
+        other_project = Project.objects.create(
+            name=TEST_PROJECT_NAME, owner=User.objects.create_user(username="other")
+        )
+
+        self.assertNotEqual(
+            compute_scenario_hash(self.project, PROTOTYPE_VERSION),
+            compute_scenario_hash(other_project, PROTOTYPE_VERSION),
+        )
+
+    def test_hash_reads_current_revision(self):
+        """Test that the hash follows revisions written after the instance was loaded."""
+        outdated_project = Project.objects.get(pk=self.project.pk)
+        scenario_hash = compute_scenario_hash(outdated_project, PROTOTYPE_VERSION)
+
+        Project.objects.get(pk=self.project.pk).next_revision()
+
+        self.assertNotEqual(
+            scenario_hash, compute_scenario_hash(outdated_project, PROTOTYPE_VERSION)
+        )
+
+    def test_open_stored_scenario(self):
+        """Test that a stored scenario can be opened again."""
+        self.assertIsNone(self.cache.open(self.project.pk, PROFILE, "hash"))
+
+        self.cache.store(self.project.pk, PROFILE, "hash", self._generated_scenario())
+
+        with self.cache.open(self.project.pk, PROFILE, "hash") as scenario_file:
+            self.assertEqual(scenario_file.read(), b"x" * 100)
+
+    def test_store_removes_outdated_scenarios_of_project(self):
+        """Test that a new scenario of a project replaces its outdated one."""
+        self.cache.store(self.project.pk, PROFILE, "old", self._generated_scenario())
+        self.cache.store(
+            self.project.pk + 1, PROFILE, "other", self._generated_scenario()
+        )
+        self.cache.store(self.project.pk, PROFILE, "new", self._generated_scenario())
+
+        self.assertIsNone(self.cache.open(self.project.pk, PROFILE, "old"))
+        for project_id, scenario_hash in [
+            (self.project.pk, "new"),
+            (self.project.pk + 1, "other"),
+        ]:
+            with self.cache.open(project_id, PROFILE, scenario_hash) as scenario_file:
+                self.assertIsNotNone(scenario_file)
+
+    def test_store_keeps_scenarios_of_other_profiles(self):
+        """Test that storing a scenario of one profile keeps the one of the other profile."""
+        self.cache.store(
+            self.project.pk, Settings.FITTED, "fitted", self._generated_scenario()
+        )
+        self.cache.store(
+            self.project.pk, Settings.IDEAL, "ideal", self._generated_scenario()
+        )
+
+        for profile, scenario_hash in [
+            (Settings.FITTED, "fitted"),
+            (Settings.IDEAL, "ideal"),
+        ]:
+            scenario_file = self.cache.open(self.project.pk, profile, scenario_hash)
+            self.assertIsNotNone(scenario_file)
+            scenario_file.close()
+
+    def test_least_recently_used_scenarios_are_evicted(self):
+        """Test that the cache evicts the least recently used scenarios when full."""
+        for project_id in range(1, 4):
+            path = self.cache.store(
+                project_id, PROFILE, "hash", self._generated_scenario(300)
+            )
+            os.utime(path, (project_id, project_id))
+        # Using the first scenario makes the second one the least recently used.
+        self.cache.open(1, PROFILE, "hash").close()
+
+        self.cache.store(4, PROFILE, "hash", self._generated_scenario(300))
+
+        cached_projects = sorted(
+            int(path.name.split("-")[0])
+            for path in (self.directory / "cache").iterdir()
+        )
+        self.assertEqual(cached_projects, [1, 3, 4])
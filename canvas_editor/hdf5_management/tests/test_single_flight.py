@@ -0,0 +1,93 @@
+import threading
+import time
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from hdf5_management.single_flight import SingleFlight
+
+THREADS = 8
+
+
+def wait_for_participants(single_flight: SingleFlight, key, participants: int):
+    """Block until the given number of callers share the flight for the key."""
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        with single_flight._lock:
+            flight = single_flight._flights.get(key)
+            if flight is not None and flight.participants == participants:
+                return
+        time.sleep(0.001)
+    raise AssertionError("The callers did not join the flight in time")
+
+
+class SingleFlightTest(SimpleTestCase):
+    """Tests for sharing one in-flight computation between threads."""
+
+    def _share_in_threads(self, single_flight, function, cleanup=None):
+        """Call the single flight from several threads at once and collect the outcomes."""
+        outcomes = []
+        outcomes_lock = threading.Lock()
+
+        def participate():
+            try:
+                with single_flight.share("key", function, cleanup) as result:
+                    outcome = result
+            except Exception as error:
+                outcome = error
+            with outcomes_lock:
+                outcomes.append(outcome)
+
+        threads = [threading.Thread(target=participate) for _ in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        return outcomes
+
+    def test_concurrent_callers_share_one_call(self):
+        """Test that concurrent callers for the same key run the function once."""
+        single_flight = SingleFlight()
+
+        def compute():
+            wait_for_participants(single_flight, "key", THREADS)
+            return object()
+
+        function = mock.Mock(side_effect=compute)
+        cleanup = mock.Mock()
+
+        outcomes = self._share_in_threads(single_flight, function, cleanup)
+
+        function.assert_called_once()
+        self.assertEqual(len(outcomes), THREADS)
+        self.assertEqual(len({id(outcome) for outcome in outcomes}), 1)
+        cleanup.assert_called_once_with(outcomes[0])
+
+    def test_error_is_shared(self):
+        """Test that all concurrent callers receive the error of the shared call."""
+        single_flight = SingleFlight()
+
+        def fail():
+            wait_for_participants(single_flight, "key", THREADS)
+            raise ValueError("failed")
+
+        cleanup = mock.Mock()
+
+        outcomes = self._share_in_threads(single_flight, fail, cleanup)
+
+        self.assertEqual(len(outcomes), THREADS)
+        self.assertTrue(all(isinstance(outcome, ValueError) for outcome in outcomes))
+        cleanup.assert_not_called()
+
+    def test_finished_call_is_not_reused(self):
+        """Test that callers after a finished call start a new one."""
+        single_flight = SingleFlight()
+        function = mock.Mock(side_effect=[1, 2])
+
+        with single_flight.share("key", function) as first:
+            pass
+        with single_flight.share("key", function) as second:
+            pass
+
+        self.assertEqual((first, second), (1, 2))
+        self.assertEqual(single_flight._flights, {})
@@ -0,0 +1,165 @@
+import pathlib
+import tempfile
+from types import SimpleNamespace
+from unittest import mock
+
+import h5py
+import torch
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from canvas.test_constants import SECURE_PASSWORD, TEST_PROJECT_NAME, TEST_USERNAME
+from hdf5_management.hdf5_manager import SURFACE_PROFILE_ATTRIBUTE, HDF5Manager
+from hdf5_management.surface_cache import SurfacePrototypeCache, surface_prototype_cache
+from project_management.models import Heliostat, Project, Settings
+
+CPU = torch.device("cpu")
+
+
+def _fitted_surface(**kwargs):
+    """Create a stand-in for a fitted surface prototype."""
+    control_points = torch.ones(2, 2, 3, requires_grad=True) * 2
+    return SimpleNamespace(facet_list=[SimpleNamespace(control_points=control_points)])
+
+
+class SurfacePrototypeCacheTest(TestCase):
+    """Tests for the surface prototype cache."""
+
+    def setUp(self):
+        """Point the cache to a temporary directory and create a STRAL stand-in."""
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.directory = pathlib.Path(temporary_directory.name)
+
+        settings_override = self.settings(
+            SURFACE_PROTOTYPE_CACHE_DIR=self.directory / "cache",
+            HDF5_SCENARIO_DIR=self.directory / "scenarios",
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.stral_file = self.directory / "stral.binp"
+        self.stral_file.write_bytes(b"stral data")
+        self.cache = SurfacePrototypeCache(max_memory_entries=2)
+
+    def test_second_lookup_skips_factory(self):
+        """Test that a cached surface prototype is not fitted again."""
+        factory = mock.Mock(side_effect=_fitted_surface)
+        key = self.cache.make_key(self.stral_file, {"lr": 1e-3})
+
+        first = self.cache.get_or_create(key, CPU, factory)
+        second = self.cache.get_or_create(key, CPU, factory)
+
+        factory.assert_called_once()
+        self.assertIs(first, second)
+        self.assertFalse(first.facet_list[0].control_points.requires_grad)
+
+    def test_disk_layer_survives_memory_clear(self):
+        """Test that a new process can reuse the fitted surface from disk."""
+        key = self.cache.make_key(self.stral_file, {"lr": 1e-3})
+        self.cache.get_or_create(key, CPU, _fitted_surface)
+        self.assertTrue(self.cache.contains(key))
+
+        factory = mock.Mock(side_effect=_fitted_surface)
+        fresh_cache = SurfacePrototypeCache(max_memory_entries=2)
+        loaded = fresh_cache.get_or_create(key, CPU, factory)
+
+        factory.assert_not_called()
+        self.assertTrue(
+            torch.equal(loaded.facet_list[0].control_points, torch.full((2, 2, 3), 2.0))
+        )
+
+    def test_key_depends_on_stral_file_and_hyperparameters(self):
+        """Test that changing the STRAL data or the fit hyperparameters changes the key."""
+        key = self.cache.make_key(self.stral_file, {"lr": 1e-3})
+
+        self.assertEqual(key, self.cache.make_key(self.stral_file, {"lr": 1e-3}))
+        self.assertNotEqual(key, self.cache.make_key(self.stral_file, {"lr": 1e-2}))
+
+        other_stral_file = self.directory / "other.binp"
+        other_stral_file.write_bytes(b"other stral data")
+        self.assertNotEqual(key, self.cache.make_key(other_stral_file, {"lr": 1e-3}))
+
+    def test_corrupt_entry_is_refitted(self):
+        """Test that an unreadable entry on disk is treated as a miss."""
+        key = self.cache.make_key(self.stral_file, {"lr": 1e-3})
+        (self.directory / "cache").mkdir()
+        (self.directory / "cache" / f"{key}.pt").write_bytes(b"not a torch file")
+
+        factory = mock.Mock(side_effect=_fitted_surface)
+        self.cache.get_or_create(key, CPU, factory)
+
+        factory.assert_called_once()
+
+    def test_memory_layer_is_bounded(self):
+        """Test that the least recently used entries are dropped from memory."""
+        factory = mock.Mock(side_effect=_fitted_surface)
+        for learning_rate in (1e-1, 1e-2, 1e-3):
+            key = self.cache.make_key(self.stral_file, {"lr": learning_rate})
+            self.cache.get_or_create(key, CPU, factory)
+
+        self.assertEqual(len(self.cache._memory), 2)
+
+    def test_second_export_skips_fit(self):
+        """Test that only the first of two exports fits the surface prototype."""
+        user = User.objects.create_user(
+            username=TEST_USERNAME, password=SECURE_PASSWORD
+        )
+        project = Project.objects.create(name=TEST_PROJECT_NAME, owner=user)
+        Heliostat.objects.create(project=project)
+        surface_prototype_cache.clear_memory()
+        self.addCleanup(surface_prototype_cache.clear_memory)
+
+        with (
+            mock.patch.object(
+                HDF5Manager, "_stral_file_path", return_value=self.stral_file
+            ),
+            mock.patch.object(
+                HDF5Manager, "_fit_surface_prototype", side_effect=_fitted_surface
+            ) as fit,
+            mock.patch("artist.scenario.h5_scenario_generator.H5ScenarioGenerator"),
+        ):
+            HDF5Manager.create_hdf5_file(user, project)
+            HDF5Manager.create_hdf5_file(user, project)
+
+        fit.assert_called_once()
+
+    def test_ideal_export_skips_fit(self):
+        """Test that the ideal export profile neither fits nor reuses the fitted surface."""
+        user = User.objects.create_user(
+            username=TEST_USERNAME, password=SECURE_PASSWORD
+        )
+        project = Project.objects.create(name=TEST_PROJECT_NAME, owner=user)
+        Heliostat.objects.create(project=project)
+        surface_prototype_cache.clear_memory()
+        self.addCleanup(surface_prototype_cache.clear_memory)
+
+        with (
+            mock.patch.object(
+                HDF5Manager, "_stral_file_path", return_value=self.stral_file
+            ),
+            mock.patch.object(
+                HDF5Manager, "_fit_surface_prototype", side_effect=_fitted_surface
+            ) as fit,
+            mock.patch.object(
+                HDF5Manager,
+                "_generate_ideal_surface_prototype",
+                side_effect=_fitted_surface,
+            ) as generate_ideal,
+            mock.patch("artist.scenario.h5_scenario_generator.H5ScenarioGenerator"),
+        ):
+            scenario_path = HDF5Manager.create_hdf5_file(user, project, Settings.IDEAL)
+            fitted_scenario_path = HDF5Manager.create_hdf5_file(user, project)
+            self.assertNotEqual(
+                HDF5Manager.prototype_version(Settings.IDEAL),
+                HDF5Manager.prototype_version(Settings.FITTED),
+            )
+
+        generate_ideal.assert_called_once()
+        fit.assert_called_once()
+        for path, profile in [
+            (scenario_path, Settings.IDEAL),
+            (fitted_scenario_path, Settings.FITTED),
+        ]:
+            with h5py.File(path, "r") as hdf5_file:
+                self.assertEqual(hdf5_file.attrs[SURFACE_PROFILE_ATTRIBUTE], profile)
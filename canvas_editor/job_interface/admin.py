@@ -1,6 +1,7 @@
 from django.contrib import admin
 
-from .models import Job
+from .models import Job, JobResult
 
 # Register your models here.
 admin.site.register(Job)
+admin.site.register(JobResult)
@@ -0,0 +1,473 @@
+"""A module for running ray tracing jobs in a local pool of worker processes.
+
+A job exports the scenario of its project, ray traces it with ARTIST on the CPU and stores
+the flux density on every target area, see ``job_interface.raytracer``. Ray tracing keeps
+every core busy for minutes, so jobs run in a bounded pool of long-lived processes instead
+of the web workers. The state of a job is written to its row while it runs, which is all
+``JobStatusView`` reads.
+
+Jobs are queued in the database. Creating a job wakes up a worker of the pool, which then
+claims and runs jobs until the queue has no claimable job left. The queue is fair between
+users and limits the number of jobs each user runs at once, see ``claim_next_job``.
+Further nodes run jobs from the same database with the ``run_job_worker`` command.
+
+The pool is started lazily by every web process that creates a job, and the workers of
+every pool claim jobs from the shared queue. ``JOB_WORKERS_PER_PROCESS`` is therefore a
+limit per web process: a server with N web processes runs up to N times as many jobs at
+once, plus one per ``run_job_worker`` command.
+
+A job on a scenario whose result is stored already, e.g. because the project didn't change
+since the last job, finishes right away with that result, see ``job_interface.result_cache``.
+"""
+
+from __future__ import annotations
+
+import functools
+import io
+import logging
+import multiprocessing
+import os
+import pathlib
+import socket
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+
+# Worker processes import this module before Django is set up, so models are imported late.
+if TYPE_CHECKING:
+    import torch
+    from django.db.models import QuerySet
+
+    from job_interface.models import Job
+
+logger = logging.getLogger(__name__)
+
+CLAIM_ATTEMPTS = 10
+"""Number of jobs a worker tries to claim before giving up, if other workers claim them first."""
+
+PROGRESS_INTERVAL = 0.5
+"""Minimum number of seconds between two progress updates written to the database."""
+
+EXPORT_SHARE = 0.2
+"""Share of the progress of a job taken by creating its scenario."""
+SAVING_SHARE = 0.1
+"""Share of the progress of a job taken by saving its result."""
+
+CREATING_HDF5_STAGE = "Creating HDF5 file"
+SAVING_STAGE = "Saving result"
+
+_executor: ProcessPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _initialize_worker(torch_threads: int):
+    """Prepare a new process of the pool for running jobs."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "canvas.settings")
+    import django
+
+    django.setup()
+    prepare_worker_process(torch_threads)
+
+
+def prepare_worker_process(torch_threads: int):
+    """Prepare the calling process for running jobs, before it imports torch.
+
+    Parameters
+    ----------
+    torch_threads : int
+        The number of threads torch may use.
+    """
+    # Jobs run on the CPU, even on machines with a GPU shared by the web workers.
+    os.environ["CUDA_VISIBLE_DEVICES"] = ""
+    import torch
+
+    torch.set_num_threads(torch_threads)
+
+    from hdf5_management.hdf5_manager import HDF5Manager
+
+    try:
+        HDF5Manager.warm_surface_prototype_cache()
+    except Exception:
+        # The worker is still usable, the first job fits the surface instead.
+        logger.exception("Warming the surface prototype cache failed")
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Get the process pool of this web process, creating it on first use or after it broke."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.JOB_WORKERS_PER_PROCESS,
+                # Forking a process with running threads is unsafe, so workers are spawned.
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_initialize_worker,
+                initargs=(settings.JOB_TORCH_THREADS,),
+            )
+        return _executor
+
+
+def _discard_executor(executor: ProcessPoolExecutor):
+    """Drop a broken pool, so the next job starts a new one."""
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def worker_name() -> str:
+    """Identify the calling thread of this process on this node."""
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+def schedule_job(job: Job):
+    """Finish the job with a stored result, or wake up the workers to run it.
+
+    The workers are woken up once the transaction creating the job is committed.
+
+    Parameters
+    ----------
+    job : Job
+        The queued job.
+    """
+    if _complete_from_cache(job):
+        return
+    transaction.on_commit(start_jobs)
+
+
+def _complete_from_cache(job: Job) -> bool:
+    """Finish the job with the stored result of an identical job, if there is one."""
+    from job_interface.result_cache import complete_job_from_cache, compute_result_key
+
+    if job.project is None:
+        return False
+    try:
+        return complete_job_from_cache(job.pk, compute_result_key(job.project))
+    except Exception:
+        # The worker looks the result up again and fails the job if the error persists.
+        logger.exception("Looking up the result of job %s failed", job.pk)
+        return False
+
+
+def start_jobs():
+    """Let a worker of the pool run queued jobs, or run them right away without workers."""
+    if settings.JOB_WORKERS_PER_PROCESS == 0:
+        run_queued_jobs()
+        return
+
+    executor = _get_executor()
+    try:
+        future = executor.submit(_run_in_worker)
+    except BrokenProcessPool:
+        _discard_executor(executor)
+        executor = _get_executor()
+        future = executor.submit(_run_in_worker)
+    future.add_done_callback(functools.partial(_fail_crashed_jobs, executor))
+
+
+def _run_in_worker():
+    """Run queued jobs in a worker process, which manages its own database connection."""
+    close_old_connections()
+    try:
+        run_queued_jobs()
+    except Exception:
+        logger.exception("Running queued jobs crashed")
+    finally:
+        close_old_connections()
+
+
+def _fail_crashed_jobs(executor: ProcessPoolExecutor, future: Future):
+    """Mark the jobs as failed whose worker process died before finishing them."""
+    if future.cancelled() or not isinstance(future.exception(), BrokenProcessPool):
+        return
+    _discard_executor(executor)
+    # Done callbacks run in a thread of the pool, which has no connection of its own.
+    close_old_connections()
+    try:
+        fail_abandoned_jobs()
+    finally:
+        close_old_connections()
+
+
+def _process_exists(pid: int) -> bool:
+    """Check whether a process with the id runs on this node."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def fail_abandoned_jobs() -> int:
+    """Mark the running jobs of this node as failed whose worker process does not exist anymore.
+
+    Returns
+    -------
+    int
+        The number of failed jobs.
+    """
+    from django.utils import timezone
+
+    from canvas.message_dict import job_worker_crashed_text
+    from job_interface.models import Job
+
+    host = socket.gethostname()
+    running = Job.objects.filter(
+        status=Job.RUNNING, worker__startswith=f"{host}:"
+    ).values_list("pk", "worker")
+    abandoned = [
+        job_id
+        for job_id, worker in running
+        if not _process_exists(int(worker.split(":")[1]))
+    ]
+    return Job.objects.filter(pk__in=abandoned, status=Job.RUNNING).update(
+        status=Job.FAILED,
+        error=job_worker_crashed_text,
+        finishing_time=timezone.now(),
+    )
+
+
+def _queue() -> QuerySet[Job]:
+    """Get the claimable jobs in the order they are run.
+
+    Jobs with a higher priority come first. Between the owners of jobs with the same
+    priority, the owner with the fewest running jobs and then the one served longest ago
+    comes first, so no owner can monopolize the workers by queueing many jobs. The jobs of
+    an owner are run in the order they were created. Owners running
+    ``JOB_MAX_RUNNING_PER_USER`` jobs are left out.
+    """
+    from django.db.models import Count, F, Max, OuterRef, Subquery
+    from django.db.models.functions import Coalesce
+
+    from job_interface.models import Job
+
+    owner_jobs = Job.objects.filter(owner=OuterRef("owner")).order_by().values("owner")
+    owner_running = owner_jobs.filter(status=Job.RUNNING).annotate(running=Count("pk"))
+    owner_last_claimed = owner_jobs.annotate(last_claimed=Max("claimed_time"))
+    return (
+        Job.objects.filter(status=Job.PENDING)
+        .annotate(
+            owner_running=Coalesce(Subquery(owner_running.values("running")), 0),
+            owner_last_claimed=Subquery(owner_last_claimed.values("last_claimed")),
+        )
+        .filter(owner_running__lt=settings.JOB_MAX_RUNNING_PER_USER)
+        .order_by(
+            "-priority",
+            "owner_running",
+            F("owner_last_claimed").asc(nulls_first=True),
+            "starting_time",
+            "pk",
+        )
+    )
+
+
+def claim_next_job() -> int | None:
+    """Take the next job from the queue and mark it as running in the calling thread.
+
+    Any number of workers on any number of nodes may claim jobs from the same database at
+    once, every job is only claimed by one of them. On databases supporting it, the first
+    claimable jobs are locked with ``SKIP LOCKED``, so the workers claim different jobs
+    without waiting for each other, and the owner is locked while checking their running
+    jobs. SQLite doesn't lock rows, instead the job is claimed by a single update
+    statement, which SQLite runs while holding the lock of the database.
+
+    Returns
+    -------
+    int | None
+        The id of the claimed job, or None if no job can be claimed.
+    """
+    from django.contrib.auth.models import User
+    from django.utils import timezone
+
+    from job_interface.models import Job
+
+    worker = worker_name()
+    claim = {
+        "status": Job.RUNNING,
+        "stage": CREATING_HDF5_STAGE,
+        "progress": 0,
+        "claimed_time": timezone.now(),
+        "worker": worker,
+    }
+
+    if not connection.features.has_select_for_update_skip_locked:
+        for _ in range(CLAIM_ATTEMPTS):
+            next_job = _queue().values("pk")[:1]
+            if not next_job.exists():
+                return None
+            # Another worker may claim the job in between, then the next one is tried.
+            if Job.objects.filter(pk__in=next_job, status=Job.PENDING).update(**claim):
+                return (
+                    Job.objects.filter(worker=worker, status=Job.RUNNING)
+                    .order_by("-claimed_time", "-pk")
+                    .values_list("pk", flat=True)
+                    .first()
+                )
+        return None
+
+    with transaction.atomic():
+        candidates = _queue().select_for_update(skip_locked=True, of=("self",))
+        for job_id, owner_id in candidates.values_list("pk", "owner")[:CLAIM_ATTEMPTS]:
+            # Workers claiming jobs of the same owner wait here for each other.
+            User.objects.select_for_update().get(pk=owner_id)
+            running = Job.objects.filter(owner=owner_id, status=Job.RUNNING).count()
+            if running >= settings.JOB_MAX_RUNNING_PER_USER:
+                continue
+            Job.objects.filter(pk=job_id).update(**claim)
+            return job_id
+    return None
+
+
+def run_next_job() -> bool:
+    """Claim the next job from the queue and run it.
+
+    Returns
+    -------
+    bool
+        Whether a job was run.
+    """
+    job_id = claim_next_job()
+    if job_id is None:
+        return False
+    run_job(job_id)
+    return True
+
+
+def run_queued_jobs():
+    """Run jobs from the queue until no job can be claimed anymore."""
+    while run_next_job():
+        pass
+
+
+def run_job(job_id: int):
+    """Ray trace the scenario of a claimed job's project and store the flux density.
+
+    A stored result of the same scenario is used instead of ray tracing again. The stage
+    and progress are written to the database while the job runs. The state is written
+    with updates of the row, so a job deleted while running is not saved again, its
+    result stays in the result cache.
+
+    Parameters
+    ----------
+    job_id : int
+        The id of the job to run, claimed by ``claim_next_job``.
+    """
+    from django.utils import timezone
+
+    from canvas.message_dict import job_result_evicted_text, job_without_project_text
+    from hdf5_management.hdf5_manager import HDF5Manager
+    from job_interface.models import Job
+    from job_interface.raytracer import simulate_flux_density
+    from job_interface.result_cache import (
+        complete_job_from_cache,
+        compute_result_key,
+        evict_results,
+        store_result,
+    )
+
+    job = Job.objects.select_related("owner", "project").get(pk=job_id)
+
+    last_update = 0.0
+
+    def report_progress(stage: str, progress: float):
+        nonlocal last_update
+        now = time.monotonic()
+        if now - last_update < PROGRESS_INTERVAL:
+            return
+        last_update = now
+        Job.objects.filter(pk=job_id).update(stage=stage, progress=round(progress, 3))
+
+    def report_simulation_progress(stage: str, fraction: float):
+        report_progress(
+            stage, EXPORT_SHARE + fraction * (1 - EXPORT_SHARE - SAVING_SHARE)
+        )
+
+    scenario_path = None
+    stored = False
+    try:
+        if job.project is None:
+            raise ValueError(job_without_project_text)
+        result_key = compute_result_key(job.project)
+        if not complete_job_from_cache(job_id, result_key):
+            scenario_path = HDF5Manager.create_hdf5_file(job.owner, job.project)
+            target_area_names, flux_density = simulate_flux_density(
+                scenario_path, progress_callback=report_simulation_progress
+            )
+            Job.objects.filter(pk=job_id).update(
+                stage=SAVING_STAGE, progress=1 - SAVING_SHARE
+            )
+            store_result(result_key, *_render_result(target_area_names, flux_density))
+            stored = True
+            if not complete_job_from_cache(job_id, result_key):
+                raise RuntimeError(job_result_evicted_text)
+    except Exception as error:
+        logger.exception("Job %s failed", job_id)
+        Job.objects.filter(pk=job_id).update(
+            status=Job.FAILED,
+            error=str(error) or type(error).__name__,
+            finishing_time=timezone.now(),
+        )
+    finally:
+        if scenario_path is not None:
+            pathlib.Path(scenario_path).unlink(missing_ok=True)
+
+    if stored:
+        try:
+            evict_results()
+        except Exception:
+            # The job is finished, the cache is evicted again after the next job.
+            logger.exception("Evicting job results failed")
+
+
+def _render_result(
+    target_area_names: list[str], flux_density: torch.Tensor
+) -> tuple[bytes, bytes]:
+    """Write the flux density to an HDF5 file and an image of it on the first target area.
+
+    Parameters
+    ----------
+    target_area_names : list[str]
+        The names of the target areas.
+    flux_density : torch.Tensor
+        The flux density on each target area.
+        Tensor of shape [number_of_target_areas, bitmap_resolution, bitmap_resolution].
+
+    Returns
+    -------
+    tuple[bytes, bytes]
+        The HDF5 file and the PNG image.
+    """
+    import h5py
+    import torch
+    from PIL import Image
+
+    from job_interface.raytracer import INCIDENT_RAY_DIRECTION
+
+    flux_density = flux_density.detach().cpu()
+
+    buffer = io.BytesIO()
+    with h5py.File(buffer, "w") as result_file:
+        result_file.attrs["incident_ray_direction"] = INCIDENT_RAY_DIRECTION
+        group = result_file.create_group("flux_density")
+        for name, bitmap in zip(target_area_names, flux_density):
+            group.create_dataset(name, data=bitmap.numpy(), compression="gzip")
+
+    # A "hot" colormap: black over red and yellow to white
+    bitmap = flux_density[0]
+    bitmap = bitmap / bitmap.max().clamp(min=1e-12)
+    colors = (
+        (3 * bitmap.unsqueeze(-1) - bitmap.new_tensor([0.0, 1.0, 2.0])).clamp(0, 1)
+        * 255
+    ).to(dtype=torch.uint8)
+    image = io.BytesIO()
+    Image.fromarray(colors.numpy()).save(image, format="PNG")
+
+    return buffer.getvalue(), image.getvalue()
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from job_interface.job_engine import run_queued_jobs
+from job_interface.models import Job
+
+
+class Command(BaseCommand):
+    """Run jobs that were interrupted, e.g. by a restart of the server.
+
+    Run it while the server and all job workers are stopped, running jobs are considered
+    interrupted.
+    """
+
+    help = "Run all unfinished ray tracing jobs."
+
+    def handle(self, *args, **options):
+        """Requeue interrupted jobs and run all queued ones."""
+        Job.objects.filter(status=Job.RUNNING).update(status=Job.PENDING)
+        job_ids = list(
+            Job.objects.filter(status=Job.PENDING).values_list("pk", flat=True)
+        )
+        run_queued_jobs()
+        for job in Job.objects.filter(pk__in=job_ids).select_related("project"):
+            self.stdout.write(f"{job}: {job.status}")
@@ -0,0 +1,38 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from job_interface.job_engine import (
+    fail_abandoned_jobs,
+    prepare_worker_process,
+    run_queued_jobs,
+)
+
+
+class Command(BaseCommand):
+    """Run jobs from the queue, e.g. on a node other than the web server.
+
+    Any number of these workers may run next to the pool of the web server, every job is
+    only run by one of them.
+    """
+
+    help = "Run queued ray tracing jobs until stopped."
+
+    def add_arguments(self, parser):
+        """Add the option to stop once the queue is empty."""
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Stop once no queued job can be run instead of waiting for new ones.",
+        )
+
+    def handle(self, *args, **options):
+        """Run queued jobs, looking for new ones every JOB_POLL_SECONDS."""
+        prepare_worker_process(settings.JOB_TORCH_THREADS)
+        fail_abandoned_jobs()
+        while True:
+            run_queued_jobs()
+            if options["once"]:
+                return
+            time.sleep(settings.JOB_POLL_SECONDS)
@@ -0,0 +1,68 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:00
+
+from django.db import migrations, models
+
+import job_interface.models
+
+
+class Migration(migrations.Migration):
+    """Add the state and the results of the job engine to jobs."""
+
+    dependencies = [
+        ("job_interface", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="error",
+            field=models.TextField(blank=True, default=""),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="finishing_time",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="preview",
+            field=models.FileField(
+                blank=True,
+                storage=job_interface.models.job_result_storage,
+                upload_to="",
+            ),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="progress",
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="result",
+            field=models.FileField(
+                blank=True,
+                storage=job_interface.models.job_result_storage,
+                upload_to="",
+            ),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="stage",
+            field=models.CharField(blank=True, default="", max_length=50),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("running", "Running"),
+                    ("finished", "Finished"),
+                    ("failed", "Failed"),
+                ],
+                default="pending",
+                max_length=20,
+            ),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Add the priority and the claim of a job for the job queue."""
+
+    dependencies = [
+        ("job_interface", "0002_job_engine"),
+        ("project_management", "0005_heliostat_position_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="claimed_time",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="priority",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="worker",
+            field=models.CharField(blank=True, default="", max_length=100),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                fields=["status", "owner"], name="job_interfa_status_d411fb_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,116 @@
+# Generated by Django 5.2.18 on 2026-10-17 09:12
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+import job_interface.models
+
+
+def move_results_to_cache(apps, schema_editor):
+    """Turn the result files of finished jobs into entries of the result cache.
+
+    The hash the results were computed from is unknown, so the entries are keyed by their
+    job and are never shared with new jobs.
+    """
+    Job = apps.get_model("job_interface", "Job")
+    JobResult = apps.get_model("job_interface", "JobResult")
+    for job in Job.objects.exclude(result=""):
+        size = 0
+        for file in (job.result, job.preview):
+            try:
+                size += file.size if file else 0
+            except OSError:
+                pass
+        entry = JobResult.objects.create(
+            key=f"job-{job.pk}",
+            flux_density=job.result.name,
+            preview=job.preview.name,
+            size=size,
+            last_used=job.finishing_time or django.utils.timezone.now(),
+        )
+        Job.objects.filter(pk=job.pk).update(cached_result=entry)
+
+
+def move_results_to_jobs(apps, schema_editor):
+    """Give the finished jobs their result files back."""
+    Job = apps.get_model("job_interface", "Job")
+    for job in Job.objects.filter(cached_result__isnull=False).select_related(
+        "cached_result"
+    ):
+        Job.objects.filter(pk=job.pk).update(
+            result=job.cached_result.flux_density.name,
+            preview=job.cached_result.preview.name,
+        )
+
+
+class Migration(migrations.Migration):
+    """Share the results of identical jobs through the result cache."""
+
+    dependencies = [
+        ("job_interface", "0003_job_queue"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobResult",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("key", models.CharField(max_length=64, unique=True)),
+                (
+                    "flux_density",
+                    models.FileField(
+                        blank=True,
+                        storage=job_interface.models.job_result_storage,
+                        upload_to="",
+                    ),
+                ),
+                (
+                    "preview",
+                    models.FileField(
+                        blank=True,
+                        storage=job_interface.models.job_result_storage,
+                        upload_to="",
+                    ),
+                ),
+                ("size", models.BigIntegerField(default=0)),
+                (
+                    "last_used",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="cached_result",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="jobs",
+                to="job_interface.jobresult",
+            ),
+        ),
+        migrations.RunPython(move_results_to_cache, move_results_to_jobs),
+        migrations.RemoveField(
+            model_name="job",
+            name="preview",
+        ),
+        migrations.RemoveField(
+            model_name="job",
+            name="result",
+        ),
+        migrations.RenameField(
+            model_name="job",
+            old_name="cached_result",
+            new_name="result",
+        ),
+    ]
@@ -1,13 +1,114 @@
-from django.db import models
+import os
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.db import models, transaction
 from django.utils import timezone
 
 from project_management.models import Project
 
 
+class JobResultStorage(FileSystemStorage):
+    """Stores the results of jobs apart from the public media files."""
+
+    @property
+    def base_location(self) -> str:
+        """The directory from the settings, read on every access so it can be overridden."""
+        return str(settings.JOB_RESULT_DIR)
+
+    @property
+    def location(self) -> str:
+        """The absolute path of the directory."""
+        return os.path.abspath(self.base_location)
+
+
+def job_result_storage() -> JobResultStorage:
+    """Get the storage for the results of jobs."""
+    return JobResultStorage()
+
+
+class JobResult(models.Model):
+    """Model representing the stored result of a ray tracing job, shared by identical jobs.
+
+    An entry is addressed by the hash of everything its result is computed from, see
+    ``job_interface.result_cache``. Every job with the same hash references the entry
+    instead of ray tracing again. The number of referencing jobs is its reference count,
+    only unreferenced entries are evicted from the cache.
+    """
+
+    key = models.CharField(max_length=64, unique=True)
+    # The flux density on every target area, see job_interface.job_engine
+    flux_density = models.FileField(storage=job_result_storage, blank=True)
+    # An image of the flux density on the first target area
+    preview = models.FileField(storage=job_result_storage, blank=True)
+    size = models.BigIntegerField(default=0)
+    # When a job last completed with the entry, the least recently used ones are evicted first
+    last_used = models.DateTimeField(default=timezone.now)
+
+    def delete(self, *args, **kwargs):
+        """Delete the entry together with its files, once the deletion is committed."""
+        deleted = super().delete(*args, **kwargs)
+        files = [file for file in (self.flux_density, self.preview) if file]
+
+        def delete_files():
+            for file in files:
+                file.delete(save=False)
+
+        transaction.on_commit(delete_files)
+        return deleted
+
+    def __str__(self) -> str:
+        """Get the stringified version of the result."""
+        return f"Job result {self.key}"
+
+
 # Create your models here.
 class Job(models.Model):
-    """Model representing a job."""
+    """Model representing a ray tracing job, which is queued and run in the job engine."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    FINISHED = "finished"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (PENDING, "Pending"),
+        (RUNNING, "Running"),
+        (FINISHED, "Finished"),
+        (FAILED, "Failed"),
+    ]
 
     starting_time = models.DateTimeField(default=timezone.now)
     owner = models.ForeignKey("auth.User", on_delete=models.CASCADE)
     project = models.ForeignKey(Project, on_delete=models.CASCADE, null=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=PENDING)
+    stage = models.CharField(max_length=50, blank=True, default="")
+    progress = models.FloatField(default=0)
+    error = models.TextField(blank=True, default="")
+    finishing_time = models.DateTimeField(null=True, blank=True)
+    # Entries referenced by jobs are kept, see job_interface.result_cache
+    result = models.ForeignKey(
+        JobResult,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="jobs",
+    )
+    # Jobs with a higher priority are run first, regardless of their owner
+    priority = models.IntegerField(default=0)
+    # When and by which worker the job was taken from the queue, see job_interface.job_engine
+    claimed_time = models.DateTimeField(null=True, blank=True)
+    worker = models.CharField(max_length=100, blank=True, default="")
+
+    class Meta:
+        """Index the jobs by status and owner for taking them from the queue."""
+
+        indexes = [models.Index(fields=["status", "owner"])]
+
+    @property
+    def is_done(self) -> bool:
+        """Whether the job has finished or failed."""
+        return self.status in (self.FINISHED, self.FAILED)
+
+    def __str__(self) -> str:
+        """Get the stringified version of the job."""
+        return f"Job {self.pk} of {self.project}"
@@ -0,0 +1,110 @@
+"""A module for simulating the flux density of a scenario with the ARTIST ray tracer.
+
+torch, h5py and ARTIST are only imported inside the functions, so the web workers starting
+jobs don't import them, see ``hdf5_management.hdf5_manager``.
+"""
+
+from __future__ import annotations
+
+import pathlib
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+
+if TYPE_CHECKING:
+    import torch
+
+INCIDENT_RAY_DIRECTION = (0.0, 1.0, 0.0, 0.0)
+"""The direction of the sun light in east, north, up coordinates, the sun is in the south."""
+
+RAYTRACER_VERSION = 1
+"""Increase whenever ``simulate_flux_density`` computes different results, see result_cache."""
+
+
+def simulate_flux_density(
+    scenario_path: pathlib.Path,
+    progress_callback: Callable[[str, float], None] | None = None,
+) -> tuple[list[str], torch.Tensor]:
+    """Ray trace a scenario on the CPU with all heliostats aiming at the first target area.
+
+    Parameters
+    ----------
+    scenario_path : pathlib.Path
+        The path of the scenario, as created by ``HDF5Manager.create_hdf5_file``.
+    progress_callback : Callable[[str, float], None] | None
+        Called with the current stage and the fraction of the simulation done.
+
+    Returns
+    -------
+    tuple[list[str], torch.Tensor]
+        The names of the target areas and the flux density on each of them.
+        Tensor of shape [number_of_target_areas, bitmap_resolution, bitmap_resolution].
+    """
+    import h5py
+    import torch
+    from artist.core.heliostat_ray_tracer import HeliostatRayTracer
+    from artist.scenario.scenario import Scenario
+
+    def report(stage: str, fraction: float):
+        if progress_callback is not None:
+            progress_callback(stage, fraction)
+
+    device = torch.device("cpu")
+    resolution = settings.JOB_BITMAP_RESOLUTION
+
+    report("Loading scenario", 0.0)
+    with h5py.File(scenario_path, "r") as scenario_file:
+        scenario = Scenario.load_scenario_from_hdf5(
+            scenario_file=scenario_file, device=device
+        )
+
+    flux_density = torch.zeros(
+        (scenario.target_areas.number_of_target_areas, resolution, resolution),
+        device=device,
+    )
+    heliostat_groups = scenario.heliostat_field.heliostat_groups
+    for index, heliostat_group in enumerate(heliostat_groups):
+        active_heliostats_mask, target_area_mask, incident_ray_directions = (
+            scenario.index_mapping(
+                heliostat_group=heliostat_group,
+                single_incident_ray_direction=torch.tensor(
+                    INCIDENT_RAY_DIRECTION, device=device
+                ),
+                device=device,
+            )
+        )
+
+        report("Aligning heliostats", index / len(heliostat_groups))
+        heliostat_group.activate_heliostats(
+            active_heliostats_mask=active_heliostats_mask, device=device
+        )
+        heliostat_group.align_surfaces_with_incident_ray_directions(
+            aim_points=scenario.target_areas.centers[target_area_mask],
+            incident_ray_directions=incident_ray_directions,
+            active_heliostats_mask=active_heliostats_mask,
+            device=device,
+        )
+
+        report("Ray tracing", (index + 0.5) / len(heliostat_groups))
+        ray_tracer = HeliostatRayTracer(
+            scenario=scenario,
+            heliostat_group=heliostat_group,
+            batch_size=settings.JOB_RAY_TRACING_BATCH_SIZE,
+            bitmap_resolution=torch.tensor([resolution, resolution]),
+        )
+        with torch.no_grad():
+            bitmaps = ray_tracer.trace_rays(
+                incident_ray_directions=incident_ray_directions,
+                active_heliostats_mask=active_heliostats_mask,
+                target_area_mask=target_area_mask,
+                device=device,
+            )
+            flux_density += ray_tracer.get_bitmaps_per_target(
+                bitmaps_per_heliostat=bitmaps,
+                target_area_mask=target_area_mask,
+                device=device,
+            )
+
+    report("Ray tracing", 1.0)
+    return list(scenario.target_areas.names), flux_density
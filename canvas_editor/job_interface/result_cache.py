@@ -0,0 +1,182 @@
+"""A module for sharing the results of ray tracing jobs between identical jobs.
+
+Users often run a job again on a project they haven't changed since. Every job computes a
+hash over everything its result is computed from, see ``compute_result_key``. If a result
+with that hash was stored before, the job references it and finishes right away instead of
+ray tracing again.
+
+Results are stored once per hash, in a directory named after it, as ``JobResult`` entries.
+The jobs referencing an entry are its reference count. Entries no job references anymore
+stay in the cache for further jobs, until the results exceed
+``JOB_RESULT_CACHE_MAX_BYTES`` and the least recently used of them are evicted.
+"""
+
+import hashlib
+import importlib.metadata
+import json
+import logging
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import DatabaseError, IntegrityError, transaction
+from django.db.models import ProtectedError, Sum
+from django.utils import timezone
+
+from hdf5_management.hdf5_manager import HDF5Manager
+from hdf5_management.scenario_cache import compute_scenario_hash
+from job_interface.models import Job, JobResult, job_result_storage
+from job_interface.raytracer import INCIDENT_RAY_DIRECTION, RAYTRACER_VERSION
+from project_management.models import Project
+
+logger = logging.getLogger(__name__)
+
+ARTIST_DISTRIBUTION = "artist-csp"
+
+RESULT_FILE_NAME = "flux_density.h5"
+PREVIEW_FILE_NAME = "flux_density.png"
+
+
+def engine_version() -> str:
+    """Identify the ray tracer computing the results, without importing it.
+
+    Returns
+    -------
+    str
+        Changes with the version of the ray tracing code and of ARTIST.
+    """
+    try:
+        artist_version = importlib.metadata.version(ARTIST_DISTRIBUTION)
+    except importlib.metadata.PackageNotFoundError:
+        artist_version = "unknown"
+    return f"{RAYTRACER_VERSION}-{artist_version}"
+
+
+def compute_result_key(project: Project) -> str:
+    """Compute a canonical hash over everything the result of a job on the project depends on.
+
+    These are the revision of the project, which changes with its heliostats, receivers and
+    light sources including the number of rays, the prototypes of its export profile, the
+    ray tracer and its settings.
+
+    Parameters
+    ----------
+    project : Project
+        The project the job is run on.
+
+    Returns
+    -------
+    str
+        The hex digest of the job's result.
+    """
+    scenario_hash = compute_scenario_hash(
+        project, HDF5Manager.prototype_version(project.settings.export_profile)
+    )
+    parameters = [
+        scenario_hash,
+        engine_version(),
+        settings.JOB_BITMAP_RESOLUTION,
+        INCIDENT_RAY_DIRECTION,
+    ]
+    return hashlib.sha256(json.dumps(parameters).encode()).hexdigest()
+
+
+def complete_job_from_cache(job_id: int, result_key: str) -> bool:
+    """Finish a job with the stored result of the hash, if there is one.
+
+    Parameters
+    ----------
+    job_id : int
+        The id of the pending or running job.
+    result_key : str
+        The hash of the job's result, see ``compute_result_key``.
+
+    Returns
+    -------
+    bool
+        Whether the result is stored, then the job is finished unless it was deleted.
+    """
+    with transaction.atomic():
+        # Writing to the entry first holds off evicting it until the job references it.
+        if not JobResult.objects.filter(key=result_key).update(
+            last_used=timezone.now()
+        ):
+            return False
+        entry_id = JobResult.objects.values_list("pk", flat=True).get(key=result_key)
+        Job.objects.filter(pk=job_id, status__in=(Job.PENDING, Job.RUNNING)).update(
+            status=Job.FINISHED,
+            stage="",
+            progress=1,
+            error="",
+            result=entry_id,
+            finishing_time=timezone.now(),
+        )
+    return True
+
+
+def store_result(result_key: str, flux_density: bytes, preview: bytes):
+    """Store a result under its hash, unless an identical job stored it already.
+
+    Parameters
+    ----------
+    result_key : str
+        The hash of the result, see ``compute_result_key``.
+    flux_density : bytes
+        The HDF5 file with the flux density on every target area.
+    preview : bytes
+        The PNG image of the flux density on the first target area.
+    """
+    if JobResult.objects.filter(key=result_key).exists():
+        return
+
+    storage = job_result_storage()
+    flux_density_name = storage.save(
+        f"{result_key}/{RESULT_FILE_NAME}", ContentFile(flux_density)
+    )
+    preview_name = storage.save(
+        f"{result_key}/{PREVIEW_FILE_NAME}", ContentFile(preview)
+    )
+    try:
+        with transaction.atomic():
+            JobResult.objects.create(
+                key=result_key,
+                flux_density=flux_density_name,
+                preview=preview_name,
+                size=len(flux_density) + len(preview),
+            )
+    except IntegrityError:
+        # An identical job stored its result in the meantime.
+        storage.delete(flux_density_name)
+        storage.delete(preview_name)
+
+
+def evict_results() -> int:
+    """Remove the least recently used unreferenced results until the cache fits its size limit.
+
+    Results referenced by jobs are never removed, but count towards the size limit.
+
+    Returns
+    -------
+    int
+        The number of removed results.
+    """
+    total_size = JobResult.objects.aggregate(total=Sum("size"))["total"] or 0
+    if total_size <= settings.JOB_RESULT_CACHE_MAX_BYTES:
+        return 0
+
+    evicted = 0
+    unreferenced = JobResult.objects.filter(jobs__isnull=True).order_by(
+        "last_used", "pk"
+    )
+    for entry in list(unreferenced):
+        if total_size <= settings.JOB_RESULT_CACHE_MAX_BYTES:
+            break
+        try:
+            with transaction.atomic():
+                entry.delete()
+        except (ProtectedError, DatabaseError):
+            # A job referenced the result since it was read.
+            logger.debug("Result %s is in use, not evicting it", entry.key)
+            continue
+        total_size -= entry.size
+        evicted += 1
+    return evicted
@@ -0,0 +1,251 @@
+import io
+import os
+import pathlib
+import socket
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from unittest import mock
+
+import h5py
+import torch
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from PIL import Image
+
+from canvas.message_dict import job_worker_crashed_text
+from canvas.test_constants import (
+    SECURE_PASSWORD,
+    TEST_PROJECT_NAME,
+    TEST_USERNAME,
+)
+from hdf5_management.hdf5_manager import HDF5Manager
+from job_interface import job_engine, raytracer
+from job_interface.models import Job, JobResult
+from project_management.models import LightSource, Project
+
+TARGET_AREA_NAMES = ["receiver", "calibration"]
+RESOLUTION = 8
+PROTOTYPE_VERSION = "1-test"
+
+
+class JobEngineTest(TestCase):
+    """Tests for running jobs in the job engine."""
+
+    def setUp(self):
+        """Set up a job and replace the scenario generation and the ray tracer."""
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.directory = pathlib.Path(temporary_directory.name)
+        settings_override = self.settings(
+            JOB_RESULT_DIR=self.directory / "results", JOB_WORKERS_PER_PROCESS=0
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        user = User.objects.create_user(
+            username=TEST_USERNAME, password=SECURE_PASSWORD
+        )
+        project = Project.objects.create(name=TEST_PROJECT_NAME, owner=user)
+        self.light_source = LightSource.objects.create(project=project)
+        self.job = Job.objects.create(owner=user, project=project)
+
+        self.scenarios = []
+        self.flux_density = torch.rand(len(TARGET_AREA_NAMES), RESOLUTION, RESOLUTION)
+        self.simulate_flux_density = mock.Mock(side_effect=self._simulate)
+        patches = [
+            mock.patch.object(
+                HDF5Manager, "create_hdf5_file", side_effect=self._create_hdf5_file
+            ),
+            mock.patch.object(
+                raytracer, "simulate_flux_density", self.simulate_flux_density
+            ),
+            mock.patch.object(
+                HDF5Manager, "prototype_version", return_value=PROTOTYPE_VERSION
+            ),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def _create_hdf5_file(self, user, project, profile=None):
+        """Write a stand-in scenario."""
+        file_descriptor, name = tempfile.mkstemp(dir=self.directory, suffix=".h5")
+        os.close(file_descriptor)
+        self.scenarios.append(pathlib.Path(name))
+        return pathlib.Path(name)
+
+    def _simulate(self, scenario_path, progress_callback=None):
+        """Report the stages of a simulation and return the stand-in flux density."""
+        progress_callback("Aligning heliostats", 0.0)
+        progress_callback("Ray tracing", 0.5)
+        return TARGET_AREA_NAMES, self.flux_density
+
+    def _result_files(self):
+        """Get all files in the result directory."""
+        return [path for path in self.directory.rglob("*") if path.is_file()]
+
+    def _queue_identical_job(self):
+        """Queue another job on the unchanged project of the job."""
+        return Job.objects.create(owner=self.job.owner, project=self.job.project)
+
+    def test_run_job(self):
+        """Test that a job stores the flux density on every target area and an image."""
+        self.assertTrue(job_engine.run_next_job())
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, Job.FINISHED)
+        self.assertEqual(self.job.progress, 1)
+        self.assertIsNotNone(self.job.finishing_time)
+        with self.job.result.flux_density.open("rb") as result:
+            with h5py.File(io.BytesIO(result.read()), "r") as result_file:
+                self.assertEqual(
+                    list(result_file["flux_density"]), sorted(TARGET_AREA_NAMES)
+                )
+                self.assertTrue(
+                    torch.equal(
+                        torch.from_numpy(
+                            result_file["flux_density"]["calibration"][()]
+                        ),
+                        self.flux_density[1],
+                    )
+                )
+        with self.job.result.preview.open("rb") as preview:
+            image = Image.open(io.BytesIO(preview.read()))
+            self.assertEqual(image.size, (RESOLUTION, RESOLUTION))
+        self.assertFalse(self.scenarios[0].exists())
+
+    def test_run_job_reports_progress(self):
+        """Test that the stage and progress of a running job are written."""
+        progress = []
+
+        def simulate(scenario_path, progress_callback=None):
+            progress_callback("Ray tracing", 0.5)
+            job = Job.objects.get(pk=self.job.pk)
+            progress.append((job.status, job.stage, job.progress))
+            return TARGET_AREA_NAMES, self.flux_density
+
+        self.simulate_flux_density.side_effect = simulate
+
+        job_engine.run_next_job()
+
+        self.assertEqual(progress, [(Job.RUNNING, "Ray tracing", 0.55)])
+
+    def test_failed_job(self):
+        """Test that an error is stored and the scenario is removed."""
+        self.simulate_flux_density.side_effect = RuntimeError("Out of memory")
+
+        with self.assertLogs(job_engine.logger, "ERROR"):
+            job_engine.run_next_job()
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, Job.FAILED)
+        self.assertEqual(self.job.error, "Out of memory")
+        self.assertFalse(self.job.result)
+        self.assertFalse(self.scenarios[0].exists())
+
+    def test_job_runs_once(self):
+        """Test that a job which is not pending anymore is not run again."""
+        Job.objects.filter(pk=self.job.pk).update(status=Job.RUNNING)
+
+        self.assertFalse(job_engine.run_next_job())
+
+        self.simulate_flux_density.assert_not_called()
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, Job.RUNNING)
+
+    def test_deleted_job_keeps_result_cached(self):
+        """Test that the result of a job deleted while running is kept for further jobs."""
+
+        def simulate(scenario_path, progress_callback=None):
+            Job.objects.filter(pk=self.job.pk).delete()
+            return TARGET_AREA_NAMES, self.flux_density
+
+        self.simulate_flux_density.side_effect = simulate
+
+        job_engine.run_next_job()
+
+        self.assertFalse(Job.objects.exists())
+        entry = JobResult.objects.get()
+        self.assertFalse(entry.jobs.exists())
+        self.assertEqual(len(self._result_files()), 2)
+
+        job = self._queue_identical_job()
+        job_engine.run_next_job()
+
+        job.refresh_from_db()
+        self.assertEqual(job.result, entry)
+        self.simulate_flux_density.assert_called_once()
+
+    def test_identical_job_finishes_right_away(self):
+        """Test that a job on an unchanged project references the stored result."""
+        job_engine.run_next_job()
+        self.job.refresh_from_db()
+
+        job = self._queue_identical_job()
+        with self.captureOnCommitCallbacks() as callbacks:
+            job_engine.schedule_job(job)
+
+        self.assertEqual(callbacks, [])
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.FINISHED)
+        self.assertEqual(job.progress, 1)
+        self.assertIsNotNone(job.finishing_time)
+        self.assertEqual(job.result, self.job.result)
+        self.simulate_flux_density.assert_called_once()
+        self.assertEqual(len(self._result_files()), 2)
+
+    def test_changed_project_runs_again(self):
+        """Test that a job on a changed project is ray traced again."""
+        job_engine.run_next_job()
+        self.job.refresh_from_db()
+        # Edits are saved with a new revision of the project, like the autosave api does
+        self.light_source.number_of_rays += 1
+        self.light_source.revision = self.light_source.project.next_revision()
+        self.light_source.save()
+
+        job = self._queue_identical_job()
+        with self.captureOnCommitCallbacks(execute=True):
+            job_engine.schedule_job(job)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.FINISHED)
+        self.assertNotEqual(job.result, self.job.result)
+        self.assertEqual(self.simulate_flux_density.call_count, 2)
+
+    def test_crashed_worker_fails_job(self):
+        """Test that the jobs whose worker process died are marked as failed."""
+        process = subprocess.Popen([sys.executable, "-c", ""])
+        process.wait()
+        host = socket.gethostname()
+        Job.objects.filter(pk=self.job.pk).update(
+            status=Job.RUNNING, worker=f"{host}:{process.pid}:1"
+        )
+        running_job = Job.objects.create(
+            owner=self.job.owner,
+            project=self.job.project,
+            status=Job.RUNNING,
+            worker=job_engine.worker_name(),
+        )
+        future = Future()
+        future.set_exception(BrokenProcessPool())
+
+        job_engine._fail_crashed_jobs(mock.Mock(), future)
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, Job.FAILED)
+        self.assertEqual(self.job.error, job_worker_crashed_text)
+        running_job.refresh_from_db()
+        self.assertEqual(running_job.status, Job.RUNNING)
+
+    def test_resume_jobs(self):
+        """Test that interrupted jobs are run again by the management command."""
+        Job.objects.filter(pk=self.job.pk).update(status=Job.RUNNING)
+
+        call_command("resume_jobs", stdout=io.StringIO())
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, Job.FINISHED)
@@ -0,0 +1,115 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from canvas.test_constants import SECURE_PASSWORD, TEST_PROJECT_NAME
+from job_interface.job_engine import claim_next_job
+from job_interface.models import Job
+from project_management.models import Project
+
+
+class JobQueueTest(TestCase):
+    """Tests for the order in which jobs are taken from the queue."""
+
+    def setUp(self):
+        """Set up two users with a project each."""
+        settings_override = self.settings(JOB_MAX_RUNNING_PER_USER=1)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.projects = {}
+        for username in ["alice", "bob"]:
+            user = User.objects.create_user(username=username, password=SECURE_PASSWORD)
+            self.projects[username] = Project.objects.create(
+                name=TEST_PROJECT_NAME, owner=user
+            )
+
+    def _queue_jobs(self, username, count, priority=0):
+        """Queue jobs for the project of the user."""
+        project = self.projects[username]
+        return [
+            Job.objects.create(owner=project.owner, project=project, priority=priority)
+            for _ in range(count)
+        ]
+
+    def _claim_and_finish(self, count):
+        """Claim jobs one after the other, finishing each before claiming the next."""
+        claimed = []
+        for _ in range(count):
+            job_id = claim_next_job()
+            claimed.append(job_id)
+            Job.objects.filter(pk=job_id).update(status=Job.FINISHED)
+        return claimed
+
+    def test_claim_marks_job_as_running(self):
+        """Test that a claimed job is running and records its worker."""
+        (job,) = self._queue_jobs("alice", 1)
+
+        self.assertEqual(claim_next_job(), job.pk)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.RUNNING)
+        self.assertIsNotNone(job.claimed_time)
+        self.assertNotEqual(job.worker, "")
+        self.assertIsNone(claim_next_job())
+
+    def test_jobs_of_a_user_run_in_order(self):
+        """Test that the jobs of a user are run in the order they were queued."""
+        jobs = self._queue_jobs("alice", 3)
+
+        self.assertEqual(self._claim_and_finish(3), [job.pk for job in jobs])
+
+    def test_users_take_turns(self):
+        """Test that a user queueing many jobs doesn't hold up the jobs of others."""
+        alice_jobs = self._queue_jobs("alice", 3)
+        bob_jobs = self._queue_jobs("bob", 2)
+
+        self.assertEqual(
+            self._claim_and_finish(5),
+            [
+                alice_jobs[0].pk,
+                bob_jobs[0].pk,
+                alice_jobs[1].pk,
+                bob_jobs[1].pk,
+                alice_jobs[2].pk,
+            ],
+        )
+
+    def test_running_jobs_per_user_are_limited(self):
+        """Test that a user runs no more jobs at once than allowed."""
+        alice_jobs = self._queue_jobs("alice", 2)
+        (bob_job,) = self._queue_jobs("bob", 1)
+
+        self.assertEqual(claim_next_job(), alice_jobs[0].pk)
+        self.assertEqual(claim_next_job(), bob_job.pk)
+        self.assertIsNone(claim_next_job())
+
+        Job.objects.filter(pk=alice_jobs[0].pk).update(status=Job.FINISHED)
+        self.assertEqual(claim_next_job(), alice_jobs[1].pk)
+
+        with self.settings(JOB_MAX_RUNNING_PER_USER=2):
+            self._queue_jobs("alice", 1)
+            self.assertIsNotNone(claim_next_job())
+
+    def test_claimed_job_is_not_claimed_again(self):
+        """Test that a job claimed by another worker since reading the queue is skipped."""
+        (job,) = self._queue_jobs("alice", 1)
+        Job.objects.filter(pk=job.pk).update(status=Job.RUNNING, worker="other")
+
+        # The queue as another worker read it before claiming the job
+        with mock.patch(
+            "job_interface.job_engine._queue",
+            return_value=Job.objects.filter(pk=job.pk),
+        ):
+            self.assertIsNone(claim_next_job())
+
+        job.refresh_from_db()
+        self.assertEqual(job.worker, "other")
+
+    def test_priority_comes_first(self):
+        """Test that jobs with a higher priority are run before older ones."""
+        (alice_job,) = self._queue_jobs("alice", 1)
+        (bob_job,) = self._queue_jobs("bob", 1, priority=5)
+
+        self.assertEqual(self._claim_and_finish(2), [bob_job.pk, alice_job.pk])
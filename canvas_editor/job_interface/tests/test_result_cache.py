@@ -0,0 +1,133 @@
+import datetime
+import pathlib
+import tempfile
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+
+from canvas.test_constants import SECURE_PASSWORD, TEST_PROJECT_NAME, TEST_USERNAME
+from hdf5_management.hdf5_manager import HDF5Manager
+from job_interface import result_cache
+from job_interface.models import Job, JobResult, job_result_storage
+from project_management.models import Heliostat, LightSource, Project, Receiver
+
+PROTOTYPE_VERSION = "1-test"
+RESULT_SIZE = 100
+
+
+class ResultCacheTest(TestCase):
+    """Tests for the result cache and the result hash."""
+
+    def setUp(self):
+        """Point the cache to a temporary directory and create a test project."""
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        settings_override = self.settings(
+            JOB_RESULT_DIR=pathlib.Path(temporary_directory.name),
+            JOB_RESULT_CACHE_MAX_BYTES=3 * RESULT_SIZE,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        patch = mock.patch.object(
+            HDF5Manager, "prototype_version", return_value=PROTOTYPE_VERSION
+        )
+        patch.start()
+        self.addCleanup(patch.stop)
+
+        user = User.objects.create_user(
+            username=TEST_USERNAME, password=SECURE_PASSWORD
+        )
+        self.project = Project.objects.create(name=TEST_PROJECT_NAME, owner=user)
+        Heliostat.objects.create(project=self.project)
+        Receiver.objects.create(project=self.project)
+        self.light_source = LightSource.objects.create(project=self.project)
+
+    def _store(self, key: str, days_ago: int = 0) -> JobResult:
+        """Store a stand-in result last used the given number of days ago."""
+        half = RESULT_SIZE // 2
+        result_cache.store_result(key, b"h" * half, b"p" * half)
+        JobResult.objects.filter(key=key).update(
+            last_used=timezone.now() - datetime.timedelta(days=days_ago)
+        )
+        return JobResult.objects.get(key=key)
+
+    def _queue_job(self) -> Job:
+        """Queue a job on the test project."""
+        return Job.objects.create(owner=self.project.owner, project=self.project)
+
+    def test_key_is_stable(self):
+        """Test that an unchanged project always hashes the same."""
+        self.assertEqual(
+            result_cache.compute_result_key(self.project),
+            result_cache.compute_result_key(self.project),
+        )
+
+    def test_key_changes_with_rays_and_engine(self):
+        """Test that the number of rays, the engine and its settings change the hash."""
+        key = result_cache.compute_result_key(self.project)
+
+        with self.settings(JOB_BITMAP_RESOLUTION=16):
+            self.assertNotEqual(key, result_cache.compute_result_key(self.project))
+        with mock.patch.object(result_cache, "RAYTRACER_VERSION", 2):
+            self.assertNotEqual(key, result_cache.compute_result_key(self.project))
+
+        self.light_source.number_of_rays += 1
+        self.light_source.revision = self.project.next_revision()
+        self.light_source.save()
+        self.assertNotEqual(key, result_cache.compute_result_key(self.project))
+
+    def test_complete_job_from_cache(self):
+        """Test that a job references a stored result and is finished."""
+        job = self._queue_job()
+        self.assertFalse(result_cache.complete_job_from_cache(job.pk, "missing"))
+
+        entry = self._store("hash", days_ago=1)
+        self.assertTrue(result_cache.complete_job_from_cache(job.pk, "hash"))
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.FINISHED)
+        self.assertEqual(job.result, entry)
+        entry.refresh_from_db()
+        self.assertGreater(
+            entry.last_used, timezone.now() - datetime.timedelta(minutes=1)
+        )
+
+    def test_result_is_stored_once(self):
+        """Test that storing a result of the same hash again keeps the first one."""
+        entry = self._store("hash")
+
+        result_cache.store_result("hash", b"other", b"other")
+
+        self.assertEqual(JobResult.objects.get(), entry)
+        with entry.flux_density.open("rb") as flux_density:
+            self.assertEqual(flux_density.read(), b"h" * (RESULT_SIZE // 2))
+
+    def test_least_recently_used_unreferenced_results_are_evicted(self):
+        """Test that eviction removes unreferenced results, oldest first."""
+        referenced = self._store("referenced", days_ago=3)
+        Job.objects.filter(pk=self._queue_job().pk).update(result=referenced)
+        oldest = self._store("oldest", days_ago=2)
+        self._store("newest", days_ago=1)
+        self.assertEqual(result_cache.evict_results(), 0)
+
+        self._store("new")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(result_cache.evict_results(), 1)
+
+        self.assertEqual(
+            set(JobResult.objects.values_list("key", flat=True)),
+            {"referenced", "newest", "new"},
+        )
+        self.assertFalse(job_result_storage().exists(oldest.flux_density.name))
+        self.assertTrue(job_result_storage().exists(referenced.flux_density.name))
+
+    def test_referenced_results_are_not_evicted(self):
+        """Test that results still referenced by jobs are kept over the size limit."""
+        for key in ("first", "second", "third", "fourth"):
+            entry = self._store(key)
+            Job.objects.filter(pk=self._queue_job().pk).update(result=entry)
+
+        self.assertEqual(result_cache.evict_results(), 0)
+        self.assertEqual(JobResult.objects.count(), 4)
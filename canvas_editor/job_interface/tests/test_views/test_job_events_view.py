@@ -0,0 +1,130 @@
+import json
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.test import AsyncClient, Client, TestCase
+from django.urls import reverse
+
+from canvas.test_constants import (
+    JOB_ID_FIELD,
+    PROGRESS,
+    SECURE_PASSWORD,
+    STATUS,
+    TEST_PROJECT_NAME,
+    TEST_USERNAME,
+)
+from canvas.view_name_dict import job_events_view
+from job_interface.models import Job
+from project_management.models import Project
+
+JOBS_FIELD = "jobs"
+
+
+def _parse_events(chunk: bytes) -> list[tuple[str, dict]]:
+    """Parse the named events of a chunk of an event stream."""
+    events = []
+    for block in chunk.decode().split("\n\n"):
+        fields = dict(
+            line.split(": ", 1) for line in block.splitlines() if ": " in line
+        )
+        if "event" in fields:
+            events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+class JobEventsViewTest(TestCase):
+    """Tests for streaming the status of the jobs of a project."""
+
+    def setUp(self):
+        """Set up a test user with a project with two jobs, and log in."""
+        settings_override = self.settings(
+            JOB_EVENTS_POLL_SECONDS=0.01, JOB_EVENTS_MAX_SECONDS=5
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.user = User.objects.create_user(
+            username=TEST_USERNAME, password=SECURE_PASSWORD
+        )
+        self.project = Project.objects.create(name=TEST_PROJECT_NAME, owner=self.user)
+        self.jobs = [
+            Job.objects.create(owner=self.user, project=self.project) for _ in range(2)
+        ]
+        self.url = reverse(job_events_view, args=[self.project.pk])
+        self.async_client = AsyncClient()
+        self.async_client.force_login(self.user)
+
+    async def test_stream_starts_with_all_statuses(self):
+        """Test that the stream starts with the status of every job."""
+        response = await self.async_client.get(self.url)
+        chunks = aiter(response.streaming_content)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        chunk = await anext(chunks)
+        self.assertTrue(chunk.startswith(b"retry: 1000\n\n"))
+        ((name, data),) = _parse_events(chunk)
+        self.assertEqual(name, "status")
+        self.assertEqual(
+            [status[JOB_ID_FIELD] for status in data[JOBS_FIELD]],
+            [job.pk for job in self.jobs],
+        )
+        await chunks.aclose()
+
+    async def test_changes_are_pushed(self):
+        """Test that a progressed and a deleted job are pushed to the stream."""
+        response = await self.async_client.get(self.url)
+        chunks = aiter(response.streaming_content)
+        await anext(chunks)
+
+        await Job.objects.filter(pk=self.jobs[0].pk).aupdate(
+            status=Job.RUNNING, progress=0.5
+        )
+        removed_job_id = self.jobs[1].pk
+        await sync_to_async(self.jobs[1].delete)()
+        events = _parse_events(await anext(chunks))
+
+        self.assertEqual(
+            events,
+            [
+                ("job", {**events[0][1], STATUS: Job.RUNNING, PROGRESS: 0.5}),
+                ("removed", {JOB_ID_FIELD: removed_job_id}),
+            ],
+        )
+        self.assertEqual(events[0][1][JOB_ID_FIELD], self.jobs[0].pk)
+        await chunks.aclose()
+
+    async def test_project_of_other_user(self):
+        """Test that the jobs of another user's project are not streamed."""
+        other_user = await User.objects.acreate_user(
+            username="other", password=SECURE_PASSWORD
+        )
+        other_project = await Project.objects.acreate(
+            name=TEST_PROJECT_NAME, owner=other_user
+        )
+
+        response = await self.async_client.get(
+            reverse(job_events_view, args=[other_project.pk])
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+    async def test_stream_logged_out(self):
+        """Test that streaming when logged out redirects to login page."""
+        response = await AsyncClient().get(self.url)
+
+        self.assertEqual(response.status_code, 302)
+
+    def test_wsgi_sends_statuses_once(self):
+        """Test that served through WSGI the statuses are sent once and the browser polls."""
+        client = Client()
+        client.force_login(self.user)
+
+        response = client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.streaming)
+        self.assertTrue(response.content.startswith(b"retry: 5000\n\n"))
+        ((name, data),) = _parse_events(response.content)
+        self.assertEqual(name, "status")
+        self.assertEqual(len(data[JOBS_FIELD]), 2)
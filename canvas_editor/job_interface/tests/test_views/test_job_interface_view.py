@@ -1,34 +1,54 @@
-from datetime import timedelta
+import tempfile
+from unittest import mock
 
 from django.contrib.auth.models import User
+from django.core.files.base import ContentFile
 from django.test import Client, TestCase
 from django.urls import reverse
 from django.utils import timezone
 
 from canvas.test_constants import (
+    ERROR,
+    FAILED,
+    FINISHED,
     JOB_ID_FIELD,
     JOB_IDS_FIELD,
     PROGRESS,
     RESULT,
     SECURE_PASSWORD,
+    STAGE,
     STATUS,
     TEST_PROJECT_DESCRIPTION,
     TEST_PROJECT_NAME,
     TEST_USERNAME,
 )
-from canvas.view_name_dict import job_create_new_job_view, job_status_view
-from job_interface.models import Job
+from canvas.view_name_dict import (
+    job_create_new_job_view,
+    job_result_view,
+    job_status_view,
+)
+from hdf5_management.hdf5_manager import HDF5Manager
+from job_interface.models import Job, JobResult
 from project_management.models import Heliostat, LightSource, Project, Receiver
 
 
 class JobInterfaceViewTest(TestCase):
     """Tests for the job interface views."""
 
-    # Note: These tests rely on a mocked job interface. Progress and status updates are simulated
-    # based on elapsed time rather than actual backend computations.
-
     def setUp(self):
         """Set up a test user, log in, and create a test project and job for use in all tests."""
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        settings_override = self.settings(JOB_RESULT_DIR=temporary_directory.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        # New jobs look up stored results, which hashes the prototypes of the scenario
+        patch = mock.patch.object(
+            HDF5Manager, "prototype_version", return_value="1-test"
+        )
+        patch.start()
+        self.addCleanup(patch.stop)
+
         self.client = Client()
         self.user = User.objects.create_user(
             username=TEST_USERNAME, password=SECURE_PASSWORD
@@ -49,33 +69,40 @@ class JobInterfaceViewTest(TestCase):
         self.getJobStatus_url = reverse(
             job_status_view, args=[self.project.pk, self.job.pk]
         )
+        self.getJobResult_url = reverse(
+            job_result_view, args=[self.project.pk, self.job.pk]
+        )
 
-    def _assert_job_status(self, delta_minutes, expected_status, expect_result):
-        """Assert that the job status is as expected after a certain time has passed."""
-        self.job.starting_time = timezone.now() - timedelta(minutes=delta_minutes)
+    def _finish_job(self):
+        """Store stand-in results for the job and mark it as finished."""
+        result = JobResult(key="hash")
+        result.flux_density.save("result.h5", ContentFile(b"flux density"), save=False)
+        result.preview.save("preview.png", ContentFile(b"image"), save=False)
+        result.save()
+        self.job.result = result
+        self.job.status = Job.FINISHED
+        self.job.progress = 1
+        self.job.finishing_time = timezone.now()
         self.job.save()
 
+    def _get_job_status(self):
+        """Get the status of the job and check that it belongs to the job."""
         response = self.client.get(self.getJobStatus_url)
+        self.assertEqual(response.status_code, 200)
         data = response.json()
-
         self.assertEqual(data[JOB_ID_FIELD], self.job.pk)
-        self.assertEqual(data[STATUS], expected_status)
-        self.assertEqual(
-            data[PROGRESS],
-            round(
-                ((timezone.now() - self.job.starting_time).total_seconds() / 60) / 3, 2
-            ),
-        )
-        if expect_result:
-            self.assertIsNotNone(data[RESULT])
-        else:
-            self.assertIsNone(data[RESULT])
+        return data
 
     def test_create_new_job_post(self):
         """Test creating a new job via POST request."""
-        response = self.client.post(self.createNewJob_url)
+        with (
+            mock.patch("job_interface.job_engine.start_jobs") as start_jobs,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            response = self.client.post(self.createNewJob_url)
 
         self.assertEqual(response.status_code, 200)
+        start_jobs.assert_called_once_with()
         self.assertEqual(Job.objects.count(), 2)
         self.assertEqual(response.json()[JOB_ID_FIELD], Job.objects.last().pk)
         self.assertTrue(
@@ -84,6 +111,22 @@ class JobInterfaceViewTest(TestCase):
         self.assertEqual(Job.objects.last().owner, self.user)
         self.assertEqual(Job.objects.last().project, self.project)
 
+    def test_create_new_job_post_priority(self):
+        """Test that only staff users can give a job a priority."""
+        with mock.patch("job_interface.job_engine.start_jobs"):
+            response = self.client.post(self.createNewJob_url, {"priority": 5})
+            self.assertEqual(Job.objects.last().priority, 0)
+
+            self.user.is_staff = True
+            self.user.save()
+            response = self.client.post(self.createNewJob_url, {"priority": 5})
+            self.assertEqual(
+                Job.objects.get(pk=response.json()[JOB_ID_FIELD]).priority, 5
+            )
+
+            response = self.client.post(self.createNewJob_url, {"priority": "high"})
+            self.assertEqual(response.status_code, 400)
+
     def test_create_new_job_post_logged_out(self):
         """Test that creating a new job via POST request when logged out redirects to login page."""
         self.client.logout()
@@ -108,26 +151,49 @@ class JobInterfaceViewTest(TestCase):
 
         self.assertEqual(response.status_code, 302)
 
-    def test_get_job_status_get_creating_hdf5(self):
-        """Test retrieving job status via GET request."""
-        self._assert_job_status(
-            delta_minutes=0, expected_status="Creating HDF5 file", expect_result=False
-        )
+    def test_get_job_status_pending(self):
+        """Test retrieving the status of a job that did not start yet."""
+        data = self._get_job_status()
 
-    def test_get_job_status_get_aligning_heliostats(self):
-        """Test retrieving job status via GET request."""
-        self._assert_job_status(
-            delta_minutes=2.5,
-            expected_status="Aligning Heliostats",
-            expect_result=False,
+        self.assertEqual(data[STATUS], Job.PENDING)
+        self.assertEqual(data[PROGRESS], 0)
+        self.assertIsNone(data[RESULT])
+
+    def test_get_job_status_running(self):
+        """Test retrieving the stage and progress of a running job."""
+        Job.objects.filter(pk=self.job.pk).update(
+            status=Job.RUNNING, stage="Ray tracing", progress=0.5
         )
 
-    def test_get_job_status_get_finished(self):
-        """Test retrieving job status via GET request."""
-        self._assert_job_status(
-            delta_minutes=3, expected_status="Finished", expect_result=True
+        data = self._get_job_status()
+
+        self.assertEqual(data[STATUS], Job.RUNNING)
+        self.assertEqual(data[STAGE], "Ray tracing")
+        self.assertEqual(data[PROGRESS], 0.5)
+        self.assertIsNone(data[RESULT])
+
+    def test_get_job_status_finished(self):
+        """Test that a finished job links to its result."""
+        self._finish_job()
+
+        data = self._get_job_status()
+
+        self.assertEqual(data[STATUS], FINISHED)
+        self.assertEqual(data[PROGRESS], 1)
+        self.assertEqual(data[RESULT], self.getJobResult_url)
+
+    def test_get_job_status_failed(self):
+        """Test that a failed job reports its error and has no result."""
+        Job.objects.filter(pk=self.job.pk).update(
+            status=Job.FAILED, stage="Ray tracing", error="Out of memory"
         )
 
+        data = self._get_job_status()
+
+        self.assertEqual(data[STATUS], FAILED)
+        self.assertEqual(data[ERROR], "Out of memory")
+        self.assertIsNone(data[RESULT])
+
     def test_get_job_status_get_logged_out(self):
         """Test that retrieving job status via GET request when logged out redirects to login page."""
         self.client.logout()
@@ -137,8 +203,46 @@ class JobInterfaceViewTest(TestCase):
         self.assertEqual(response.status_code, 302)
 
     def test_get_job_status_delete(self):
-        """Test deleting a job via DELETE request."""
+        """Test deleting a job via DELETE request, which keeps its result cached."""
+        self._finish_job()
+
         response = self.client.delete(self.getJobStatus_url)
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(Job.objects.count(), 0)
+        self.assertEqual(JobResult.objects.get().jobs.count(), 0)
+
+    def test_get_job_result(self):
+        """Test that the result of a finished job is shown as an image."""
+        self._finish_job()
+
+        response = self.client.get(self.getJobResult_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), b"image")
+        self.assertNotIn("attachment", response["Content-Disposition"])
+
+    def test_get_job_result_h5(self):
+        """Test downloading the flux density of a finished job."""
+        self._finish_job()
+
+        response = self.client.get(self.getJobResult_url, {"format": "h5"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), b"flux density")
+        self.assertIn("attachment", response["Content-Disposition"])
+
+    def test_get_job_result_unfinished(self):
+        """Test that a job without a result responds with not found."""
+        response = self.client.get(self.getJobResult_url)
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_get_job_result_logged_out(self):
+        """Test that getting a job result when logged out redirects to login page."""
+        self._finish_job()
+        self.client.logout()
+
+        response = self.client.get(self.getJobResult_url)
+
+        self.assertEqual(response.status_code, 302)
@@ -0,0 +1,116 @@
+from django.contrib.auth.models import User
+from django.test import Client, TestCase
+from django.urls import reverse
+
+from canvas.test_constants import (
+    JOB_ID_FIELD,
+    PROGRESS,
+    RESULT,
+    SECURE_PASSWORD,
+    STAGE,
+    STATUS,
+    TEST_PROJECT_NAME,
+    TEST_USERNAME,
+)
+from canvas.view_name_dict import job_project_status_view, job_result_view
+from job_interface.models import Job
+from project_management.models import Project
+
+JOBS_FIELD = "jobs"
+NUMBER_OF_JOBS = 20
+
+
+class ProjectJobStatusViewTest(TestCase):
+    """Tests for getting the status of all jobs of a project at once."""
+
+    def setUp(self):
+        """Set up a test user, log in, and create a project with jobs."""
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username=TEST_USERNAME, password=SECURE_PASSWORD
+        )
+        self.client.login(username=TEST_USERNAME, password=SECURE_PASSWORD)
+        self.project = Project.objects.create(name=TEST_PROJECT_NAME, owner=self.user)
+        self.jobs = [
+            Job.objects.create(owner=self.user, project=self.project)
+            for _ in range(NUMBER_OF_JOBS)
+        ]
+        self.url = reverse(job_project_status_view, args=[self.project.pk])
+
+    def test_get_statuses(self):
+        """Test that the status of every job is returned with one query for the jobs."""
+        Job.objects.filter(pk=self.jobs[0].pk).update(status=Job.FINISHED, progress=1)
+        Job.objects.filter(pk=self.jobs[1].pk).update(
+            status=Job.RUNNING, stage="Ray tracing", progress=0.5
+        )
+
+        # The session, the user and the jobs
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        statuses = response.json()[JOBS_FIELD]
+        self.assertEqual(
+            [status[JOB_ID_FIELD] for status in statuses],
+            [job.pk for job in self.jobs],
+        )
+        self.assertEqual(statuses[0][STATUS], Job.FINISHED)
+        self.assertEqual(
+            statuses[0][RESULT],
+            reverse(job_result_view, args=[self.project.pk, self.jobs[0].pk]),
+        )
+        self.assertEqual(statuses[1][STAGE], "Ray tracing")
+        self.assertEqual(statuses[1][PROGRESS], 0.5)
+        self.assertIsNone(statuses[1][RESULT])
+
+    def test_unchanged_statuses_are_not_sent_again(self):
+        """Test that a poll with the entity tag of unchanged statuses returns 304."""
+        etag = self.client.get(self.url)["ETag"]
+
+        response = self.client.get(self.url, headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+    def test_changed_statuses_are_sent(self):
+        """Test that a poll after a job progressed returns the new statuses."""
+        etag = self.client.get(self.url)["ETag"]
+        Job.objects.filter(pk=self.jobs[-1].pk).update(progress=0.25)
+
+        response = self.client.get(self.url, headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.json()[JOBS_FIELD][-1][PROGRESS], 0.25)
+
+    def test_project_without_jobs(self):
+        """Test that a project without jobs returns an empty list."""
+        Job.objects.all().delete()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()[JOBS_FIELD], [])
+
+    def test_project_of_other_user(self):
+        """Test that the jobs of another user's project are not found."""
+        other_user = User.objects.create_user(
+            username="other", password=SECURE_PASSWORD
+        )
+        other_project = Project.objects.create(name=TEST_PROJECT_NAME, owner=other_user)
+        Job.objects.create(owner=other_user, project=other_project)
+
+        response = self.client.get(
+            reverse(job_project_status_view, args=[other_project.pk])
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_get_statuses_logged_out(self):
+        """Test that getting the statuses when logged out redirects to login page."""
+        self.client.logout()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 302)
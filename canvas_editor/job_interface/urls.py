@@ -1,8 +1,11 @@
 from django.urls import path
 
 from canvas import view_name_dict
+from job_interface.views.job_events_view import JobEventsView
 from job_interface.views.job_management_view import JobManagementView
+from job_interface.views.job_result_view import JobResultView
 from job_interface.views.job_status_view import JobStatusView
+from job_interface.views.project_job_status_view import ProjectJobStatusView
 
 urlpatterns = [
     path(
@@ -10,9 +13,24 @@ urlpatterns = [
         JobManagementView.as_view(),
         name=view_name_dict.job_create_new_job_view,
     ),
+    path(
+        "<str:project_id>/status/",
+        ProjectJobStatusView.as_view(),
+        name=view_name_dict.job_project_status_view,
+    ),
+    path(
+        "<str:project_id>/events/",
+        JobEventsView.as_view(),
+        name=view_name_dict.job_events_view,
+    ),
     path(
         "<str:project_id>/<int:job_id>/",
         JobStatusView.as_view(),
         name=view_name_dict.job_status_view,
     ),
+    path(
+        "<str:project_id>/<int:job_id>/result/",
+        JobResultView.as_view(),
+        name=view_name_dict.job_result_view,
+    ),
 ]
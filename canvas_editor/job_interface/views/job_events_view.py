@@ -0,0 +1,110 @@
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.contrib.auth.views import redirect_to_login
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.views import View
+
+from job_interface.views.utils import job_status_data, project_jobs
+from project_management.models import Project
+
+KEEPALIVE_SECONDS = 15
+"""Seconds without an event after which a comment is sent, so proxies keep the stream open."""
+
+RECONNECT_MILLISECONDS = 1000
+"""Milliseconds the browser waits before reconnecting to a stream that ended."""
+
+WSGI_RECONNECT_MILLISECONDS = 5000
+"""Milliseconds the browser waits before reconnecting when served through WSGI."""
+
+
+def _event(name: str, data: dict) -> str:
+    """Format a server-sent event."""
+    return f"event: {name}\ndata: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n"
+
+
+def _opening_events(statuses: dict[int, dict], reconnect_milliseconds: int) -> str:
+    """Format the events starting a stream: the reconnection delay and all statuses."""
+    return f"retry: {reconnect_milliseconds}\n\n" + _event(
+        "status", {"jobs": list(statuses.values())}
+    )
+
+
+async def _statuses(user: User, project_id: str) -> dict[int, dict]:
+    """Get the status of every job of the project by its id."""
+    return {
+        job.pk: job_status_data(job) async for job in project_jobs(user, project_id)
+    }
+
+
+class JobEventsView(View):
+    """View to stream the status of the jobs of a project as server-sent events.
+
+    The stream starts with a ``status`` event holding the status of every job, like
+    ``ProjectJobStatusView``. Afterwards, a ``job`` event is sent with the status of every
+    job that changed and a ``removed`` event with the id of every deleted job. The jobs run
+    in worker processes, possibly on other nodes, which only report to the database. So
+    the stream reads the statuses every ``JOB_EVENTS_POLL_SECONDS`` and sends the changes.
+
+    The view is asynchronous, so served through ``canvas.asgi`` a stream holds no thread
+    while waiting. A stream ends after ``JOB_EVENTS_MAX_SECONDS`` and the browser
+    reconnects. Served through WSGI, a stream would hold a thread and be buffered
+    entirely, so it ends after the first event, which makes the browser poll instead.
+    """
+
+    async def get(self, request, project_id):
+        """Stream the status of the jobs of the specified project."""
+        user = await request.auser()
+        if not user.is_authenticated:
+            return redirect_to_login(request.get_full_path())
+        if not await Project.objects.filter(pk=project_id, owner=user).aexists():
+            raise Http404
+
+        statuses = await _statuses(user, project_id)
+        if isinstance(request, ASGIRequest):
+            response = StreamingHttpResponse(
+                self._events(user, project_id, statuses),
+                content_type="text/event-stream",
+            )
+        else:
+            response = HttpResponse(
+                _opening_events(statuses, WSGI_RECONNECT_MILLISECONDS),
+                content_type="text/event-stream",
+            )
+        response["Cache-Control"] = "no-cache"
+        # Keep reverse proxies from buffering the stream
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    async def _events(
+        self, user: User, project_id: str, statuses: dict[int, dict]
+    ) -> AsyncIterator[str]:
+        """Send the status of all jobs and then the changes until the stream ends."""
+        yield _opening_events(statuses, RECONNECT_MILLISECONDS)
+
+        started = last_sent = time.monotonic()
+        while time.monotonic() - started < settings.JOB_EVENTS_MAX_SECONDS:
+            await asyncio.sleep(settings.JOB_EVENTS_POLL_SECONDS)
+            current = await _statuses(user, project_id)
+            events = [
+                _event("job", status)
+                for job_id, status in current.items()
+                if statuses.get(job_id) != status
+            ] + [
+                _event("removed", {"jobID": job_id})
+                for job_id in statuses.keys() - current.keys()
+            ]
+            statuses = current
+
+            if events:
+                last_sent = time.monotonic()
+                yield "".join(events)
+            elif time.monotonic() - last_sent >= KEEPALIVE_SECONDS:
+                last_sent = time.monotonic()
+                yield ": keepalive\n\n"
@@ -1,8 +1,11 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import JsonResponse
+from django.http import HttpResponseBadRequest, JsonResponse
 from django.shortcuts import get_object_or_404
 from django.views import View
 
+from autosave_api.write_behind import write_behind
+from canvas.message_dict import invalid_job_priority_text
+from job_interface.job_engine import schedule_job
 from job_interface.models import Job
 from project_management.models import Project
 
@@ -20,7 +23,21 @@ class JobManagementView(LoginRequiredMixin, View):
         return JsonResponse({"jobIDs": job_ids})
 
     def post(self, request, project_id):
-        """Create a new job for the specified project."""
+        """Queue a new job for the specified project in the job engine.
+
+        Staff users may give the job a priority, jobs with a higher priority are run first.
+        """
         project = get_object_or_404(Project, owner=request.user, pk=project_id)
-        new_job = Job.objects.create(owner=request.user, project=project)
+        priority = 0
+        if request.user.is_staff and "priority" in request.POST:
+            try:
+                priority = int(request.POST["priority"])
+            except ValueError:
+                return HttpResponseBadRequest(invalid_job_priority_text)
+        # The job exports the project as it is written, including queued autosave updates
+        write_behind.flush(project.pk)
+        new_job = Job.objects.create(
+            owner=request.user, project=project, priority=priority
+        )
+        schedule_job(new_job)
         return JsonResponse({"jobID": new_job.pk})
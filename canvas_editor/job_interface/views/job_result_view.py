@@ -0,0 +1,39 @@
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import FileResponse, Http404
+from django.shortcuts import get_object_or_404
+from django.views import View
+
+from job_interface.models import Job
+from project_management.models import Project
+
+
+class JobResultView(LoginRequiredMixin, View):
+    """View to get the result of a finished job."""
+
+    def get(self, request, job_id, project_id):
+        """Get an image of the flux density, or all of it with ``?format=h5``."""
+        project = get_object_or_404(Project, owner=request.user, pk=project_id)
+        job = get_object_or_404(
+            Job.objects.select_related("result"),
+            pk=job_id,
+            owner=request.user,
+            project=project,
+            status=Job.FINISHED,
+        )
+        if job.result is None:
+            raise Http404
+
+        if request.GET.get("format") == "h5":
+            file = job.result.flux_density
+            filename = f"{project.name}_job_{job.pk}.h5"
+        else:
+            file = job.result.preview
+            filename = f"{project.name}_job_{job.pk}.png"
+        if not file or not file.storage.exists(file.name):
+            raise Http404
+
+        return FileResponse(
+            file.open("rb"),
+            as_attachment=request.GET.get("format") == "h5",
+            filename=filename,
+        )
@@ -0,0 +1,43 @@
+import hashlib
+import json
+
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import Http404, HttpResponse
+from django.utils.cache import patch_cache_control
+from django.views import View
+
+from editor.views.utils import not_modified_response
+from job_interface.views.utils import job_status_data, project_jobs
+from project_management.models import Project
+
+
+class ProjectJobStatusView(LoginRequiredMixin, View):
+    """View to get the status of all jobs of a project at once.
+
+    The job interface polls this view instead of the status of every single job. The
+    statuses are read with one query and the response carries an entity tag, so a poll
+    while no job changed is answered with 304.
+    """
+
+    def get(self, request, project_id):
+        """Get the status of every job of the specified project."""
+        statuses = [
+            job_status_data(job) for job in project_jobs(request.user, project_id)
+        ]
+        # A project without jobs is looked up to tell it apart from a foreign one
+        if (
+            not statuses
+            and not Project.objects.filter(pk=project_id, owner=request.user).exists()
+        ):
+            raise Http404
+
+        content = json.dumps({"jobs": statuses}, cls=DjangoJSONEncoder).encode()
+        etag = f'"{hashlib.md5(content, usedforsecurity=False).hexdigest()}"'
+        response = not_modified_response(request, etag)
+        if response is None:
+            response = HttpResponse(content, content_type="application/json")
+            response["ETag"] = etag
+        # The statuses change while a job runs, so every poll is revalidated
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
@@ -0,0 +1,57 @@
+from django.contrib.auth.models import User
+from django.db.models import QuerySet
+from django.urls import reverse
+
+from canvas import view_name_dict
+from job_interface.models import Job
+
+STATUS_FIELDS = ["pk", "project_id", "status", "stage", "progress", "error"]
+"""The fields of a job needed for its status, for loading nothing else."""
+
+
+def job_status_data(job: Job) -> dict:
+    """Get the status of a job as reported to the job interface.
+
+    Parameters
+    ----------
+    job : Job
+        The job, with at least the ``STATUS_FIELDS`` loaded.
+
+    Returns
+    -------
+    dict
+        The id, status, stage, progress, result url and error of the job.
+    """
+    result = None
+    if job.status == Job.FINISHED:
+        result = reverse(view_name_dict.job_result_view, args=[job.project_id, job.pk])
+    return {
+        "jobID": job.pk,
+        "status": job.status,
+        "stage": job.stage,
+        "progress": job.progress,
+        "result": result,
+        "error": job.error,
+    }
+
+
+def project_jobs(user: User, project_id: str) -> QuerySet[Job]:
+    """Get the jobs of a project of the user for reading their status.
+
+    Parameters
+    ----------
+    user : User
+        The user owning the project.
+    project_id : str
+        The id of the project.
+
+    Returns
+    -------
+    QuerySet[Job]
+        The jobs in the order they were created, with only the ``STATUS_FIELDS`` loaded.
+    """
+    return (
+        Job.objects.filter(owner=user, project=project_id, project__owner=user)
+        .only(*STATUS_FIELDS)
+        .order_by("starting_time", "pk")
+    )
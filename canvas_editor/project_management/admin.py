@@ -4,8 +4,10 @@ from project_management.models import (
     Heliostat,
     LightSource,
     Project,
+    ProjectImport,
     Receiver,
     Settings,
+    Tombstone,
 )
 
 # Registering all models
@@ -14,3 +16,5 @@ admin.site.register(Heliostat)
 admin.site.register(Receiver)
 admin.site.register(LightSource)
 admin.site.register(Settings)
+admin.site.register(ProjectImport)
+admin.site.register(Tombstone)
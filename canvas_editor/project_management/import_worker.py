@@ -0,0 +1,115 @@
+"""A module for importing uploaded projects in a background worker pool."""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+from hdf5_management.hdf5_manager import HDF5Manager
+from project_management.models import ProjectImport
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_INTERVAL = 0.5
+"""Minimum number of seconds between two progress updates written to the database."""
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the worker pool of this process, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.PROJECT_IMPORT_WORKERS,
+                thread_name_prefix="project-import",
+            )
+        return _executor
+
+
+def schedule_import(project_import: ProjectImport):
+    """Start the import once the transaction creating it is committed.
+
+    Parameters
+    ----------
+    project_import : ProjectImport
+        The import to run.
+    """
+    project_import_id = project_import.pk
+    transaction.on_commit(lambda: start_import(project_import_id))
+
+
+def start_import(project_import_id: int):
+    """Hand the import to the worker pool, or run it right away without workers."""
+    if settings.PROJECT_IMPORT_WORKERS == 0:
+        run_import(project_import_id)
+    else:
+        _get_executor().submit(_run_in_worker, project_import_id)
+
+
+def _run_in_worker(project_import_id: int):
+    """Run the import in a worker thread, which manages its own database connection."""
+    close_old_connections()
+    try:
+        run_import(project_import_id)
+    except Exception:
+        logger.exception("Project import %s crashed", project_import_id)
+    finally:
+        close_old_connections()
+
+
+def run_import(project_import_id: int):
+    """Import the uploaded file into its project.
+
+    Only pending imports are run, so an import handed out twice is only run once. The
+    progress is written to the database while the file is read, and the upload is removed
+    once the import is done.
+
+    Parameters
+    ----------
+    project_import_id : int
+        The id of the import to run.
+    """
+    claimed = ProjectImport.objects.filter(
+        pk=project_import_id, status=ProjectImport.PENDING
+    ).update(status=ProjectImport.RUNNING)
+    if not claimed:
+        return
+    project_import = ProjectImport.objects.select_related("project").get(
+        pk=project_import_id
+    )
+
+    last_update = 0.0
+
+    def report_progress(stage: str, processed: int, total: int):
+        nonlocal last_update
+        now = time.monotonic()
+        # The last report before saving is always written, so the count ends up complete.
+        if stage != "saving" and now - last_update < PROGRESS_INTERVAL:
+            return
+        last_update = now
+        ProjectImport.objects.filter(pk=project_import_id).update(
+            stage=stage, processed=processed, total=total
+        )
+
+    try:
+        with project_import.file.open("rb") as project_file:
+            HDF5Manager.create_project_from_hdf5_file(
+                project_file,
+                project_import.project,
+                progress_callback=report_progress,
+            )
+    except Exception as error:
+        logger.exception("Importing %s failed", project_import.project)
+        project_import.status = ProjectImport.FAILED
+        project_import.error = str(error) or type(error).__name__
+    else:
+        project_import.status = ProjectImport.FINISHED
+
+    project_import.file.delete(save=False)
+    project_import.save(update_fields=["status", "error", "file"])
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from project_management.import_worker import run_import
+from project_management.models import ProjectImport
+
+
+class Command(BaseCommand):
+    """Run project imports that were interrupted, e.g. by a restart of the server.
+
+    Run it while the server is stopped, running imports are considered interrupted.
+    """
+
+    help = "Run all unfinished project imports."
+
+    def handle(self, *args, **options):
+        """Reset interrupted imports and run all unfinished ones."""
+        ProjectImport.objects.filter(status=ProjectImport.RUNNING).update(
+            status=ProjectImport.PENDING
+        )
+        project_import_ids = ProjectImport.objects.filter(
+            status=ProjectImport.PENDING
+        ).values_list("pk", flat=True)
+        for project_import_id in project_import_ids:
+            run_import(project_import_id)
+            project_import = ProjectImport.objects.get(pk=project_import_id)
+            self.stdout.write(f"{project_import.project}: {project_import.status}")
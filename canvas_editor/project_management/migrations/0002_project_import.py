@@ -0,0 +1,81 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:06
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+import project_management.models
+
+
+class Migration(migrations.Migration):
+    """Add the background project import."""
+
+    dependencies = [
+        ("project_management", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="lightsource",
+            name="distribution_type",
+            field=models.CharField(default="normal", max_length=50),
+        ),
+        migrations.AlterField(
+            model_name="lightsource",
+            name="light_source_type",
+            field=models.CharField(default="sun", max_length=50),
+        ),
+        migrations.AlterField(
+            model_name="receiver",
+            name="receiver_type",
+            field=models.CharField(default="planar", max_length=50),
+        ),
+        migrations.CreateModel(
+            name="ProjectImport",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "file",
+                    models.FileField(
+                        blank=True,
+                        storage=project_management.models.project_import_storage,
+                        upload_to="",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("running", "Running"),
+                            ("finished", "Finished"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                    ),
+                ),
+                ("stage", models.CharField(blank=True, default="", max_length=50)),
+                ("processed", models.IntegerField(default=0)),
+                ("total", models.IntegerField(default=0)),
+                ("error", models.TextField(blank=True, default="")),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    "project",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="import_task",
+                        to="project_management.project",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Add the export profile to the project settings."""
+
+    dependencies = [
+        ("project_management", "0002_project_import"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="settings",
+            name="export_profile",
+            field=models.CharField(
+                choices=[
+                    ("fitted", "Surface fitted to deflectometry data"),
+                    ("ideal", "Ideal surface"),
+                ],
+                default="fitted",
+                max_length=20,
+            ),
+        ),
+    ]
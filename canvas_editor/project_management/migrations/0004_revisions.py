@@ -0,0 +1,100 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:32
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Add revisions and tombstones for syncing the changes of a project."""
+
+    dependencies = [
+        ("project_management", "0003_settings_export_profile"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Tombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "object_type",
+                    models.CharField(
+                        choices=[
+                            ("heliostats", "Heliostat"),
+                            ("receivers", "Receiver"),
+                            ("light_sources", "Light source"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("object_id", models.PositiveBigIntegerField()),
+                ("revision", models.PositiveBigIntegerField()),
+            ],
+        ),
+        migrations.AddField(
+            model_name="heliostat",
+            name="revision",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="lightsource",
+            name="revision",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="revision",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="receiver",
+            name="revision",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="settings",
+            name="revision",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name="heliostat",
+            index=models.Index(
+                fields=["project", "revision"], name="project_man_project_ea984f_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="lightsource",
+            index=models.Index(
+                fields=["project", "revision"], name="project_man_project_3b09b7_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="receiver",
+            index=models.Index(
+                fields=["project", "revision"], name="project_man_project_8b3add_idx"
+            ),
+        ),
+        migrations.AddField(
+            model_name="tombstone",
+            name="project",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="tombstones",
+                to="project_management.project",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tombstone",
+            index=models.Index(
+                fields=["project", "revision"], name="project_man_project_319d4f_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Index the heliostats by position for listing a region of a project."""
+
+    dependencies = [
+        ("project_management", "0004_revisions"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="heliostat",
+            index=models.Index(
+                fields=["project", "position_x", "position_y"],
+                name="project_man_project_822f98_idx",
+            ),
+        ),
+    ]
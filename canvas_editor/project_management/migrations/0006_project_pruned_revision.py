@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 11:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Track up to which revision the tombstones of a project are pruned."""
+
+    dependencies = [
+        ("project_management", "0005_heliostat_position_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="pruned_revision",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+    ]
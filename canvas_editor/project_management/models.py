@@ -1,5 +1,10 @@
+import os
+
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.files.storage import FileSystemStorage
 from django.db import models
+from django.db.models import F
 from django.utils import timezone
 
 
@@ -15,6 +20,10 @@ class Project(models.Model):
         upload_to="project_previews/",
     )
     owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name="projects")
+    # Increases with every change of the components, so clients can sync only the changes
+    revision = models.PositiveBigIntegerField(default=0)
+    # The tombstones up to this revision are pruned, older clients have to load the whole project
+    pruned_revision = models.PositiveBigIntegerField(default=0)
 
     class Meta:
         """Specifies that the name and owner field must be unique together."""
@@ -23,11 +32,44 @@ class Project(models.Model):
         unique_together = [["name", "owner"]]
 
     def save(self, *args, **kwargs):
-        """Create the settings object on save if not yet created."""
+        """Create the settings object on save if not yet created.
+
+        The revision is only changed by ``next_revision`` and the pruned revision by
+        ``Tombstone.bury``, so saving an outdated instance does not reset them.
+        """
+        if (
+            self.pk is not None
+            and not self._state.adding
+            and kwargs.get("update_fields") is None
+            and not kwargs.get("force_insert")
+        ):
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in ("revision", "pruned_revision")
+            ]
         super().save(*args, **kwargs)
         if not hasattr(self, "settings"):
             Settings.objects.create(project=self)
 
+    def next_revision(self) -> int:
+        """Increase the revision of the project for a change of its components.
+
+        Call this in the transaction of the change, so the revision is only increased if the
+        change is saved.
+
+        Returns
+        -------
+        int
+            The new revision, which the changed components are saved with.
+        """
+        Project.objects.filter(pk=self.pk).update(revision=F("revision") + 1)
+        self.revision = Project.objects.values_list("revision", flat=True).get(
+            pk=self.pk
+        )
+        return self.revision
+
     def __str__(self) -> str:
         """Get the name of the project."""
         return self.name
@@ -46,6 +88,16 @@ class Heliostat(models.Model):
     position_x = models.FloatField(default=0)
     position_y = models.FloatField(default=0)
     position_z = models.FloatField(default=0)
+    # The revision of the project this heliostat was last changed in
+    revision = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        """Index the heliostats by revision for syncing the changes and by position for listing a region of a project."""
+
+        indexes = [
+            models.Index(fields=["project", "revision"]),
+            models.Index(fields=["project", "position_x", "position_y"]),
+        ]
 
     # actuator config
     def __str__(self) -> str:
@@ -79,6 +131,14 @@ class Receiver(models.Model):
     curvature_e = models.FloatField(default=0)
     curvature_u = models.FloatField(default=0)
 
+    # The revision of the project this receiver was last changed in
+    revision = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        """Index the receivers by revision for syncing the changes of a project."""
+
+        indexes = [models.Index(fields=["project", "revision"])]
+
     def __str__(self) -> str:
         """Get the stringified version of the receiver."""
         return str(self.project) + " Receiver " + str(self.pk)
@@ -100,6 +160,14 @@ class LightSource(models.Model):
     mean = models.FloatField(default=0)
     covariance = models.FloatField(default=4.3681e-06)
 
+    # The revision of the project this light source was last changed in
+    revision = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        """Index the light sources by revision for syncing the changes of a project."""
+
+        indexes = [models.Index(fields=["project", "revision"])]
+
     def __str__(self) -> str:
         """Get the stringified version of the light source."""
         return str(self.project) + " LightSource " + str(self.pk)
@@ -116,6 +184,156 @@ class Settings(models.Model):
     shadows = models.BooleanField(default=True)
     fog = models.BooleanField(default=True)
 
+    # Export settings
+    FITTED = "fitted"
+    IDEAL = "ideal"
+    EXPORT_PROFILE_CHOICES = [
+        (FITTED, "Surface fitted to deflectometry data"),
+        (IDEAL, "Ideal surface"),
+    ]
+    export_profile = models.CharField(
+        max_length=20, choices=EXPORT_PROFILE_CHOICES, default=FITTED
+    )
+
+    # The revision of the project the settings were last changed in
+    revision = models.PositiveBigIntegerField(default=0)
+
     def __str__(self) -> str:
         """Get the stringified version of the settings module."""
         return str(self.project) + " Settings"
+
+
+class Tombstone(models.Model):
+    """Represents a deleted component of a project, so clients syncing the changes can delete it too."""
+
+    HELIOSTATS = "heliostats"
+    RECEIVERS = "receivers"
+    LIGHT_SOURCES = "light_sources"
+    OBJECT_TYPE_CHOICES = [
+        (HELIOSTATS, "Heliostat"),
+        (RECEIVERS, "Receiver"),
+        (LIGHT_SOURCES, "Light source"),
+    ]
+
+    project = models.ForeignKey(
+        Project, related_name="tombstones", on_delete=models.CASCADE
+    )
+    object_type = models.CharField(max_length=20, choices=OBJECT_TYPE_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    # The revision of the project the component was deleted in
+    revision = models.PositiveBigIntegerField()
+
+    class Meta:
+        """Index the tombstones by revision for syncing the changes of a project."""
+
+        indexes = [models.Index(fields=["project", "revision"])]
+
+    @classmethod
+    def bury(
+        cls, project: Project, model: type[models.Model], object_ids, revision: int
+    ):
+        """Record the deletion of components of a project.
+
+        The tombstones older than ``TOMBSTONE_RETENTION_REVISIONS`` revisions are pruned,
+        clients syncing from a revision before them have to load the whole project again.
+
+        Parameters
+        ----------
+        project : Project
+            The project the components were deleted from.
+        model : type[models.Model]
+            The model of the components, a heliostat, receiver or light source.
+        object_ids : Iterable[int]
+            The ids of the deleted components.
+        revision : int
+            The revision of the project the components were deleted in.
+        """
+        # The object types are named like the relations of the project
+        object_type = model._meta.get_field("project").remote_field.related_name
+        cls.objects.bulk_create(
+            cls(
+                project=project,
+                object_type=object_type,
+                object_id=object_id,
+                revision=revision,
+            )
+            for object_id in object_ids
+        )
+
+        pruned_revision = revision - settings.TOMBSTONE_RETENTION_REVISIONS
+        if pruned_revision <= 0:
+            return
+        # Only the first deletion past the retention window of a revision prunes
+        if Project.objects.filter(
+            pk=project.pk, pruned_revision__lt=pruned_revision
+        ).update(pruned_revision=pruned_revision):
+            project.pruned_revision = pruned_revision
+            cls.objects.filter(project=project, revision__lte=pruned_revision).delete()
+
+    def __str__(self) -> str:
+        """Get the stringified version of the tombstone."""
+        return f"{self.project} deleted {self.object_type} {self.object_id}"
+
+
+class ProjectImportStorage(FileSystemStorage):
+    """Stores uploaded project files apart from the public media files."""
+
+    @property
+    def base_location(self) -> str:
+        """The directory from the settings, read on every access so it can be overridden."""
+        return str(settings.PROJECT_IMPORT_DIR)
+
+    @property
+    def location(self) -> str:
+        """The absolute path of the directory."""
+        return os.path.abspath(self.base_location)
+
+
+def project_import_storage() -> ProjectImportStorage:
+    """Get the storage for uploaded project files."""
+    return ProjectImportStorage()
+
+
+class ProjectImport(models.Model):
+    """Represents the import of a project from an uploaded HDF5 file, which runs in the background."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    FINISHED = "finished"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (PENDING, "Pending"),
+        (RUNNING, "Running"),
+        (FINISHED, "Finished"),
+        (FAILED, "Failed"),
+    ]
+
+    project = models.OneToOneField(
+        Project, related_name="import_task", on_delete=models.CASCADE
+    )
+    # The upload is kept until the import is done, so it survives a restart of the worker
+    file = models.FileField(storage=project_import_storage, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=PENDING)
+    stage = models.CharField(max_length=50, blank=True, default="")
+    processed = models.IntegerField(default=0)
+    total = models.IntegerField(default=0)
+    error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(default=timezone.now)
+
+    @property
+    def is_done(self) -> bool:
+        """Whether the import has finished or failed."""
+        return self.status in (self.FINISHED, self.FAILED)
+
+    @property
+    def progress(self) -> float:
+        """The fraction of components imported so far."""
+        if self.status == self.FINISHED:
+            return 1.0
+        if self.total == 0:
+            return 0.0
+        return round(self.processed / self.total, 2)
+
+    def __str__(self) -> str:
+        """Get the stringified version of the project import."""
+        return str(self.project) + " Import"
@@ -0,0 +1,155 @@
+import pathlib
+import tempfile
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import Client, TestCase
+from django.urls import reverse
+
+from canvas.path_dict import hdf5_management_test_scenario_template
+from canvas.test_constants import (
+    DESCRIPTION_FIELD,
+    FILE_FIELD,
+    NAME_FIELD,
+    PROJECT_DESCRIPTION_PROJECT_PAGE_TEST,
+    PROJECT_NAME_PROJECT_PAGE_TEST,
+    SECURE_PASSWORD,
+    TEST_USERNAME,
+)
+from canvas.view_name_dict import (
+    editor_view,
+    project_import_status_view,
+    project_import_view,
+    project_projects_view,
+)
+from hdf5_management.hdf5_manager import HDF5Manager
+from project_management.import_worker import run_import
+from project_management.models import Project, ProjectImport
+
+
+class ProjectImportTest(TestCase):
+    """Tests for importing uploaded projects in the background."""
+
+    def setUp(self):
+        """Log in a test user and store uploads in a temporary directory."""
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.import_dir = pathlib.Path(temporary_directory.name)
+        settings_override = self.settings(
+            PROJECT_IMPORT_DIR=self.import_dir, PROJECT_IMPORT_WORKERS=0
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username=TEST_USERNAME, password=SECURE_PASSWORD
+        )
+        self.client.login(username=TEST_USERNAME, password=SECURE_PASSWORD)
+
+        self.scenario_path = (
+            pathlib.Path(settings.BASE_DIR) / hdf5_management_test_scenario_template
+        )
+        self.import_url = reverse(
+            project_import_view, args=[PROJECT_NAME_PROJECT_PAGE_TEST]
+        )
+        self.status_url = reverse(
+            project_import_status_view, args=[PROJECT_NAME_PROJECT_PAGE_TEST]
+        )
+        self.editor_url = reverse(editor_view, args=[PROJECT_NAME_PROJECT_PAGE_TEST])
+
+    def _upload(self, content: bytes | None = None, run: bool = True):
+        """Upload a project file, running the import if requested."""
+        if content is None:
+            content = self.scenario_path.read_bytes()
+        with self.captureOnCommitCallbacks(execute=run):
+            return self.client.post(
+                reverse(project_projects_view),
+                {
+                    NAME_FIELD: PROJECT_NAME_PROJECT_PAGE_TEST,
+                    DESCRIPTION_FIELD: PROJECT_DESCRIPTION_PROJECT_PAGE_TEST,
+                    FILE_FIELD: SimpleUploadedFile("scenario.h5", content),
+                },
+            )
+
+    def test_upload_redirects_to_import(self):
+        """Test that an upload returns before the import and stores the file."""
+        response = self._upload(run=False)
+
+        self.assertRedirects(response, self.import_url)
+        project_import = ProjectImport.objects.get()
+        self.assertEqual(project_import.status, ProjectImport.PENDING)
+        self.assertTrue((self.import_dir / project_import.file.name).is_file())
+
+        status = self.client.get(self.status_url).json()
+        self.assertEqual(status["status"], ProjectImport.PENDING)
+        self.assertEqual(status["progress"], 0.0)
+
+    def test_editor_waits_for_import(self):
+        """Test that the editor redirects to the import page while importing."""
+        self._upload(run=False)
+
+        response = self.client.get(self.editor_url)
+
+        self.assertRedirects(response, self.import_url)
+        response = self.client.get(self.import_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "project_management/projectImport.html")
+
+    def test_finished_import(self):
+        """Test that a finished import created the components and opens the editor."""
+        self._upload()
+
+        project = Project.objects.get(name=PROJECT_NAME_PROJECT_PAGE_TEST)
+        self.assertEqual(project.heliostats.count(), 3)
+        self.assertEqual(project.receivers.count(), 1)
+        self.assertEqual(project.light_sources.count(), 1)
+
+        status = self.client.get(self.status_url).json()
+        self.assertEqual(status["status"], ProjectImport.FINISHED)
+        self.assertEqual(status["processed"], 5)
+        self.assertEqual(status["total"], 5)
+        self.assertEqual(status["progress"], 1.0)
+        self.assertEqual(status["editorUrl"], self.editor_url)
+        # The upload is removed once it is imported.
+        self.assertEqual(list(self.import_dir.iterdir()), [])
+        self.assertRedirects(
+            self.client.get(self.import_url),
+            self.editor_url,
+            fetch_redirect_response=False,
+        )
+
+    def test_failed_import(self):
+        """Test that an unreadable file marks the import as failed."""
+        self._upload(content=b"not a hdf5 file")
+
+        status = self.client.get(self.status_url).json()
+        self.assertEqual(status["status"], ProjectImport.FAILED)
+        self.assertNotEqual(status["error"], "")
+        self.assertEqual(list(self.import_dir.iterdir()), [])
+        self.assertFalse(
+            Project.objects.get(name=PROJECT_NAME_PROJECT_PAGE_TEST).heliostats.exists()
+        )
+
+    def test_import_runs_once(self):
+        """Test that an import handed out twice is only run once."""
+        self._upload()
+        project_import = ProjectImport.objects.get()
+
+        with mock.patch.object(
+            HDF5Manager, "create_project_from_hdf5_file"
+        ) as create_project:
+            run_import(project_import.pk)
+
+        create_project.assert_not_called()
+
+    def test_import_of_other_user(self):
+        """Test that the import status of other users is not visible."""
+        self._upload(run=False)
+        User.objects.create_user(username="other", password=SECURE_PASSWORD)
+        self.client.login(username="other", password=SECURE_PASSWORD)
+
+        self.assertEqual(self.client.get(self.status_url).status_code, 404)
+        self.assertEqual(self.client.get(self.import_url).status_code, 404)
@@ -1,4 +1,5 @@
 import pathlib
+import tempfile
 
 from django.conf import settings
 from django.contrib.auth.models import User
@@ -50,6 +51,12 @@ class ProjectPageTest(TestCase):
 
     def setUp(self):
         """Set up a test user, log in, and create a test project for use in all tests."""
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        settings_override = self.settings(PROJECT_IMPORT_DIR=temporary_directory.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
         self.client = Client()
         self.user = User.objects.create_user(
             username=TEST_USERNAME, password=SECURE_PASSWORD
@@ -189,7 +196,11 @@ class ProjectPageTest(TestCase):
         file_path = (
             pathlib.Path(settings.BASE_DIR) / hdf5_management_test_scenario_template
         )
-        with open(file_path, "rb") as file:
+        with (
+            open(file_path, "rb") as file,
+            self.settings(PROJECT_IMPORT_WORKERS=0),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
             response = self.client.post(
                 self.projects_url,
                 {
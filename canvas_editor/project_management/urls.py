@@ -3,6 +3,10 @@ from django.urls import path
 from canvas import view_name_dict
 from project_management.views.delete_project_view import DeleteProjectView
 from project_management.views.duplicate_project_view import DuplicateProjectView
+from project_management.views.project_import_view import (
+    ProjectImportStatusView,
+    ProjectImportView,
+)
 from project_management.views.projects_view import ProjectsView
 from project_management.views.share_project_view import ShareProjectView
 from project_management.views.shared_projects_view import SharedProjectView
@@ -41,4 +45,14 @@ urlpatterns = [
         SharedProjectView.as_view(),
         name=view_name_dict.project_shared_projects_view,
     ),
+    path(
+        "importProject/<str:project_name>",
+        ProjectImportView.as_view(),
+        name=view_name_dict.project_import_view,
+    ),
+    path(
+        "importStatus/<str:project_name>",
+        ProjectImportStatusView.as_view(),
+        name=view_name_dict.project_import_status_view,
+    ),
 ]
@@ -2,6 +2,7 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 from django.shortcuts import redirect
 from django.views import View
 
+from autosave_api.write_behind import write_behind
 from project_management.models import Project
 
 
@@ -12,6 +13,8 @@ class DuplicateProjectView(LoginRequiredMixin, View):
         """Duplicates the project specified by the url."""
         project = Project.objects.get(owner=request.user, name=project_name)
         if project.owner == request.user:
+            # The copy has to contain the updates still queued by the autosave api
+            write_behind.flush(project.pk)
             fks_to_copy = (
                 list(project.heliostats.all())
                 + list(project.receivers.all())
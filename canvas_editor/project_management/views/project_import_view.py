@@ -0,0 +1,54 @@
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import JsonResponse
+from django.shortcuts import get_object_or_404, redirect, render
+from django.urls import reverse
+from django.views import View
+
+from canvas import view_name_dict
+from project_management.models import ProjectImport
+
+
+class ProjectImportView(LoginRequiredMixin, View):
+    """Shows the progress of a project import and opens the editor once it is done."""
+
+    def get(self, request, project_name):
+        """Render the import page, or redirect to the editor if the import finished."""
+        project_import = get_object_or_404(
+            ProjectImport.objects.select_related("project"),
+            project__owner=request.user,
+            project__name=project_name,
+        )
+        if project_import.status == ProjectImport.FINISHED:
+            return redirect(view_name_dict.editor_view, project_name=project_name)
+
+        return render(
+            request,
+            "project_management/projectImport.html",
+            {"project_import": project_import, "project": project_import.project},
+        )
+
+
+class ProjectImportStatusView(LoginRequiredMixin, View):
+    """Reports the progress of a project import."""
+
+    def get(self, request, project_name):
+        """Get the status and progress of the import."""
+        project_import = get_object_or_404(
+            ProjectImport,
+            project__owner=request.user,
+            project__name=project_name,
+        )
+        return JsonResponse(
+            {
+                "status": project_import.status,
+                "stage": project_import.stage,
+                "processed": project_import.processed,
+                "total": project_import.total,
+                "progress": project_import.progress,
+                "error": project_import.error,
+                "editorUrl": reverse(
+                    view_name_dict.editor_view,
+                    kwargs={"project_name": project_name},
+                ),
+            }
+        )
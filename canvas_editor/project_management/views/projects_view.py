@@ -1,15 +1,16 @@
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.models import User
+from django.db import transaction
 from django.shortcuts import redirect, render
 from django.utils import timezone
 from django.utils.http import urlsafe_base64_encode
 from django.views.generic import ListView
 
-from canvas import message_dict
-from hdf5_management.hdf5_manager import HDF5Manager
+from canvas import message_dict, view_name_dict
 from project_management.forms.project_form import ProjectForm
-from project_management.models import Project
+from project_management.import_worker import schedule_import
+from project_management.models import Project, ProjectImport
 from project_management.views.utils import is_name_unique
 
 
@@ -29,9 +30,10 @@ class ProjectsView(LoginRequiredMixin, ListView):
         return urlsafe_base64_encode(str(project_name).encode())
 
     @staticmethod
+    @transaction.atomic
     def _create_project(
         user: User, project_name: str, project_description: str, project_file
-    ):
+    ) -> ProjectImport | None:
         new_project = Project(
             name=project_name,
             description=project_description,
@@ -40,8 +42,15 @@ class ProjectsView(LoginRequiredMixin, ListView):
         )
         new_project.save()
 
-        if project_file is not None:
-            HDF5Manager.create_project_from_hdf5_file(project_file, new_project)
+        if project_file is None:
+            return None
+
+        # The file is imported in the background, so large uploads don't block the request.
+        project_import = ProjectImport.objects.create(
+            project=new_project, file=project_file
+        )
+        schedule_import(project_import)
+        return project_import
 
     def get_queryset(self):
         """Get a list of all projects of this user.
@@ -75,10 +84,14 @@ class ProjectsView(LoginRequiredMixin, ListView):
             project_file = request.FILES.get("file")
             project_description = form.cleaned_data.get("description", "").strip()
 
-            self._create_project(
+            project_import = self._create_project(
                 request.user, project_name, project_description, project_file
             )
 
+            if project_import is not None:
+                return redirect(
+                    view_name_dict.project_import_view, project_name=project_name
+                )
             return redirect("editor", project_name=project_name)
 
         else:
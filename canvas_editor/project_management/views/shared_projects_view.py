@@ -7,6 +7,7 @@ from django.utils import timezone
 from django.utils.http import urlsafe_base64_decode
 from django.views import View
 
+from autosave_api.write_behind import write_behind
 from canvas import view_name_dict
 from project_management.models import Project
 
@@ -56,7 +57,8 @@ class SharedProjectView(LoginRequiredMixin, View):
         ):
             raise Http404
 
-        # copy the associated project to the user
+        # copy the associated project to the user, including the updates still queued by the autosave api
+        write_behind.flush(project.pk)
         fks_to_copy = (
             list(project.heliostats.all())
             + list(project.receivers.all())
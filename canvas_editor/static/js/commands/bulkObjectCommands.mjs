@@ -1,5 +1,8 @@
 import { CanvasObject } from "canvasObject";
 import { Command } from "command";
+import { Editor } from "editor";
+import { ItemCreatedEvent } from "createCommands";
+import { ItemDeletedEvent } from "deleteCommands";
 import { abstractClassError } from "message_dict";
 
 /**
@@ -11,7 +14,7 @@ export class BulkObjectCommand extends Command {
    * An array of objects on which the command operates.
    * @type {Array<CanvasObject>}
    */
-  #objects; // eslint-disable-line no-unused-private-class-members -- required for future implementations
+  #objects;
 
   /**
    * Initializes a new BulkObjectCommand with the specified 'SelectableObject' instances.
@@ -24,4 +27,43 @@ export class BulkObjectCommand extends Command {
       throw new Error(abstractClassError(BulkObjectCommand));
     }
   }
+
+  /**
+   * Gets the objects the command operates on.
+   * @returns {Array<CanvasObject>} the targeted objects
+   */
+  get objects() {
+    return this.#objects;
+  }
+}
+
+/**
+ * Command to handle the deletion of several objects at once, saved with one request per object type.
+ */
+export class BulkDeleteCommand extends BulkObjectCommand {
+  #editor = Editor.getInstance();
+
+  /**
+   * Deletes the objects from the scene and dispatches an ItemDeletedEvent for each of them.
+   */
+  execute() {
+    this.#editor.deleteObjects(this.objects);
+
+    const canvas = document.getElementById("canvas");
+    this.objects.forEach((object) =>
+      canvas.dispatchEvent(new ItemDeletedEvent(object)),
+    );
+  }
+
+  /**
+   * Reverts the deletion by adding the objects back to the scene and dispatching an ItemCreatedEvent for each of them.
+   */
+  undo() {
+    this.#editor.addObjects(this.objects);
+
+    const canvas = document.getElementById("canvas");
+    this.objects.forEach((object) =>
+      canvas.dispatchEvent(new ItemCreatedEvent(object)),
+    );
+  }
 }
@@ -48,16 +48,22 @@ export class UpdateHeliostatCommand extends SingleObjectCommand {
    *The allowed attributes to set
    */
   #allowedAttributes = ["objectName", "position"];
+  /**
+   * Whether the next save may be written behind, only the first execution of a drag is.
+   */
+  #queued;
 
   /**
    * Initializes a new UpdateHeliostatCommand with the specified 'Heliostat' instance, attribute, and new parameter.
    * @param {Heliostat} heliostat - the 'Heliostat' instance to be updated.
    * @param {"objectName" | "position"} attribute - The name of the attribute to modify.
    * @param {*} newParameter - the new value to assign to the attribute.
+   * @param {boolean} [queued] - whether the update comes from dragging the heliostat and may be written behind.
    */
-  constructor(heliostat, attribute, newParameter) {
+  constructor(heliostat, attribute, newParameter, queued = false) {
     super();
     this.#heliostat = heliostat;
+    this.#queued = queued;
     if (this.#allowedAttributes.includes(attribute)) {
       this.#attribute = attribute;
     } else {
@@ -81,7 +87,10 @@ export class UpdateHeliostatCommand extends SingleObjectCommand {
     } else {
       this.#heliostat[this.#attribute] = this.#newParameter;
     }
-    await this.#saveAndLoadHandler.updateHeliostat(this.#heliostat);
+    // Redoing the command is saved right away
+    const queued = this.#queued;
+    this.#queued = false;
+    await this.#saveAndLoadHandler.updateHeliostat(this.#heliostat, queued);
 
     document
       .getElementById("canvas")
@@ -145,16 +154,22 @@ export class UpdateReceiverCommand extends SingleObjectCommand {
     "curvatureU",
     "position",
   ];
+  /**
+   * Whether the next save may be written behind, only the first execution of a drag is.
+   */
+  #queued;
 
   /**
    * Initializes a new UpdateReceiverCommand with the specified 'Receiver' instance, attribute, and new parameter.
    * @param {Receiver} receiver - This is the receiver object whose attribute will be updated.
    * @param {"objectName" | "towerType" | "normalVector" | "planeE" | "planeU" | "resolutionE" | "resolutionU" | "curvatureE" | "curvatureU" | "position" } attribute - The name of the attribute to modify.
    * @param {*} newParameter - The new value to assign to the attribute. This can be of any type depending on the attribute being updated.
+   * @param {boolean} [queued] - Whether the update comes from dragging the receiver and may be written behind.
    */
-  constructor(receiver, attribute, newParameter) {
+  constructor(receiver, attribute, newParameter, queued = false) {
     super();
     this.#receiver = receiver;
+    this.#queued = queued;
     if (this.#allowedAttributes.includes(attribute)) {
       this.#attribute = attribute;
     } else {
@@ -184,7 +199,10 @@ export class UpdateReceiverCommand extends SingleObjectCommand {
       this.#receiver[this.#attribute] = this.#newParameter;
     }
 
-    this.#saveAndLoadHandler.updateReceiver(this.#receiver);
+    // Redoing the command is saved right away
+    const queued = this.#queued;
+    this.#queued = false;
+    this.#saveAndLoadHandler.updateReceiver(this.#receiver, queued);
 
     document
       .getElementById("canvas")
@@ -447,6 +447,45 @@ export class Editor {
     this.#saveAndLoadHandler.deleteLightsource(lightsource);
   }
 
+  /**
+   * Adds the given objects to the scene and saves them together.
+   * @param {Array<Heliostat | Receiver | LightSource>} objects the objects you want to add.
+   */
+  async addObjects(objects) {
+    objects.forEach((object) => {
+      this.#selectableGroup.add(object);
+      this.#listOf(object).push(object);
+    });
+    await this.#saveAndLoadHandler.createObjects(objects);
+  }
+
+  /**
+   * Deletes the given objects from the scene and from the database together
+   * @param {Array<Heliostat | Receiver | LightSource>} objects the objects you want to delete
+   */
+  async deleteObjects(objects) {
+    objects.forEach((object) => {
+      const list = this.#listOf(object);
+      this.#selectableGroup.remove(object);
+      list.splice(list.indexOf(object), 1);
+    });
+    await this.#saveAndLoadHandler.deleteObjects(objects);
+  }
+
+  /**
+   * Gets the list of placed objects of the same type as the given object.
+   * @param {Heliostat | Receiver | LightSource} object the object to get the list for
+   * @returns {Array<Heliostat | Receiver | LightSource>} the list the object belongs in
+   */
+  #listOf(object) {
+    if (object instanceof Heliostat) {
+      return this.#heliostatList;
+    } else if (object instanceof Receiver) {
+      return this.#receiverList;
+    }
+    return this.#lightsourceList;
+  }
+
   /**
    * Gets all the placed objects in the scene.
    * @returns {{heliostatList: Heliostat[], receiverList: Receiver[], lightsourceList: LightSource[]}} an array containing all placed objects.
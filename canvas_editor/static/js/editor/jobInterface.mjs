@@ -2,6 +2,16 @@ import { SaveAndLoadHandler } from "saveAndLoadHandler";
 
 let apiUrl = window.location.origin;
 
+/**
+ * Labels of the job states reported by the job engine.
+ */
+const STATUS_LABELS = {
+  pending: "Pending",
+  running: "Running",
+  finished: "Finished",
+  failed: "Failed",
+};
+
 /**
  * Interface for managing jobs within a project.
  */
@@ -12,6 +22,11 @@ export class JobInterface {
    * @type {Job[]}
    */
   #jobList = [];
+  #statusEtag = null;
+  /**
+   * @type {EventSource | null}
+   */
+  #eventSource = null;
 
   /**
    * Creates a new JobInterface for managing jobs within a project.
@@ -26,25 +41,19 @@ export class JobInterface {
     });
 
     /**
-     * Update when opening
-     */
-    document
-      .getElementById("jobInterface")
-      .addEventListener("shown.bs.modal", () => {
-        if (this.#jobList.length == 0) {
-          this.#jobInterfaceBody.innerHTML = "You currently have no jobs.";
-        }
-        this.#jobList.forEach((job) => job.fetchStatus());
-      });
-
-    /**
-     * Update job status every 5 seconds when modal is open
+     * Receive the job status while the modal is open
      */
-    setInterval(() => {
-      if (this.#jobInterfaceBody.checkVisibility()) {
-        this.#jobList.forEach((job) => job.fetchStatus());
+    const jobInterfaceModal = document.getElementById("jobInterface");
+    jobInterfaceModal.addEventListener("shown.bs.modal", () => {
+      if (this.#jobList.length == 0) {
+        this.#jobInterfaceBody.innerHTML = "You currently have no jobs.";
       }
-    }, 5000);
+      this.#openEventStream();
+    });
+    jobInterfaceModal.addEventListener("hidden.bs.modal", () => {
+      this.#eventSource?.close();
+      this.#eventSource = null;
+    });
 
     /**
      * Add all the previous jobs
@@ -71,6 +80,7 @@ export class JobInterface {
         }
         this.#jobList.push(newJob);
         this.#jobInterfaceBody.prepend(newJob);
+        this.#fetchStatuses();
         document
           .getElementById("hasActiveJobsIndicator")
           .classList.remove("d-none");
@@ -81,16 +91,95 @@ export class JobInterface {
   }
 
   /**
-   * Deletes a job from the job list and sends a DELETE request to the server.
-   * @param {Job} job the job you want to delete
+   * Fetches the status of all jobs of the project in one request and updates
+   * the jobs. Polls while no job changed are answered with 304 and leave the
+   * jobs untouched.
    */
-  deleteJob(job) {
+  #fetchStatuses() {
+    const headers = {};
+    if (this.#statusEtag) {
+      headers["If-None-Match"] = this.#statusEtag;
+    }
+    fetch(apiUrl + "/jobs/" + this.#projectID + "/status/", {
+      headers: headers,
+      cache: "no-store",
+    })
+      .then((res) => {
+        if (res.status == 304) {
+          return null;
+        }
+        this.#statusEtag = res.headers.get("ETag");
+        return res.json();
+      })
+      .then((data) => {
+        if (data === null) {
+          return;
+        }
+        data["jobs"].forEach((status) => this.#updateJob(status));
+      })
+      .catch((error) => {
+        console.error("Error fetching job statuses:", error);
+      });
+  }
+
+  /**
+   * Opens a stream of server-sent events that pushes the status of the jobs
+   * whenever a worker reports a change. The browser reconnects on its own when
+   * the stream ends.
+   */
+  #openEventStream() {
+    if (this.#eventSource) {
+      return;
+    }
+    this.#eventSource = new EventSource(
+      apiUrl + "/jobs/" + this.#projectID + "/events/",
+    );
+    this.#eventSource.addEventListener("status", (event) => {
+      JSON.parse(event.data)["jobs"].forEach((status) =>
+        this.#updateJob(status),
+      );
+    });
+    this.#eventSource.addEventListener("job", (event) => {
+      this.#updateJob(JSON.parse(event.data));
+    });
+    this.#eventSource.addEventListener("removed", (event) => {
+      const jobID = JSON.parse(event.data)["jobID"];
+      const job = this.#jobList.find((job) => job.jobID == jobID);
+      if (job) {
+        this.#removeJobElement(job);
+      }
+    });
+  }
+
+  /**
+   * Updates the job the status belongs to, if it is in the job list.
+   * @param {object} status the status of the job, as returned by the server
+   */
+  #updateJob(status) {
+    this.#jobList
+      .find((job) => job.jobID == status["jobID"])
+      ?.updateStatus(status);
+  }
+
+  /**
+   * Removes a job from the job list without deleting it on the server.
+   * @param {Job} job the job you want to remove
+   */
+  #removeJobElement(job) {
     this.#jobList.splice(this.#jobList.indexOf(job), 1);
     job.remove();
     if (this.#jobList.length == 0) {
       this.#jobInterfaceBody.innerHTML = "You currently have no jobs.";
       document.getElementById("hasActiveJobsIndicator").classList.add("d-none");
     }
+  }
+
+  /**
+   * Deletes a job from the job list and sends a DELETE request to the server.
+   * @param {Job} job the job you want to delete
+   */
+  deleteJob(job) {
+    this.#removeJobElement(job);
 
     fetch(apiUrl + "/jobs/" + this.#projectID + "/" + job.jobID + "/", {
       method: "DELETE",
@@ -133,7 +222,6 @@ export class Job extends HTMLElement {
   #jobInterface;
   #projectID;
   #progress = 0.8;
-  #isFinished = false;
 
   #statusElem;
   #progressElem;
@@ -214,28 +302,25 @@ export class Job extends HTMLElement {
   }
 
   /**
-   * Fetches the current status of the job from the server and updates the UI accordingly.
+   * Updates the UI with the status of the job.
+   * @param {object} data the status of the job, as returned by the server
    */
-  fetchStatus() {
-    if (!this.#isFinished) {
-      fetch(apiUrl + "/jobs/" + this.#projectID + "/" + this.#id)
-        .then((res) => res.json())
-        .then((data) => {
-          this.#statusElem.innerHTML = "Status: " + data["status"];
-          this.#progressElem.setAttribute(
-            "aria-valuenow",
-            (data["progress"] * 100).toString(),
-          );
-          this.#progressElem.style.width = data["progress"] * 100 + "%";
-          if (data["progress"] >= 1) {
-            this.#resultButton.classList.toggle("d-none");
-            this.#resultButton.href = apiUrl + data["result"];
-            this.#isFinished = true;
-          }
-        })
-        .catch((error) => {
-          console.error("Error creating new job:", error);
-        });
+  updateStatus(data) {
+    this.#statusElem.innerHTML =
+      "Status: " + (data["stage"] || STATUS_LABELS[data["status"]]);
+    this.#progressElem.setAttribute(
+      "aria-valuenow",
+      (data["progress"] * 100).toString(),
+    );
+    this.#progressElem.style.width = data["progress"] * 100 + "%";
+    if (data["status"] == "finished") {
+      this.#statusElem.innerHTML = "Status: " + STATUS_LABELS.finished;
+      this.#resultButton.classList.remove("d-none");
+      this.#resultButton.href = apiUrl + data["result"];
+    } else if (data["status"] == "failed") {
+      this.#statusElem.innerHTML = "Status: " + STATUS_LABELS.failed;
+      this.#statusElem.title = data["error"];
+      this.#progressElem.classList.add("bg-danger");
     }
   }
 
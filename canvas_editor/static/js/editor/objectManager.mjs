@@ -1,5 +1,6 @@
 import { Picker } from "picker";
 import { UndoRedoHandler } from "undoRedoHandler";
+import { BulkDeleteCommand } from "bulkObjectCommands";
 import { Vector3 } from "three";
 import {
   CreateReceiverCommand,
@@ -87,7 +88,7 @@ export class ObjectManager {
 
   /**
    * Add event listener for keyboard shortcuts
-   * Delete: Delete selected object
+   * Delete: Delete selected objects
    * Duplicate: Duplicate selected object
    */
   #addEventListener() {
@@ -101,6 +102,10 @@ export class ObjectManager {
       if (event.key === "Delete") {
         if (this.#objectList.length === 1) {
           this.#objectList[0].delete();
+        } else {
+          this.#undoRedoHandler.executeCommand(
+            new BulkDeleteCommand([...this.#objectList]),
+          );
         }
       }
 
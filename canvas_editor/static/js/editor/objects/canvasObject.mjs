@@ -41,9 +41,10 @@ export class CanvasObject extends Object3D {
   /**
    * Updates and saves the new position through a command
    * @param {Vector3} position - the new position you want to save and update
+   * @param {boolean} [dragged] - whether the object was dragged, then the position may be written behind
    */
   // eslint-disable-next-line no-unused-vars -- required for interface compatibility
-  updateAndSaveObjectPosition(position) {
+  updateAndSaveObjectPosition(position, dragged = false) {
     throw new Error(methodMustBeImplementedError);
   }
 
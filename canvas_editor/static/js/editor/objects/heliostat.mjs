@@ -145,10 +145,11 @@ export class Heliostat extends CanvasObject {
   /**
    * Updates the position of the heliostat
    * @param {Vector3} position - the new position of the heliostat
+   * @param {boolean} [dragged] - whether the heliostat was dragged, then the position may be written behind
    */
-  updateAndSaveObjectPosition(position) {
+  updateAndSaveObjectPosition(position, dragged = false) {
     this.#undoRedoHandler.executeCommand(
-      new UpdateHeliostatCommand(this, "position", position),
+      new UpdateHeliostatCommand(this, "position", position, dragged),
     );
   }
 
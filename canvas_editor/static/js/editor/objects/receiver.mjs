@@ -345,10 +345,11 @@ export class Receiver extends CanvasObject {
   /**
    * Updates the position of the receiver
    * @param {Vector3} position - the new position of the receiver
+   * @param {boolean} [dragged] - whether the receiver was dragged, then the position may be written behind
    */
-  updateAndSaveObjectPosition(position) {
+  updateAndSaveObjectPosition(position, dragged = false) {
     this.#undoRedoHandler.executeCommand(
-      new UpdateReceiverCommand(this, "position", position),
+      new UpdateReceiverCommand(this, "position", position, dragged),
     );
   }
 
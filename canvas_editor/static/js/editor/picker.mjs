@@ -257,6 +257,7 @@ export class Picker {
       ) {
         this.#selectedObject.updateAndSaveObjectPosition(
           this.#transformControls.object.position.clone(),
+          true,
         );
         this.#itemSelectedEvent();
       } else if (
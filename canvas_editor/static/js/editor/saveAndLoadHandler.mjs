@@ -50,6 +50,101 @@ export class SaveAndLoadHandler {
     return this.#makeApiCall(url, "GET");
   }
 
+  /**
+   * Returns the changes of the project since the given revision, so a copy of the project can be updated
+   * without loading the whole project again
+   * @param {number} revision the revision of the copy, as returned by getProjectData or a previous call
+   * @returns {Promise<JSON>} The current revision, the created or changed heliostats, receivers and light sources,
+   * the settings if they changed and the ids of the deleted components. Undefined if the changes since the revision
+   * are no longer kept, then the project has to be loaded again with getProjectData
+   */
+  async getChangesSince(revision) {
+    const url =
+      this.#baseAPIUrl +
+      "projects/" +
+      this.#projectID +
+      "/changes/?since=" +
+      revision;
+    return this.#makeApiCall(url, "GET");
+  }
+
+  /**
+   * Loads the ids, positions and names of all heliostats of the project in the compact columnar format,
+   * which is a lot smaller and faster to parse than JSON for large fields
+   * @returns {Promise<{ids: BigInt64Array, positions: Float32Array, names: string[]}>} The columns of the heliostats,
+   * the positions hold the x, y and z coordinates of each heliostat one after another
+   */
+  async getHeliostatColumns() {
+    const url =
+      this.#baseAPIUrl +
+      "projects/" +
+      this.#projectID +
+      "/heliostats/?format=columnar";
+
+    const response = await fetch(url);
+    if (!response.ok) {
+      throw new Error(`Response status: ${response.status}`);
+    }
+    const buffer = await response.arrayBuffer();
+
+    // The layout is documented in autosave_api/renderers.py, all numbers are little-endian
+    const header = new DataView(buffer, 0, 16);
+    const magic = new TextDecoder().decode(new Uint8Array(buffer, 0, 4));
+    if (magic !== "CNVH" || header.getUint32(4, true) !== 1) {
+      throw new Error("Unsupported heliostat column format");
+    }
+    const count = header.getUint32(8, true);
+    const namesLength = header.getUint32(12, true);
+
+    let offset = 16;
+    const ids = new BigInt64Array(buffer, offset, count);
+    offset += count * 8;
+    const positions = new Float32Array(buffer, offset, count * 3);
+    offset += count * 12;
+    const nameOffsets = new Uint32Array(buffer, offset, count + 1);
+    offset += (count + 1) * 4;
+    const nameBytes = new Uint8Array(buffer, offset, namesLength);
+
+    const decoder = new TextDecoder();
+    const names = [];
+    for (let i = 0; i < count; i++) {
+      names.push(
+        decoder.decode(nameBytes.subarray(nameOffsets[i], nameOffsets[i + 1])),
+      );
+    }
+    return { ids, positions, names };
+  }
+
+  /**
+   * Loads the heliostats of the project page by page, so large fields can be processed while they are loading
+   * @param {number} pageSize The number of heliostats per page, at most 10000
+   * @param {number[]} [boundingBox] Only load the heliostats inside [minX, minY, maxX, maxY]
+   * @yields {Promise<Object[]>} The heliostats of each page, ordered by id
+   */
+  async *getHeliostatPages(pageSize, boundingBox) {
+    let url =
+      this.#baseAPIUrl +
+      "projects/" +
+      this.#projectID +
+      "/heliostats/?page_size=" +
+      pageSize;
+    if (boundingBox) {
+      url += "&bbox=" + boundingBox.join(",");
+    }
+
+    while (url) {
+      const response = await fetch(url);
+      if (!response.ok) {
+        throw new Error(`Response status: ${response.status}`);
+      }
+      const page = await response.json();
+      if (page.results.length > 0) {
+        yield page.results;
+      }
+      url = page.next;
+    }
+  }
+
   /**
    * Creates a database entry for the given heliostat
    * @param {Heliostat} heliostat Is the heliostat you want an entry for
@@ -59,14 +154,7 @@ export class SaveAndLoadHandler {
     const url =
       this.#baseAPIUrl + "projects/" + this.#projectID + "/heliostats/";
 
-    const body = {
-      name: heliostat.objectName,
-      position_x: heliostat.position.x,
-      position_y: heliostat.position.y,
-      position_z: heliostat.position.z,
-    };
-
-    return this.#makeApiCall(url, "POST", body);
+    return this.#makeApiCall(url, "POST", this.#heliostatBody(heliostat));
   }
 
   /**
@@ -78,23 +166,7 @@ export class SaveAndLoadHandler {
     const url =
       this.#baseAPIUrl + "projects/" + this.#projectID + "/receivers/";
 
-    const body = {
-      name: receiver.objectName,
-      position_x: receiver.lastPosition.x,
-      position_y: receiver.lastPosition.y,
-      position_z: receiver.lastPosition.z,
-      normal_x: receiver.normalVector.x,
-      normal_y: receiver.normalVector.y,
-      normal_z: receiver.normalVector.z,
-      curvature_e: receiver.curvatureE,
-      curvature_u: receiver.curvatureU,
-      plane_e: receiver.planeE,
-      plane_u: receiver.planeU,
-      resolution_e: receiver.resolutionE,
-      resolution_u: receiver.resolutionU,
-    };
-
-    return this.#makeApiCall(url, "POST", body);
+    return this.#makeApiCall(url, "POST", this.#receiverBody(receiver));
   }
 
   /**
@@ -106,16 +178,29 @@ export class SaveAndLoadHandler {
     const url =
       this.#baseAPIUrl + "projects/" + this.#projectID + "/light_sources/";
 
-    const body = {
-      name: lightSource.objectName,
-      number_of_rays: lightSource.numberOfRays,
-      lightsource_type: lightSource.lightSourceType,
-      distribution_type: lightSource.distributionType,
-      mean: lightSource.distributionMean,
-      covariance: lightSource.distributionCovariance,
-    };
+    return this.#makeApiCall(url, "POST", this.#lightSourceBody(lightSource));
+  }
 
-    return this.#makeApiCall(url, "POST", body);
+  /**
+   * Creates database entries for many objects, with one request per object type
+   * @param {Array<Heliostat | Receiver | LightSource>} objects the objects you want entries for
+   * @returns {Promise<void>} Resolves when every object got the id of its entry
+   */
+  async createObjects(objects) {
+    await Promise.all(
+      [...this.#groupByType(objects)].map(async ([objectType, group]) => {
+        const response = await this.bulkSaveObjects(objectType, {
+          create: group.map((object) => this.#objectBody(object)),
+        });
+        if (!response) {
+          return;
+        }
+        // The ids of the created objects are in request order
+        group.forEach((object, index) => {
+          object.apiID = response["created"][index];
+        });
+      }),
+    );
   }
 
   // Object deletion
@@ -184,25 +269,34 @@ export class SaveAndLoadHandler {
     return this.#makeApiCall(url, "DELETE");
   }
 
+  /**
+   * Deletes many objects from the backend, with one request per object type
+   * @param {Array<Heliostat | Receiver | LightSource>} objects the objects you want to delete
+   * @returns {Promise<void>} Resolves when the objects are deleted
+   */
+  async deleteObjects(objects) {
+    const savedObjects = objects.filter((object) => object.apiID);
+    await Promise.all(
+      [...this.#groupByType(savedObjects)].map(([objectType, group]) =>
+        this.bulkSaveObjects(objectType, {
+          delete: group.map((object) => object.apiID),
+        }),
+      ),
+    );
+  }
+
   // Object updating
   /**
    * Updates the given heliostat in the backend
    * @param {Heliostat} heliostat Is the updated heliostat from the frontend
+   * @param {boolean} [queued] Whether the update comes from dragging the heliostat and may be written behind
    * @returns {Promise<JSON>} JSON representation of the updated heliostat
    */
-  async updateHeliostat(heliostat) {
+  async updateHeliostat(heliostat, queued = false) {
     if (!heliostat.apiID) {
       return;
     }
 
-    const url =
-      this.#baseAPIUrl +
-      "projects/" +
-      this.#projectID +
-      "/heliostats/" +
-      heliostat.apiID +
-      "/";
-
     const body = {
       id: heliostat.apiID,
       name: heliostat.objectName,
@@ -211,27 +305,32 @@ export class SaveAndLoadHandler {
       position_z: heliostat.position.z,
     };
 
+    if (queued) {
+      return this.queueObjectUpdate("heliostats", heliostat.apiID, body);
+    }
+
+    const url =
+      this.#baseAPIUrl +
+      "projects/" +
+      this.#projectID +
+      "/heliostats/" +
+      heliostat.apiID +
+      "/";
+
     return this.#makeApiCall(url, "PUT", body);
   }
 
   /**
    * Updates the given receiver in the backend
    * @param {Receiver} receiver Is the updated receiver from the frontend
+   * @param {boolean} [queued] Whether the update comes from dragging the receiver and may be written behind
    * @returns {Promise<JSON>} JSON representation of the updated receiver
    */
-  async updateReceiver(receiver) {
+  async updateReceiver(receiver, queued = false) {
     if (!receiver.apiID) {
       return;
     }
 
-    const url =
-      this.#baseAPIUrl +
-      "projects/" +
-      this.#projectID +
-      "/receivers/" +
-      receiver.apiID +
-      "/";
-
     const body = {
       id: receiver.apiID,
       name: receiver.objectName,
@@ -250,6 +349,18 @@ export class SaveAndLoadHandler {
       resolution_u: receiver.resolutionU,
     };
 
+    if (queued) {
+      return this.queueObjectUpdate("receivers", receiver.apiID, body);
+    }
+
+    const url =
+      this.#baseAPIUrl +
+      "projects/" +
+      this.#projectID +
+      "/receivers/" +
+      receiver.apiID +
+      "/";
+
     return this.#makeApiCall(url, "PUT", body);
   }
 
@@ -263,6 +374,16 @@ export class SaveAndLoadHandler {
       return;
     }
 
+    const body = {
+      id: lightSource.apiID,
+      name: lightSource.objectName,
+      number_of_rays: lightSource.numberOfRays,
+      lightsource_type: lightSource.lightSourceType,
+      distribution_type: lightSource.distributionType,
+      mean: lightSource.distributionMean,
+      covariance: lightSource.distributionCovariance,
+    };
+
     const url =
       this.#baseAPIUrl +
       "projects/" +
@@ -271,8 +392,137 @@ export class SaveAndLoadHandler {
       lightSource.apiID +
       "/";
 
-    const body = {
-      id: lightSource.apiID,
+    return this.#makeApiCall(url, "PUT", body);
+  }
+
+  /**
+   * Sends a partial update the server may merge with the following updates of the same object,
+   * meant for the many updates sent while an object is dragged
+   * @param {"heliostats" | "receivers" | "light_sources"} objectType the type of the changed object
+   * @param {number} apiID the id of the changed object
+   * @param {object} changes the changed attributes of the object
+   * @returns {Promise<JSON>} JSON representation of the object as it will be saved
+   */
+  async queueObjectUpdate(objectType, apiID, changes) {
+    const url =
+      this.#baseAPIUrl +
+      "projects/" +
+      this.#projectID +
+      "/" +
+      objectType +
+      "/" +
+      apiID +
+      "/";
+
+    // The server acknowledges with 202 and writes the merged updates shortly after
+    return this.#makeApiCall(url, "PATCH", changes, {
+      Prefer: "respond-async",
+    });
+  }
+
+  // Bulk changes
+  /**
+   * Creates, updates and deletes many objects of one type in a single request and transaction
+   * @param {"heliostats" | "receivers" | "light_sources"} objectType the type of the changed objects
+   * @param {{create?: object[], update?: object[], delete?: number[]}} changes the bodies of the new objects, the partial bodies including the id of the updated objects and the ids of the deleted objects
+   * @returns {Promise<JSON>} the ids of the created, updated and deleted objects, the created ones in request order
+   */
+  async bulkSaveObjects(objectType, changes) {
+    const url =
+      this.#baseAPIUrl +
+      "projects/" +
+      this.#projectID +
+      "/" +
+      objectType +
+      "/bulk/";
+
+    return this.#makeApiCall(url, "POST", changes);
+  }
+
+  /**
+   * Groups objects by the type used in the api urls
+   * @param {Array<Heliostat | Receiver | LightSource>} objects the objects to group
+   * @returns {Map<"heliostats" | "receivers" | "light_sources", Array<Heliostat | Receiver | LightSource>>} the objects of every type
+   */
+  #groupByType(objects) {
+    const groups = new Map();
+    objects.forEach((object) => {
+      let objectType;
+      if (object instanceof Heliostat) {
+        objectType = "heliostats";
+      } else if (object instanceof Receiver) {
+        objectType = "receivers";
+      } else if (object instanceof LightSource) {
+        objectType = "light_sources";
+      } else {
+        return;
+      }
+      if (!groups.has(objectType)) {
+        groups.set(objectType, []);
+      }
+      groups.get(objectType).push(object);
+    });
+    return groups;
+  }
+
+  /**
+   * Gets the body for creating the given object
+   * @param {Heliostat | Receiver | LightSource} object the object you want an entry for
+   * @returns {object} the fields of the new entry
+   */
+  #objectBody(object) {
+    if (object instanceof Heliostat) {
+      return this.#heliostatBody(object);
+    } else if (object instanceof Receiver) {
+      return this.#receiverBody(object);
+    }
+    return this.#lightSourceBody(object);
+  }
+
+  /**
+   * Gets the body for creating the given heliostat
+   * @param {Heliostat} heliostat the heliostat you want an entry for
+   * @returns {object} the fields of the new entry
+   */
+  #heliostatBody(heliostat) {
+    return {
+      name: heliostat.objectName,
+      position_x: heliostat.position.x,
+      position_y: heliostat.position.y,
+      position_z: heliostat.position.z,
+    };
+  }
+
+  /**
+   * Gets the body for creating the given receiver
+   * @param {Receiver} receiver the receiver you want an entry for
+   * @returns {object} the fields of the new entry
+   */
+  #receiverBody(receiver) {
+    return {
+      name: receiver.objectName,
+      position_x: receiver.lastPosition.x,
+      position_y: receiver.lastPosition.y,
+      position_z: receiver.lastPosition.z,
+      normal_x: receiver.normalVector.x,
+      normal_y: receiver.normalVector.y,
+      normal_z: receiver.normalVector.z,
+      curvature_e: receiver.curvatureE,
+      curvature_u: receiver.curvatureU,
+      plane_e: receiver.planeE,
+      plane_u: receiver.planeU,
+      resolution_e: receiver.resolutionE,
+      resolution_u: receiver.resolutionU,
+    };
+  }
+
+  /**
+   * Gets the body for creating the given light source
+   * @param {LightSource} lightSource the light source you want an entry for
+   * @returns {object} the fields of the new entry
+   */
+  #lightSourceBody(lightSource) {
+    return {
       name: lightSource.objectName,
       number_of_rays: lightSource.numberOfRays,
       lightsource_type: lightSource.lightSourceType,
@@ -280,8 +530,6 @@ export class SaveAndLoadHandler {
       mean: lightSource.distributionMean,
       covariance: lightSource.distributionCovariance,
     };
-
-    return this.#makeApiCall(url, "PUT", body);
   }
 
   // Settings updating
@@ -328,16 +576,18 @@ export class SaveAndLoadHandler {
   /**
    * Wrapper function for an standard api call
    * @param {string} endpoint The endpoint to make the api call to
-   * @param {"PUT" | "POST" | "GET" | "DELETE"} method The method you want to use
+   * @param {"PUT" | "PATCH" | "POST" | "GET" | "DELETE"} method The method you want to use
    * @param {any} [body] the body for the api call
+   * @param {object} [headers] additional headers of the api call
    * @returns {Promise<JSON>} the response of the api call as JSON
    */
-  async #makeApiCall(endpoint, method, body) {
+  async #makeApiCall(endpoint, method, body, headers = {}) {
     return fetch(endpoint, {
       method: method,
       headers: {
         "Content-Type": "application/json",
         "X-CSRFToken": SaveAndLoadHandler.getCookie("csrftoken"),
+        ...headers,
       },
       body: JSON.stringify(body),
     })
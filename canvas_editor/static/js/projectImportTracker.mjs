@@ -0,0 +1,61 @@
+const stageLabels = {
+  heliostats: "Reading heliostats",
+  light_sources: "Reading light sources",
+  receivers: "Reading receivers",
+  saving: "Saving the project",
+};
+
+/**
+ * Polls the status of a project import and opens the editor once it is finished
+ */
+export class ProjectImportTracker {
+  #statusUrl;
+  #progressBar;
+  #statusText;
+  #errorMessage;
+  #interval;
+
+  /**
+   * Start tracking the import
+   * @param {string} statusUrl - The url reporting the status of the import
+   * @param {number} pollingInterval - The time between two status requests in milliseconds
+   */
+  constructor(statusUrl, pollingInterval = 1000) {
+    this.#statusUrl = statusUrl;
+    this.#progressBar = document.getElementById("importProgressBar");
+    this.#statusText = document.getElementById("importStatus");
+    this.#errorMessage = document.getElementById("importError");
+
+    this.#fetchStatus();
+    this.#interval = setInterval(() => this.#fetchStatus(), pollingInterval);
+  }
+
+  /**
+   * Fetch the current status of the import and update the page
+   */
+  #fetchStatus() {
+    fetch(this.#statusUrl)
+      .then((res) => res.json())
+      .then((data) => {
+        this.#progressBar.style.width = `${Math.round(data.progress * 100)}%`;
+
+        if (data.status == "finished") {
+          clearInterval(this.#interval);
+          window.location.href = data.editorUrl;
+        } else if (data.status == "failed") {
+          clearInterval(this.#interval);
+          this.#progressBar.classList.add("bg-danger");
+          this.#progressBar.classList.remove("progress-bar-animated");
+          this.#statusText.innerText = "Import failed";
+          this.#errorMessage.innerText = `The file could not be imported: ${data.error}`;
+          this.#errorMessage.classList.remove("d-none");
+        } else if (data.status == "running" && data.total > 0) {
+          const label = stageLabels[data.stage] ?? "Importing";
+          this.#statusText.innerText = `${label} (${data.processed} of ${data.total} components)`;
+        }
+      })
+      .catch((error) => {
+        console.error("Error fetching the import status:", error);
+      });
+  }
+}
@@ -3,7 +3,7 @@ import { SaveAndLoadHandler } from "saveAndLoadHandler";
 
 /**
  * Class to manage project settings such as environment, graphics, and other settings.
- * Right now, it only manages graphics settings like shadows and fog.
+ * Right now, it manages graphics settings like shadows and fog and the export profile.
  */
 export class ProjectSettingsManager {
   /** @type {HTMLElement} */
@@ -17,6 +17,8 @@ export class ProjectSettingsManager {
   #shadowEnabled;
   /** @type {boolean} */
   #fogEnabled;
+  /** @type {string} */
+  #exportProfile;
   #editor;
   #saveAndLoadHandler;
 
@@ -44,9 +46,9 @@ export class ProjectSettingsManager {
 
     //render the graphics settings
     this.#renderUISettings();
+    this.#renderOtherSettings();
 
     this.#environmentSettingsEntry.textContent = "No settings available";
-    this.#otherSettingsEntry.textContent = "No settings available";
   }
 
   /**
@@ -57,6 +59,7 @@ export class ProjectSettingsManager {
     const settingsList = projectJson["settings"];
     this.#shadowEnabled = settingsList["shadows"];
     this.#fogEnabled = settingsList["fog"];
+    this.#exportProfile = settingsList["export_profile"];
   }
 
   /**
@@ -109,6 +112,71 @@ export class ProjectSettingsManager {
     });
   }
 
+  /**
+   * Method to render the other settings
+   * This method creates a select for the surface written into exported scenarios.
+   */
+  #renderOtherSettings() {
+    this.#otherSettingsEntry.innerHTML = "";
+
+    const exportProfiles = [
+      { label: "Fitted surface", value: "fitted" },
+      { label: "Ideal surface (faster)", value: "ideal" },
+    ];
+
+    const select = this.#createSelect(
+      "Export surface",
+      exportProfiles,
+      this.#exportProfile,
+      (/** @type {string} */ value) => {
+        this.#exportProfile = value;
+        this.#saveAndLoadHandler.updateSettings("export_profile", value);
+      },
+    );
+    this.#otherSettingsEntry.appendChild(select);
+  }
+
+  /**
+   * Method to create a select
+   * @param {string} label - The label for the select
+   * @param {{label: string, value: string}[]} options - The options to choose from
+   * @param {string} selected - The value of the selected option
+   * @param {*} onChange - Callback function to handle changes of the selected option
+   * @returns {HTMLDivElement} Wrapper for the select
+   */
+  #createSelect(label, options, selected, onChange) {
+    //Wrapper for the select
+    const wrapper = document.createElement("div");
+    wrapper.classList.add("mb-2");
+
+    //create the select
+    const select = document.createElement("select");
+    select.classList.add("form-select", "form-select-sm");
+    select.id = label.replaceAll(" ", "") + "Select";
+    options.forEach(({ label, value }) => {
+      const option = document.createElement("option");
+      option.value = value;
+      option.textContent = label;
+      option.selected = value === selected;
+      select.appendChild(option);
+    });
+
+    //label for the select
+    const selectLabel = document.createElement("label");
+    selectLabel.classList.add("form-label");
+    selectLabel.textContent = label;
+    selectLabel.setAttribute("for", select.id);
+
+    //Event listener for changes of the selected option
+    select.addEventListener("change", () => {
+      onChange(select.value);
+    });
+
+    wrapper.appendChild(selectLabel);
+    wrapper.appendChild(select);
+    return wrapper;
+  }
+
   /**
    * Method to create a checkbox
    * @param {string} label - The label for the checkbox